@@ -0,0 +1,404 @@
+import asyncio
+import itertools
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar, Union
+
+import aiohttp
+
+from .consts import *
+from .endpointselector import EndpointSelector
+from .exceptions import raise_integrated_exception, RpcOutOfStatusCode
+from .ratelimiter import build_rate_limiter
+from .retrypolicy import RetryPolicy, parse_retry_after
+from .rpchandler import build_request_body, extract_result
+from .singleflight import AsyncSingleFlight, COALESCED_METHODS, request_key
+from .utils import merge_dict, hex_height_or_latest, build_log_filter, RpcConfig
+from ..ethtype.amount import EthAmount
+from ..ethtype.block import EthBlock
+from ..ethtype.exceptions import *
+from ..ethtype.hexbytes import EthAddress, EthHashBytes, EthHexBytes
+from ..ethtype.receipt import EthReceipt, EthLog
+from ..ethtype.transaction import EthTransaction
+from ..ethtype.utils import keccak_hash
+from ...logger import global_logger
+from ...prometheus_metric import PrometheusExporter
+
+T = TypeVar("T")
+
+
+class AsyncEthRpcClient:
+    """ Asyncio client class for Ethereum JSON RPC.
+
+    It mirrors the public eth_* methods of EthRpcClient as coroutines. Every call of a client shares
+    one pooled aiohttp session, so a single event loop keeps many requests in flight without a thread per request.
+    The session is bound to the running event loop: open it with "await client.connect()" or "async with client".
+    """
+
+    def __init__(
+        self,
+        url_with_access_key: Union[str, List[str]],
+        chain_name: str = DEFAULT_CHAIN_NAME,
+        block_period_sec: int = DEFAULT_BLOCK_PERIOD_SECS,
+        block_aging_period: int = DEFAULT_BLOCK_AGING_BLOCKS,
+        rpc_config: dict = None
+    ):
+        self.__chain_name: str = chain_name
+        self.__block_period_sec = DEFAULT_BLOCK_PERIOD_SECS if block_period_sec is None else block_period_sec
+        self.__block_aging_period = DEFAULT_BLOCK_AGING_BLOCKS if block_aging_period is None else block_aging_period
+        self.__rpc_config = RpcConfig() if rpc_config is None else RpcConfig.from_dict(rpc_config)
+        self.__selector = EndpointSelector(
+            url_with_access_key,
+            self.__rpc_config.endpoint_failure_cooldown_sec,
+            self.__rpc_config.endpoint_max_lag_blocks
+        )
+
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__request_ids = itertools.count(1)
+        self.__single_flight = AsyncSingleFlight() if self.__rpc_config.coalesce_requests else None
+        self.__rate_limiter = build_rate_limiter(self.__rpc_config)
+        self.__retry_policy = RetryPolicy(
+            self.__rpc_config.retry_max_attempts,
+            self.__rpc_config.retry_base_delay_sec,
+            self.__rpc_config.retry_max_delay_sec,
+            self.__rpc_config.retry_deadline_sec
+        )
+        self.__chain_id: Optional[int] = self.__rpc_config.chain_id
+
+        # for debug and monitoring
+        self.call_num = 0
+
+    @classmethod
+    def from_config_dict(cls, config: dict, private_config: dict = None):
+        chain_config = merge_dict(config, private_config)
+        chain_name = chain_config.get("chain_name")
+        if chain_name is None or chain_name == "":
+            raise Exception("Chain name is required")
+
+        return cls(
+            chain_config["url_with_access_key"],
+            chain_name,
+            chain_config.get("block_period_sec"),
+            chain_config.get("block_aging_period"),
+            chain_config.get("rpc_config")
+        )
+
+    async def connect(self) -> "AsyncEthRpcClient":
+        """ open the pooled session and check the connection by fetching chain id. """
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.__rpc_config.pool_size,
+                force_close=not self.__rpc_config.keep_alive
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.__rpc_config.connect_timeout_sec,
+                sock_read=self.__rpc_config.read_timeout_sec
+            )
+            self.__session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, headers={"Content-type": "application/json"}
+            )
+
+        if self.__chain_id is None and self.__selector.endpoints:
+            resp = await self.send_request("eth_chainId", [])
+            self.__chain_id = int(resp, 16)
+        return self
+
+    async def close(self):
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def __aenter__(self) -> "AsyncEthRpcClient":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def url(self) -> str:
+        """ url of the endpoint currently preferred for rpc calls. """
+        primary = self.__selector.primary()
+        return "" if primary is None else primary.url
+
+    @property
+    def endpoint_selector(self) -> EndpointSelector:
+        return self.__selector
+
+    @property
+    def block_aging_period(self) -> int:
+        return self.__block_aging_period
+
+    @property
+    def chain_name(self) -> str:
+        """ return chain index specified from the configuration. """
+        return self.__chain_name
+
+    @property
+    def chain_id(self) -> Optional[int]:
+        """ return chain id emitted by the rpc node (available after connect). """
+        return self.__chain_id
+
+    @property
+    def rpc_config(self) -> RpcConfig:
+        return self.__rpc_config
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.__retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, policy: RetryPolicy):
+        self.__retry_policy = policy
+
+    async def _post_to(self, url: str, body: Union[dict, list]) -> Union[dict, list]:
+        if self.__rate_limiter is not None:
+            wait_sec = self.__rate_limiter.reserve(url, body)
+            if wait_sec > 0:
+                await asyncio.sleep(wait_sec)
+            PrometheusExporter.exporting_rpc_rate_limiter(self.chain_name, self.__rate_limiter)
+
+        PrometheusExporter.exporting_rpc_requested(chain_name=self.chain_name)
+        self.call_num += 1
+
+        async with self.__session.post(url, json=body) as response:
+            code = response.status
+            if code < 200 or 400 < code:
+                content = await response.read()
+                raise RpcOutOfStatusCode(
+                    self.chain_name,
+                    "code({}), msg({})".format(code, content),
+                    code,
+                    parse_retry_after(response.headers.get("Retry-After"))
+                )
+            return await response.json(content_type=None)
+
+    async def _post(self, body: Union[dict, list], min_height: int = None) -> Union[dict, list]:
+        """ post the body to the best endpoint, failing over to the next candidate on a transport error. """
+        if self.__session is None:
+            raise Exception("Not connected: await connect() before sending requests")
+
+        last_error = None
+        for endpoint in self.__selector.candidates(min_height):
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            try:
+                response_json = await self._post_to(endpoint.url, body)
+            except (RpcOutOfStatusCode, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                self.__selector.record_failure(endpoint)
+                PrometheusExporter.exporting_rpc_failed(chain_name=self.chain_name)
+                last_error = e
+                continue
+
+            self.__selector.record_success(endpoint, loop.time() - started)
+            if isinstance(body, dict) and body["method"] == "eth_blockNumber" and "result" in response_json:
+                endpoint.record_head(int(response_json["result"], 16))
+            return response_json
+
+        if last_error is None:
+            raise Exception("No rpc endpoint on {}".format(self.chain_name))
+        raise last_error
+
+    async def _call_with_retry(self, call: Callable[[], Awaitable[T]]) -> T:
+        """ coroutine variant of EthRpcClient._call_with_retry """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        attempt = 0
+        while True:
+            try:
+                return await call()
+            except Exception as e:
+                delay = self.__retry_policy.next_delay(e, attempt, loop.time() - started)
+                if delay is None:
+                    if isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError, ValueError)):
+                        raise_integrated_exception(self.chain_name, e)
+                    raise e
+
+                retry_notify_msg = "attempt({}) failed, re-sent after {:.2f} secs: {}".format(attempt + 1, delay, e)
+                global_logger.formatted_log("RPCRetry", related_chain_name=self.__chain_name, msg=retry_notify_msg)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def send_request(
+        self, method: str, params: list, min_height: int = None
+    ) -> Optional[Union[dict, str, list]]:
+        """ "min_height" restricts the call to endpoints known to have reached that height. """
+        if self.__single_flight is None or method not in COALESCED_METHODS:
+            return await self._send_request(method, params, min_height)
+        return await self.__single_flight.do(
+            request_key(method, params), lambda: self._send_request(method, params, min_height)
+        )
+
+    async def _send_request(
+        self, method: str, params: list, min_height: Optional[int]
+    ) -> Optional[Union[dict, str, list]]:
+        body = build_request_body(method, params, next(self.__request_ids))
+
+        async def post_and_extract():
+            return extract_result(self.chain_name, await self._post(body, min_height))
+
+        return await self._call_with_retry(post_and_extract)
+
+    async def send_batch_request(
+        self, calls: List[Tuple[str, list]]
+    ) -> List[Union[dict, str, list, None, Exception]]:
+        """ coroutine variant of EthRpcClient.send_batch_request """
+        results = list()
+        max_batch_size = self.__rpc_config.max_batch_size
+        for offset in range(0, len(calls), max_batch_size):
+            chunk = calls[offset:offset + max_batch_size]
+            bodies = [build_request_body(method, params, next(self.__request_ids)) for method, params in chunk]
+            response_json = await self._call_with_retry(lambda: self._post(bodies))
+            if not isinstance(response_json, list):
+                extract_result(self.chain_name, response_json)
+                raise Exception("Not handled batch response on {}: {}".format(self.chain_name, response_json))
+
+            responses_by_id = {item.get("id"): item for item in response_json}
+            for body in bodies:
+                item = responses_by_id.get(body["id"])
+                try:
+                    if item is None:
+                        raise_integrated_exception(self.chain_name, is_none_result=True)
+                    results.append(extract_result(self.chain_name, item))
+                except Exception as e:
+                    results.append(e)
+        return results
+
+    async def amend_height_to_matured_height(self, height: Union[int, str]) -> str:
+        matured_max_height = await self.eth_get_latest_block_number(matured_only=True)
+        if height == "latest":
+            return hex(matured_max_height)
+        elif isinstance(height, int):
+            return hex(min(height, matured_max_height))
+        elif isinstance(height, str):
+            return hex(min(int(height, 16), matured_max_height))
+        else:
+            raise Exception("Invalid type of height: {}".format(height))
+
+    async def eth_get_latest_block_number(self, matured_only: bool = False) -> int:
+        """ returns the latest block height. """
+        resp = await self.send_request("eth_blockNumber", [])
+        latest_height = int(resp, 16)
+        return latest_height if not matured_only else latest_height - self.__block_aging_period
+
+    async def _get_block(self, method: str, params: list, matured_only: bool = False) -> Optional[EthBlock]:
+        resp = await self.send_request(method, params)
+        if resp is None:
+            return resp
+
+        block = EthBlock.from_dict(resp)
+        if matured_only and block.number >= await self.eth_get_latest_block_number(matured_only=True):
+            return None
+        return block
+
+    async def eth_get_latest_block(self, verbose: bool = False, matured_only: bool = False) -> EthBlock:
+        latest_height = await self.eth_get_latest_block_number(matured_only)
+        return await self._get_block("eth_getBlockByNumber", [hex(latest_height), verbose])
+
+    async def eth_get_block_by_hash(
+        self, block_hash: EthHashBytes, verbose: bool = False, matured_only: bool = False
+    ) -> Optional[EthBlock]:
+        if not isinstance(block_hash, EthHashBytes):
+            raise EthTypeError(EthHashBytes, type(block_hash))
+        return await self._get_block("eth_getBlockByHash", [block_hash.hex(), verbose], matured_only)
+
+    async def eth_get_block_by_height(
+        self, height: Union[int, str] = "latest", verbose: bool = False, matured_only: bool = False
+    ) -> Optional[EthBlock]:
+        height_hex_or_latest = hex_height_or_latest(height)
+        return await self._get_block("eth_getBlockByNumber", [height_hex_or_latest, verbose], matured_only)
+
+    async def eth_get_transaction_by_hash(
+        self, tx_hash: EthHashBytes, matured_only: bool = False
+    ) -> Optional[EthTransaction]:
+        if not isinstance(tx_hash, EthHashBytes):
+            raise EthTypeError(EthHashBytes, type(tx_hash))
+        resp = await self.send_request("eth_getTransactionByHash", [tx_hash.hex()])
+        if resp is None:
+            return None
+
+        fetched_tx: EthTransaction = EthTransaction.from_dict(resp)
+        if matured_only and fetched_tx.block_number >= await self.eth_get_latest_block_number(matured_only=True):
+            return None
+        return fetched_tx
+
+    async def eth_receipt_without_wait(self, tx_hash: EthHashBytes, matured_only: bool = False) -> Optional[EthReceipt]:
+        resp = await self.send_request("eth_getTransactionReceipt", [tx_hash.hex()])
+        if resp is None:
+            return None
+
+        fetched_receipt: EthReceipt = EthReceipt.from_dict(resp)
+        if matured_only and fetched_receipt.block_number >= await self.eth_get_latest_block_number(matured_only=True):
+            return None
+        return fetched_receipt
+
+    async def eth_receipt_with_wait(self, tx_hash: EthHashBytes, poll_interval_sec: float = 1.0) -> Optional[EthReceipt]:
+        """ poll the receipt until it appears or one block period elapses. """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.__block_period_sec
+        while True:
+            receipt = await self.eth_receipt_without_wait(tx_hash)
+            if receipt is not None or loop.time() >= deadline:
+                return receipt
+            await asyncio.sleep(min(poll_interval_sec, max(deadline - loop.time(), 0)))
+
+    async def eth_get_logs(
+        self,
+        from_block: int, to_block: int,
+        addresses: List[EthAddress],
+        topics: List[Union[EthHashBytes, List[EthHashBytes]]]
+    ) -> List[EthLog]:
+        """ find logs of the event (which have topics) from multiple contracts """
+        if from_block > to_block:
+            raise Exception("from_block should be less than to_block")
+
+        matured_max_height = await self.eth_get_latest_block_number(matured_only=True)
+        amended_block_nums = [hex(min(height, matured_max_height)) for height in [from_block, to_block]]
+
+        params: list = [build_log_filter(addresses, topics, amended_block_nums[0], amended_block_nums[1])]
+        resp = await self.send_request("eth_getLogs", params, min_height=int(amended_block_nums[1], 16))
+        try:
+            return [EthLog.from_dict(log) for log in resp]
+        except KeyError:
+            raise RpcExceedRequestTime("Node: getLog time out")
+
+    # **************************************** fee data ************************************************
+    async def eth_get_priority_fee_per_gas(self) -> int:
+        resp = await self.send_request("eth_maxPriorityFeePerGas", [])
+        return int(resp, 16)
+
+    async def eth_get_gas_price(self) -> int:
+        resp = await self.send_request("eth_gasPrice", [])
+        return int(resp, 16)
+
+    # **************************************** basic method ************************************************
+    async def eth_call(self, call_tx: dict) -> EthHexBytes:
+        resp = await self.send_request("eth_call", [call_tx, "latest"])
+        return EthHexBytes(resp)
+
+    async def eth_estimate_gas(self, tx: dict) -> int:
+        resp = await self.send_request("eth_estimateGas", [tx, "latest"])
+        return int(resp, 16)
+
+    async def eth_get_balance(
+        self, address: EthAddress, height: Union[int, str] = "latest", matured_only: bool = False
+    ) -> EthAmount:
+        """ queries matured balance of the user. """
+        if not isinstance(address, EthAddress):
+            raise Exception("address type must be \"EthAddress\" type")
+        if matured_only:
+            height = await self.amend_height_to_matured_height(height)
+        else:
+            height = hex_height_or_latest(height)
+
+        resp = await self.send_request("eth_getBalance", [address.hex(), height])
+        return EthAmount(resp)
+
+    async def eth_get_user_nonce(self, address: EthAddress, height: Union[int, str] = "latest") -> int:
+        height_hex_or_latest = hex_height_or_latest(height)
+        if not isinstance(address, EthAddress):
+            raise Exception("address type must be \"EthAddress\" type")
+        resp = await self.send_request("eth_getTransactionCount", [address.hex(), height_hex_or_latest])
+        return int(resp, 16)
+
+    async def eth_send_raw_transaction(self, signed_serialized_tx: EthHexBytes) -> EthHashBytes:
+        """ return the hash of the transaction computed locally, not the one reported by the node """
+        await self.send_request("eth_sendRawTransaction", [signed_serialized_tx.hex()])
+        return keccak_hash(signed_serialized_tx)
@@ -111,6 +111,10 @@ class ConfigSanityChecker:
         self.check_valid_type(multichain_period_expr, int, key_required=True, value_default_allow=False)
         self.delete_key_safe(multichain_period_expr)
 
+        pipelined_send_expr = parse("multichain_config.pipelined_send")
+        self.check_valid_type(pipelined_send_expr, bool, key_required=False, value_default_allow=True)
+        self.delete_key_safe(pipelined_send_expr)
+
         self.raise_exception_if_not_empty(multichain_expr)
 
     def check_entity_config(self):
@@ -154,7 +158,7 @@ class ConfigSanityChecker:
         self.delete_key_safe(block_period_sec_expr)
 
         endpoint_expr = parse("{}.url_with_access_key".format(chain_name))
-        self.check_valid_type(endpoint_expr, str, key_required=True, value_default_allow=False)
+        self.check_valid_type(endpoint_expr, (str, list), key_required=True, value_default_allow=False)
         self.delete_key_safe(endpoint_expr)
 
         latest_height_expr = parse("{}.bootstrap_latest_height".format(chain_name))
@@ -181,6 +185,14 @@ class ConfigSanityChecker:
         self.check_valid_type(server_down_time_expr, int, key_required=False, value_default_allow=False)
         self.delete_key_safe(server_down_time_expr)
 
+        signer_secrets_expr = parse("{}.signer_secret_hexes".format(chain_name))
+        self.check_valid_type(signer_secrets_expr, list, key_required=False, value_default_allow=True)
+        self.delete_key_safe(signer_secrets_expr)
+
+        signer_min_balance_expr = parse("{}.signer_min_balance".format(chain_name))
+        self.check_valid_type(signer_min_balance_expr, int, key_required=False, value_default_allow=True)
+        self.delete_key_safe(signer_min_balance_expr)
+
         fee_config_expr = parse("{}.fee_config".format(chain_name))
         self.check_valid_type(fee_config_expr, dict, key_required=False, value_default_allow=False)
         fee_config = self.config[chain_name].get("fee_config")
@@ -206,8 +218,156 @@ class ConfigSanityChecker:
             self.check_valid_type(type2_max_priority_price_expr, int, key_required=key_required, value_default_allow=False)
             self.delete_key_safe(type2_max_priority_price_expr)
 
+            fee_oracle_expr = parse("{}.fee_config.fee_oracle".format(chain_name))
+            self.check_valid_type(fee_oracle_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(fee_oracle_expr)
+
+            fee_history_blocks_expr = parse("{}.fee_config.fee_history_blocks".format(chain_name))
+            self.check_valid_type(fee_history_blocks_expr, int, key_required=False, value_default_allow=False)
+            self.delete_key_safe(fee_history_blocks_expr)
+
+            fee_reward_percentile_expr = parse("{}.fee_config.fee_reward_percentile".format(chain_name))
+            self.check_valid_type(fee_reward_percentile_expr, (int, float), key_required=False, value_default_allow=False)
+            self.delete_key_safe(fee_reward_percentile_expr)
+
+            fee_update_rates_expr = parse("{}.fee_config.fee_update_rates".format(chain_name))
+            self.check_valid_type(fee_update_rates_expr, list, key_required=False, value_default_allow=False)
+            self.delete_key_safe(fee_update_rates_expr)
+
+            fee_update_interval_expr = parse("{}.fee_config.fee_update_interval_sec".format(chain_name))
+            self.check_valid_type(fee_update_interval_expr, (int, float), key_required=False, value_default_allow=False)
+            self.delete_key_safe(fee_update_interval_expr)
+
             self.raise_exception_if_not_empty(fee_config_expr)
 
+        rpc_config_expr = parse("{}.rpc_config".format(chain_name))
+        self.check_valid_type(rpc_config_expr, dict, key_required=False, value_default_allow=True)
+        if self.config[chain_name].get("rpc_config"):
+            pool_size_expr = parse("{}.rpc_config.pool_size".format(chain_name))
+            self.check_valid_type(pool_size_expr, int, key_required=False, value_default_allow=False)
+            self.delete_key_safe(pool_size_expr)
+
+            keep_alive_expr = parse("{}.rpc_config.keep_alive".format(chain_name))
+            self.check_valid_type(keep_alive_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(keep_alive_expr)
+
+            connect_timeout_expr = parse("{}.rpc_config.connect_timeout_sec".format(chain_name))
+            self.check_valid_type(connect_timeout_expr, (int, float), key_required=False, value_default_allow=False)
+            self.delete_key_safe(connect_timeout_expr)
+
+            read_timeout_expr = parse("{}.rpc_config.read_timeout_sec".format(chain_name))
+            self.check_valid_type(read_timeout_expr, (int, float), key_required=False, value_default_allow=False)
+            self.delete_key_safe(read_timeout_expr)
+
+            max_batch_size_expr = parse("{}.rpc_config.max_batch_size".format(chain_name))
+            self.check_valid_type(max_batch_size_expr, int, key_required=False, value_default_allow=False)
+            self.delete_key_safe(max_batch_size_expr)
+
+            cooldown_expr = parse("{}.rpc_config.endpoint_failure_cooldown_sec".format(chain_name))
+            self.check_valid_type(cooldown_expr, (int, float), key_required=False, value_default_allow=True)
+            self.delete_key_safe(cooldown_expr)
+
+            max_lag_expr = parse("{}.rpc_config.endpoint_max_lag_blocks".format(chain_name))
+            self.check_valid_type(max_lag_expr, int, key_required=False, value_default_allow=True)
+            self.delete_key_safe(max_lag_expr)
+
+            hedged_methods_expr = parse("{}.rpc_config.hedged_methods".format(chain_name))
+            self.check_valid_type(hedged_methods_expr, list, key_required=False, value_default_allow=True)
+            self.delete_key_safe(hedged_methods_expr)
+
+            hedge_percentile_expr = parse("{}.rpc_config.hedge_percentile".format(chain_name))
+            self.check_valid_type(hedge_percentile_expr, float, key_required=False, value_default_allow=False)
+            self.delete_key_safe(hedge_percentile_expr)
+
+            head_tracker_expr = parse("{}.rpc_config.head_tracker".format(chain_name))
+            self.check_valid_type(head_tracker_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(head_tracker_expr)
+
+            head_staleness_expr = parse("{}.rpc_config.head_staleness_sec".format(chain_name))
+            self.check_valid_type(head_staleness_expr, (int, float), key_required=False, value_default_allow=True)
+            self.delete_key_safe(head_staleness_expr)
+
+            cache_expr = parse("{}.rpc_config.cache".format(chain_name))
+            self.check_valid_type(cache_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(cache_expr)
+
+            cache_max_entries_expr = parse("{}.rpc_config.cache_max_entries".format(chain_name))
+            self.check_valid_type(cache_max_entries_expr, int, key_required=False, value_default_allow=True)
+            self.delete_key_safe(cache_max_entries_expr)
+
+            cache_ttl_expr = parse("{}.rpc_config.cache_ttl_sec".format(chain_name))
+            self.check_valid_type(cache_ttl_expr, (int, float), key_required=False, value_default_allow=True)
+            self.delete_key_safe(cache_ttl_expr)
+
+            cache_path_expr = parse("{}.rpc_config.cache_path".format(chain_name))
+            self.check_valid_type(cache_path_expr, str, key_required=False, value_default_allow=True)
+            self.delete_key_safe(cache_path_expr)
+
+            coalesce_expr = parse("{}.rpc_config.coalesce_requests".format(chain_name))
+            self.check_valid_type(coalesce_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(coalesce_expr)
+
+            retry_max_attempts_expr = parse("{}.rpc_config.retry_max_attempts".format(chain_name))
+            self.check_valid_type(retry_max_attempts_expr, int, key_required=False, value_default_allow=True)
+            self.delete_key_safe(retry_max_attempts_expr)
+
+            for retry_sec_key in ["retry_base_delay_sec", "retry_max_delay_sec", "retry_deadline_sec"]:
+                retry_sec_expr = parse("{}.rpc_config.{}".format(chain_name, retry_sec_key))
+                self.check_valid_type(retry_sec_expr, (int, float), key_required=False, value_default_allow=True)
+                self.delete_key_safe(retry_sec_expr)
+
+            for rate_limit_key in ["rate_limit_per_sec", "rate_limit_burst"]:
+                rate_limit_expr = parse("{}.rpc_config.{}".format(chain_name, rate_limit_key))
+                self.check_valid_type(rate_limit_expr, (int, float), key_required=False, value_default_allow=True)
+                self.delete_key_safe(rate_limit_expr)
+
+            method_weights_expr = parse("{}.rpc_config.method_weights".format(chain_name))
+            self.check_valid_type(method_weights_expr, dict, key_required=False, value_default_allow=True)
+            self.delete_key_safe(method_weights_expr)
+
+            lazy_connect_expr = parse("{}.rpc_config.lazy_connect".format(chain_name))
+            self.check_valid_type(lazy_connect_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(lazy_connect_expr)
+
+            chain_id_expr = parse("{}.rpc_config.chain_id".format(chain_name))
+            self.check_valid_type(chain_id_expr, int, key_required=False, value_default_allow=True)
+            self.delete_key_safe(chain_id_expr)
+
+            ws_url_expr = parse("{}.rpc_config.ws_url".format(chain_name))
+            self.check_valid_type(ws_url_expr, str, key_required=False, value_default_allow=True)
+            self.delete_key_safe(ws_url_expr)
+
+            log_filter_expr = parse("{}.rpc_config.log_filter".format(chain_name))
+            self.check_valid_type(log_filter_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(log_filter_expr)
+
+            multicall_address_expr = parse("{}.rpc_config.multicall_address".format(chain_name))
+            self.check_valid_type(multicall_address_expr, str, key_required=False, value_default_allow=True)
+            self.delete_key_safe(multicall_address_expr)
+
+            gas_cache_expr = parse("{}.rpc_config.gas_estimate_cache".format(chain_name))
+            self.check_valid_type(gas_cache_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(gas_cache_expr)
+
+            gas_cache_ttl_expr = parse("{}.rpc_config.gas_estimate_cache_ttl_sec".format(chain_name))
+            self.check_valid_type(gas_cache_ttl_expr, (int, float), key_required=False, value_default_allow=False)
+            self.delete_key_safe(gas_cache_ttl_expr)
+
+            gas_length_bucket_expr = parse("{}.rpc_config.gas_estimate_length_bucket".format(chain_name))
+            self.check_valid_type(gas_length_bucket_expr, int, key_required=False, value_default_allow=True)
+            self.delete_key_safe(gas_length_bucket_expr)
+
+            access_list_expr = parse("{}.rpc_config.access_list".format(chain_name))
+            self.check_valid_type(access_list_expr, bool, key_required=False, value_default_allow=True)
+            self.delete_key_safe(access_list_expr)
+
+            access_list_ttl_expr = parse("{}.rpc_config.access_list_ttl_sec".format(chain_name))
+            self.check_valid_type(access_list_ttl_expr, (int, float), key_required=False, value_default_allow=False)
+            self.delete_key_safe(access_list_ttl_expr)
+
+            self.raise_exception_if_not_empty(rpc_config_expr)
+        self.delete_key_safe(rpc_config_expr)
+
         abi_dir_expr = parse("{}.abi_dir".format(chain_name))
         self.check_valid_type(abi_dir_expr, str, key_required=False, value_default_allow=True)
         self.delete_key_safe(abi_dir_expr)
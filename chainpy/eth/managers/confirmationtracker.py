@@ -0,0 +1,202 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .headtracker import HeadSnapshot
+from .rpchandler import EthRpcClient
+from ..ethtype.hexbytes import EthHashBytes
+from ..ethtype.receipt import EthReceipt
+from ...logger import global_logger
+
+
+class ConfirmationTracker:
+    """ Detects the inclusion of the pending transactions of a chain by scanning each new block once.
+
+    On every new head, the blocks since the last scanned one are read (without transaction bodies) in a single
+    batch request, and their transaction hashes are matched against the set of watched hashes. Receipts are
+    fetched only for the matches, and the confirmations of a transaction are counted from its block height.
+    A block whose parent hash differs from the scanned one rewinds the scan, so reorged inclusions are dropped.
+    A hash left unmatched for "tx_commit_time_sec" (e.g. mined before it was watched) has its receipt checked once.
+    """
+
+    def __init__(self, rpc_client: EthRpcClient):
+        self.__rpc_client = rpc_client
+        self.__lock = threading.Lock()
+        self.__watched_at: Dict[str, float] = dict()  # hex hash of every watched transaction
+        self.__included: Dict[str, int] = dict()  # hex hash -> height of its block
+        self.__receipts: Dict[str, EthReceipt] = dict()
+        self.__checked: set = set()  # stale hashes whose receipt has been checked
+
+        self.__scanned_height: Optional[int] = None
+        self.__block_hashes: Dict[int, str] = dict()  # of the recently scanned heights, to detect reorgs
+
+        self.__new_head = threading.Event()
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def scanned_height(self) -> Optional[int]:
+        return self.__scanned_height
+
+    @property
+    def pending_hashes(self) -> List[EthHashBytes]:
+        with self.__lock:
+            return [EthHashBytes(tx_hash) for tx_hash in self.__watched_at if tx_hash not in self.__included]
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def watch(self, tx_hash: EthHashBytes):
+        with self.__lock:
+            if tx_hash.hex() not in self.__watched_at:
+                self.__watched_at[tx_hash.hex()] = time.monotonic()
+
+    def unwatch(self, tx_hash: EthHashBytes):
+        key = tx_hash.hex()
+        with self.__lock:
+            self.__watched_at.pop(key, None)
+            self.__included.pop(key, None)
+            self.__receipts.pop(key, None)
+            self.__checked.discard(key)
+
+    def watched_sec(self, tx_hash: EthHashBytes) -> Optional[float]:
+        """ seconds since the hash has been watched, or None if it is not watched """
+        with self.__lock:
+            watched_at = self.__watched_at.get(tx_hash.hex())
+        return None if watched_at is None else time.monotonic() - watched_at
+
+    def is_included(self, tx_hash: EthHashBytes) -> bool:
+        """ whether the transaction has been found in a scanned block, however deep """
+        with self.__lock:
+            return tx_hash.hex() in self.__included
+
+    def confirmations(self, tx_hash: EthHashBytes) -> int:
+        """ the number of blocks on top of (and including) the block of the transaction; 0 while pending """
+        with self.__lock:
+            height = self.__included.get(tx_hash.hex())
+            scanned_height = self.__scanned_height
+        return 0 if height is None or scanned_height is None else scanned_height - height + 1
+
+    def pop_receipt(self, tx_hash: EthHashBytes, min_confirmations: int = 1) -> Optional[EthReceipt]:
+        """ return the receipt and stop watching the hash, or None until it has "min_confirmations" """
+        if self.confirmations(tx_hash) < min_confirmations:
+            return None
+        key = tx_hash.hex()
+        with self.__lock:
+            receipt = self.__receipts.get(key)
+            if receipt is not None:
+                self.__watched_at.pop(key, None)
+                self.__included.pop(key, None)
+                self.__receipts.pop(key, None)
+        return receipt
+
+    def _rewind(self, height: int):
+        """ forget every scanned block from "height" on """
+        for reorged_height in [h for h in self.__block_hashes if h >= height]:
+            del self.__block_hashes[reorged_height]
+        for tx_hash in [tx_hash for tx_hash, h in self.__included.items() if h >= height]:
+            del self.__included[tx_hash]
+            self.__receipts.pop(tx_hash, None)
+        self.__scanned_height = height - 1
+
+    def _scan(self, latest_height: int):
+        """ scan the blocks up to "latest_height" (at most max_batch_size of them) for the watched hashes """
+        if self.__scanned_height is None:
+            self.__scanned_height = latest_height - 1
+        max_batch_size = self.__rpc_client.rpc_config.max_batch_size
+        heights = list(range(self.__scanned_height + 1, min(latest_height, self.__scanned_height + max_batch_size) + 1))
+        if not heights:
+            return
+
+        blocks = self.__rpc_client.send_batch_request(
+            [("eth_getBlockByNumber", [hex(height), False]) for height in heights]
+        )
+        with self.__lock:
+            for height, block in zip(heights, blocks):
+                if isinstance(block, Exception) or block is None:
+                    # not served yet; scanned again on the next head
+                    break
+                parent_hash = self.__block_hashes.get(height - 1)
+                if parent_hash is not None and parent_hash != block["parentHash"].lower():
+                    self._rewind(height - 1)
+                    break
+
+                for tx_hash in block["transactions"]:
+                    tx_hash = tx_hash.lower()
+                    if tx_hash in self.__watched_at and tx_hash not in self.__included:
+                        self.__included[tx_hash] = height
+                self.__block_hashes[height] = block["hash"].lower()
+                self.__block_hashes.pop(height - self.__rpc_client.block_aging_period - 1, None)
+                self.__scanned_height = height
+
+    def _stale_hashes(self) -> List[str]:
+        stale_sec = self.__rpc_client.tx_commit_time_sec
+        now = time.monotonic()
+        with self.__lock:
+            stale = [
+                tx_hash for tx_hash, watched_at in self.__watched_at.items()
+                if tx_hash not in self.__included and tx_hash not in self.__checked and now - watched_at > stale_sec
+            ]
+            self.__checked.update(stale)
+        return stale
+
+    def poll(self):
+        """ scan the new blocks, and fetch the receipts of the watched transactions found in them """
+        latest_height = self.__rpc_client.eth_get_latest_block_number()
+        with self.__lock:
+            watching = bool(self.__watched_at)
+        if not watching:
+            # nothing to match; start from the head once a hash is watched
+            self.__scanned_height = latest_height
+            self.__block_hashes.clear()
+            return
+
+        self._scan(latest_height)
+        with self.__lock:
+            # the receipt of a match may not be served yet; it is fetched again on the next poll
+            tx_hashes = [tx_hash for tx_hash in self.__included if tx_hash not in self.__receipts]
+        tx_hashes += self._stale_hashes()
+        if not tx_hashes:
+            return
+
+        results = self.__rpc_client.eth_receipt_without_wait_batch([EthHashBytes(tx_hash) for tx_hash in tx_hashes])
+        with self.__lock:
+            for tx_hash, result in zip(tx_hashes, results):
+                if isinstance(result, Exception):
+                    global_logger.formatted_log(
+                        "ConfirmationTracker", related_chain_name=self.__rpc_client.chain_name, msg=str(result)
+                    )
+                    self.__checked.discard(tx_hash)
+                elif result is not None and tx_hash in self.__watched_at:
+                    self.__included.setdefault(tx_hash, result.block_number)
+                    self.__receipts[tx_hash] = result
+
+    def _on_new_head(self, snapshot: HeadSnapshot):
+        self.__new_head.set()
+
+    def start(self):
+        if self.is_running:
+            return
+        self.__stop_event.clear()
+        self.__rpc_client.head_tracker.add_listener(self._on_new_head)
+        self.__thread = threading.Thread(
+            target=self._run, name="confirmation-tracker-{}".format(self.__rpc_client.chain_name), daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        self.__rpc_client.head_tracker.remove_listener(self._on_new_head)
+        self.__stop_event.set()
+        self.__new_head.set()
+
+    def _run(self):
+        while not self.__stop_event.is_set():
+            self.__new_head.wait(self.__rpc_client.block_period_sec)
+            self.__new_head.clear()
+            try:
+                self.poll()
+            except Exception as e:
+                global_logger.formatted_log(
+                    "ConfirmationTracker", related_chain_name=self.__rpc_client.chain_name, msg=str(e)
+                )
@@ -7,3 +7,33 @@ DEFAULT_RPC_RESEND_DELAY_SEC: int = 180
 DEFAULT_RPC_TX_BLOCK_DELAY: int = 3
 
 DEFAULT_CHAIN_NAME: str = "NONE_CHAIN"
+
+DEFAULT_RPC_POOL_SIZE: int = 10
+DEFAULT_RPC_CONNECT_TIMEOUT_SEC: float = 5.0
+DEFAULT_RPC_READ_TIMEOUT_SEC: float = 60.0
+DEFAULT_RPC_MAX_BATCH_SIZE: int = 100
+DEFAULT_ENDPOINT_EWMA_ALPHA: float = 0.3
+DEFAULT_ENDPOINT_FAILURE_COOLDOWN_SEC: float = 30.0
+DEFAULT_ENDPOINT_MAX_LAG_BLOCKS: int = 3
+HEDGE_LATENCY_WINDOW: int = 200
+HEDGE_MIN_LATENCY_SAMPLES: int = 20
+DEFAULT_HEDGE_PERCENTILE: float = 0.95
+DEFAULT_RPC_CACHE_MAX_ENTRIES: int = 10000
+DEFAULT_RPC_CACHE_TTL_SEC: float = 3600.0
+DEFAULT_RETRY_MAX_ATTEMPTS: int = 5
+DEFAULT_RETRY_BASE_DELAY_SEC: float = 0.25
+DEFAULT_RETRY_MAX_DELAY_SEC: float = 8.0
+DEFAULT_RETRY_DEADLINE_SEC: float = 30.0
+RECEIPT_POLL_INTERVAL_SEC: float = 1.0
+REPLACEMENT_FEE_BUMP_RATE: float = 1.125
+TRANSFER_GAS: int = 21000
+WS_HEARTBEAT_SEC: float = 30.0
+WS_RECONNECT_DELAY_SEC: float = 3.0
+MULTICALL3_ADDRESS: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+DEFAULT_MULTICALL_MAX_CALLS: int = 500
+DEFAULT_FEE_HISTORY_BLOCKS: int = 10
+DEFAULT_FEE_REWARD_PERCENTILE: float = 50.0
+DEFAULT_TX_SEQUENCER_BATCH_SIZE: int = 20
+DEFAULT_FEE_UPDATE_BLOCKS: int = 3
+DEFAULT_GAS_ESTIMATE_CACHE_TTL_SEC: float = 600.0
+DEFAULT_ACCESS_LIST_TTL_SEC: float = 600.0
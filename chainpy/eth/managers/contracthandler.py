@@ -1,9 +1,8 @@
 from typing import List, Optional, Dict, Any, Union
 
-from eth_keys.datatypes import PrivateKey
-from web3.middleware import construct_sign_and_send_raw_middleware
-
 from .eventobj import DetectedEvent
+from .exceptions import RpcFilterNotFound
+from .logbuffer import MaturedLogBuffer
 from .rpchandler import EthRpcClient, DEFAULT_RECEIPT_MAX_RETRY, DEFAULT_BLOCK_PERIOD_SECS, \
     DEFAULT_BLOCK_AGING_BLOCKS, DEFAULT_RPC_RESEND_DELAY_SEC, DEFAULT_RPC_TX_BLOCK_DELAY
 from .utils import merge_dict
@@ -11,6 +10,7 @@ from ..ethtype.contract import EthContract
 from ..ethtype.exceptions import RpcExceedRequestTime
 from ..ethtype.hexbytes import EthAddress, EthHashBytes
 from ..ethtype.receipt import EthLog
+from ...logger import global_logger
 
 DEFAULT_LATEST_HEIGHT = 0
 DEFAULT_MAX_LOG_NUM = 1000
@@ -25,11 +25,12 @@ class EthContractHandler(EthRpcClient):
     all kinds of registered events in the blockchain at once.
 
     Args:
-        url_with_access_key: RPC endpoint url
+        url_with_access_key: RPC endpoint url, or a list of urls of the same chain to balance and fail over
         contracts: a list of contract dictionaries (the structure can be found below)
         abi_dir: directory path containing abi files. it is required, if contract dictionary has "abi_file" field.
         events: a list of event dictionaries (the structure can be found below)
         max_log_num: maximum lookup range for the eth_getLog.
+        rpc_config: a dictionary of rpc transport options (the structure can be found below)
 
     Note:
         contract_dictionary {
@@ -44,12 +45,48 @@ class EthContractHandler(EthRpcClient):
             "event_name":  "<event_name_string>"
         }
 
+        rpc_config_dictionary {
+            "pool_size": <max_kept_alive_connections_int>,  # optional
+            "keep_alive": <bool>,  # optional
+            "connect_timeout_sec": <float>,  # optional
+            "read_timeout_sec": <float>,  # optional
+            "max_batch_size": <max_calls_per_json_rpc_batch_int>,  # optional
+            "endpoint_failure_cooldown_sec": <float>,  # optional
+            "endpoint_max_lag_blocks": <int>,  # optional
+            "hedged_methods": ["eth_blockNumber", ...],  # optional, needs two or more endpoints
+            "hedge_percentile": <float>,  # optional
+            "head_tracker": <bool>,  # optional, polls the head once per block period in background
+            "head_staleness_sec": <float>,  # optional, defaults to block_period_sec with head_tracker
+            "cache": <bool>,  # optional, caches blocks, txs, receipts and logs once they are immutable
+            "cache_max_entries": <int>,  # optional
+            "cache_ttl_sec": <float>,  # optional
+            "cache_path": "<sqlite_file_path_string>",  # optional, shares the cache between processes
+            "coalesce_requests": <bool>,  # optional, true by default
+            "retry_max_attempts": <int>,  # optional
+            "retry_base_delay_sec": <float>,  # optional, backoff is exponential with full jitter
+            "retry_max_delay_sec": <float>,  # optional
+            "retry_deadline_sec": <float>,  # optional, rpc_server_downtime_allow_sec with resend_on_fail
+            "rate_limit_per_sec": <float>,  # optional, token refill rate of each endpoint; no limit by default
+            "rate_limit_burst": <float>,  # optional, defaults to rate_limit_per_sec
+            "method_weights": {"eth_getLogs": <float>, ...},  # optional, tokens per call (default 1.0)
+            "lazy_connect": <bool>,  # optional, no rpc call until the chain is used
+            "chain_id": <int>,  # optional, pinned chain id; skips eth_chainId on startup
+            "ws_url": "<websocket_url_string>",  # optional, streams events via eth_subscribe instead of polling
+            "log_filter": <bool>,  # optional, polls the deltas of an installed log filter instead of log ranges
+            "multicall_address": "<address_hex_string_with_0x_prefix>",  # optional, Multicall3 by default
+            "gas_estimate_cache": <bool>,  # optional, reuses gas estimates per contract method (and calldata size)
+            "gas_estimate_cache_ttl_sec": <float>,  # optional
+            "gas_estimate_length_bucket": <int>,  # optional, calldata bytes per size bucket; no bucket by default
+            "access_list": <bool>,  # optional, attaches eth_createAccessList results that lower gas (type2 fee only)
+            "access_list_ttl_sec": <float>  # optional, lifetime of the access list of a contract method
+        }
+
         Information on the remaining parameters is found in the EthRpcClient.
     """
 
     def __init__(
         self,
-        url_with_access_key: str,
+        url_with_access_key: Union[str, List[str]],
         contracts: List[Dict[str, str | int]],
         chain_name: str,
         abi_dir: str = None,
@@ -60,7 +97,8 @@ class EthContractHandler(EthRpcClient):
         transaction_block_delay: int = DEFAULT_RPC_TX_BLOCK_DELAY,
         events: List[dict] = None,
         latest_height: int = DEFAULT_LATEST_HEIGHT,
-        max_log_num: int = DEFAULT_MAX_LOG_NUM
+        max_log_num: int = DEFAULT_MAX_LOG_NUM,
+        rpc_config: dict = None
     ):
         super().__init__(
             url_with_access_key,
@@ -69,7 +107,8 @@ class EthContractHandler(EthRpcClient):
             block_period_sec,
             block_aging_period,
             rpc_server_downtime_allow_sec,
-            transaction_block_delay
+            transaction_block_delay,
+            rpc_config
         )
 
         self._latest_height = DEFAULT_LATEST_HEIGHT if latest_height is None else latest_height
@@ -78,6 +117,10 @@ class EthContractHandler(EthRpcClient):
         self._contracts = dict()
         self._event_db: Dict[str, List[Dict[str, Any]]] = dict()
 
+        # server-side log filter of the registered events (see collect_unchecked_events_by_filter)
+        self._log_filter_id: Optional[str] = None
+        self._log_buffer = MaturedLogBuffer(self)
+
         for contract_dict in contracts:
             # determine abi_path of the contract
             abi_path = contract_dict.get("abi_path")
@@ -129,10 +172,12 @@ class EthContractHandler(EthRpcClient):
             block_period_sec=chain_config.get("block_period_sec"),
             block_aging_period=chain_config.get("block_aging_period"),
             rpc_server_downtime_allow_sec=chain_config.get("rpc_server_downtime_allow_sec"),
+            transaction_block_delay=chain_config.get("transaction_block_delay"),
 
             events=chain_config.get("events"),
             latest_height=chain_config.get("bootstrap_latest_height"),
-            max_log_num=chain_config.get("max_log_num")
+            max_log_num=chain_config.get("max_log_num"),
+            rpc_config=chain_config.get("rpc_config")
         )
 
     @property
@@ -148,9 +193,6 @@ class EthContractHandler(EthRpcClient):
         """ Maximum lookup range for the eth_getLog. """
         return self._max_log_num
 
-    def set_signer(self, private_key: PrivateKey):
-        self.w3.middleware_onion.add(construct_sign_and_send_raw_middleware(private_key_or_account=private_key))
-
     def get_contract_by_name(self, contract_name: str) -> Optional[EthContract]:
         return self._contracts.get(contract_name)
 
@@ -244,6 +286,10 @@ class EthContractHandler(EthRpcClient):
 
         return historical_logs
 
+    def detect_events(self, logs: List[EthLog]) -> List[DetectedEvent]:
+        """ Build detected events from logs of the registered contracts (e.g. pushed by a subscription). """
+        return self._check_fetched_event(logs, self.get_emitter_addresses())
+
     def collect_event_in_limited_range(self, event_name: str, from_block: int, to_block: int) -> List[DetectedEvent]:
         """ Collect one type of event emitted by all contracts registered in the config. """
         if to_block < from_block:
@@ -294,6 +340,9 @@ class EthContractHandler(EthRpcClient):
         """
         Collect all kinds of events (specified in config), from latest_height to current_height.
         """
+        if matured_only and self.rpc_config.log_filter:
+            return self.collect_unchecked_events_by_filter()
+
         current_height = self.eth_get_latest_block_number(matured_only=matured_only)
 
         if self.latest_height + 1 > current_height:
@@ -303,3 +352,26 @@ class EthContractHandler(EthRpcClient):
         self.latest_height = current_height
 
         return historical_events
+
+    def _install_log_filter(self):
+        """ (re)install the log filter; the blocks up to the current head are range-polled once matured """
+        self._log_filter_id = self.eth_new_filter(self.get_emitter_addresses(), self.get_every_topics())
+        self._log_buffer.start_from(self.head_tracker.refresh().latest)
+
+    def collect_unchecked_events_by_filter(self) -> List[DetectedEvent]:
+        """
+        Collect the matured events by polling the changes of a log filter installed on the node,
+        which are the logs of the new blocks only. An expired filter, or one whose endpoint stops answering,
+        is reinstalled (on another endpoint if need be) and its gap is backfilled.
+        """
+        if self._log_filter_id is None:
+            self._install_log_filter()
+        else:
+            try:
+                for log in self.eth_get_filter_changes(self._log_filter_id):
+                    self._log_buffer.add(log)
+            except RpcFilterNotFound as e:
+                global_logger.formatted_log("LogFilter", related_chain_name=self.chain_name, msg=str(e))
+                self._install_log_filter()
+
+        return self._log_buffer.release(self.eth_get_latest_block_number())
@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import List, Optional, Union
+
+from .consts import DEFAULT_ENDPOINT_EWMA_ALPHA
+
+# an endpoint answering with errors looks this much slower than its measured latency
+ERROR_RATE_PENALTY = 10.0
+
+
+class RpcEndpoint:
+    """ Health statistics of a single rpc endpoint: EWMA latency, EWMA error rate and the latest head height. """
+
+    def __init__(self, url: str, ewma_alpha: float = DEFAULT_ENDPOINT_EWMA_ALPHA):
+        self.__url = url
+        self.__alpha = ewma_alpha
+        self.__lock = threading.Lock()
+
+        self.__ewma_latency_sec: Optional[float] = None
+        self.__error_rate: float = 0.0
+        self.__head_height: Optional[int] = None
+        self.__unhealthy_until: float = 0.0
+
+    def __repr__(self) -> str:
+        return "{}({}, latency={}, error_rate={:.3f}, head={})".format(
+            self.__class__.__name__, self.__url, self.__ewma_latency_sec, self.__error_rate, self.__head_height
+        )
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def ewma_latency_sec(self) -> Optional[float]:
+        return self.__ewma_latency_sec
+
+    @property
+    def error_rate(self) -> float:
+        return self.__error_rate
+
+    @property
+    def head_height(self) -> Optional[int]:
+        return self.__head_height
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.__unhealthy_until
+
+    @property
+    def score(self) -> float:
+        """ lower is better. an endpoint without any latency sample scores zero, so it gets probed first. """
+        latency = 0.0 if self.__ewma_latency_sec is None else self.__ewma_latency_sec
+        return latency * (1 + ERROR_RATE_PENALTY * self.__error_rate)
+
+    def record_success(self, latency_sec: float):
+        with self.__lock:
+            if self.__ewma_latency_sec is None:
+                self.__ewma_latency_sec = latency_sec
+            else:
+                self.__ewma_latency_sec += self.__alpha * (latency_sec - self.__ewma_latency_sec)
+            self.__error_rate += self.__alpha * (0.0 - self.__error_rate)
+            self.__unhealthy_until = 0.0
+
+    def record_failure(self, cooldown_sec: float):
+        with self.__lock:
+            self.__error_rate += self.__alpha * (1.0 - self.__error_rate)
+            self.__unhealthy_until = time.monotonic() + cooldown_sec
+
+    def record_head(self, height: int):
+        with self.__lock:
+            if self.__head_height is None or height > self.__head_height:
+                self.__head_height = height
+
+
+class EndpointSelector:
+    """ Routes each rpc call to the best healthy endpoint of a chain.
+
+    Candidates are ordered by score (EWMA latency weighted by EWMA error rate). Endpoints that failed recently
+    or lag behind the highest known head by more than "max_lag_blocks" are moved to the end of the list,
+    so callers fail over to them only when nothing better is left.
+    """
+
+    def __init__(
+        self,
+        urls: Union[str, List[str]],
+        failure_cooldown_sec: float,
+        max_lag_blocks: int,
+        ewma_alpha: float = DEFAULT_ENDPOINT_EWMA_ALPHA
+    ):
+        if isinstance(urls, str):
+            urls = [urls] if urls else []
+        self.__endpoints = [RpcEndpoint(url, ewma_alpha) for url in urls]
+        self.__failure_cooldown_sec = failure_cooldown_sec
+        self.__max_lag_blocks = max_lag_blocks
+
+    @property
+    def endpoints(self) -> List[RpcEndpoint]:
+        return list(self.__endpoints)
+
+    @property
+    def urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self.__endpoints]
+
+    @property
+    def best_head_height(self) -> Optional[int]:
+        heights = [endpoint.head_height for endpoint in self.__endpoints if endpoint.head_height is not None]
+        return max(heights) if heights else None
+
+    def is_lagging(self, endpoint: RpcEndpoint) -> bool:
+        best_head = self.best_head_height
+        if best_head is None or endpoint.head_height is None:
+            return False
+        return best_head - endpoint.head_height > self.__max_lag_blocks
+
+    def primary(self) -> Optional[RpcEndpoint]:
+        candidates = self.candidates()
+        return candidates[0] if candidates else None
+
+    def candidates(self, min_height: int = None) -> List[RpcEndpoint]:
+        """
+        return endpoints in the order they should be tried.
+        with "min_height", only endpoints known to have indexed that height are returned (e.g. for eth_getLogs);
+        if no endpoint is known to reach it, the endpoint with the highest known head is the only candidate.
+        """
+        ranked = sorted(self.__endpoints, key=lambda endpoint: endpoint.score)
+        preferred = [endpoint for endpoint in ranked if endpoint.healthy and not self.is_lagging(endpoint)]
+        others = [endpoint for endpoint in ranked if endpoint not in preferred]
+        ordered = preferred + others
+
+        if min_height is None or len(ordered) < 2:
+            return ordered
+
+        indexed = [
+            endpoint for endpoint in ordered if endpoint.head_height is not None and endpoint.head_height >= min_height
+        ]
+        if indexed:
+            return indexed
+        highest = max(ordered, key=lambda endpoint: -1 if endpoint.head_height is None else endpoint.head_height)
+        return [highest]
+
+    def record_success(self, endpoint: RpcEndpoint, latency_sec: float):
+        endpoint.record_success(latency_sec)
+
+    def record_failure(self, endpoint: RpcEndpoint):
+        endpoint.record_failure(self.__failure_cooldown_sec)
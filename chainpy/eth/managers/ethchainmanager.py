@@ -1,5 +1,6 @@
 import threading
-from typing import Optional, Union, List
+import time
+from typing import Optional, Union, List, Tuple, Dict
 
 from .rpchandler import (
     DEFAULT_RECEIPT_MAX_RETRY,
@@ -8,26 +9,41 @@ from .rpchandler import (
     DEFAULT_RPC_RESEND_DELAY_SEC,
     DEFAULT_RPC_TX_BLOCK_DELAY
 )
+from .confirmationtracker import ConfirmationTracker
+from .consts import TRANSFER_GAS
+from .feeoracle import FeeOracle
+from .gascache import GasEstimateCache
+from .multicall import Multicall
+from .noncemanager import NonceManager
+from .signerpool import SignerLane, SignerPool
+from .txreplacer import TxReplacer
+from .exceptions import NonceTooLow, ReplaceTransactionUnderpriced, EthAlreadyImported
+from .retrypolicy import RpcErrorClass
 from ..ethtype.account import EthAccount
 from ..ethtype.amount import EthAmount
+from ..ethtype.contract import AbiMethod
 from ..ethtype.hexbytes import EthHashBytes, EthAddress, EthHexBytes
+from ..ethtype.receipt import EthReceipt
 from ..ethtype.transaction import EthTransaction
+from ..ethtype.utils import keccak_hash
 from ..managers.contracthandler import EthContractHandler
 from ..managers.utils import FeeConfig, merge_dict
+from ...logger import global_logger
 
 PRIORITY_FEE_MULTIPLIER = 4
 TYPE0_GAS_MULTIPLIER = 1.5
 TYPE2_GAS_MULTIPLIER = 2
 
+# (contract name or address, method name or abi of an unregistered contract, method params)
+ContractCall = Tuple[Union[str, EthAddress], Union[str, AbiMethod], list]
+
 
 class EthChainManager(EthContractHandler):
     _account = EthAccount.from_secret("0xbfc")
-    _nonce = 0
-    _nonce_lock = threading.Lock()
 
     def __init__(
         self,
-        url_with_access_key: str,
+        url_with_access_key: Union[str, List[str]],
         contracts: List[dict],
         chain_name: str,
         abi_dir: str = None,
@@ -41,7 +57,8 @@ class EthChainManager(EthContractHandler):
         latest_height: int = 0,
         max_log_num: int = 1000,
 
-        fee_config: dict = None
+        fee_config: dict = None,
+        rpc_config: dict = None
     ):
         super().__init__(
             url_with_access_key,
@@ -55,7 +72,8 @@ class EthChainManager(EthContractHandler):
             transaction_block_delay,
             events,
             latest_height,
-            max_log_num
+            max_log_num,
+            rpc_config
         )
 
         if fee_config is None:
@@ -63,6 +81,33 @@ class EthChainManager(EthContractHandler):
         else:
             self.__fee_config = FeeConfig.from_dict(fee_config)
 
+        self.__multicall = Multicall(self, self.rpc_config.multicall_address)
+        self.__nonce_manager: Optional[NonceManager] = None
+        self.__signer_pool: Optional[SignerPool] = None
+        self.__tx_replacer = TxReplacer(self)
+        self.__confirmation_tracker: Optional[ConfirmationTracker] = None
+        self.__confirmation_tracker_lock = threading.Lock()
+
+        self.__gas_estimate_cache: Optional[GasEstimateCache] = None
+        if self.rpc_config.gas_estimate_cache:
+            self.__gas_estimate_cache = GasEstimateCache(
+                self.rpc_config.gas_estimate_cache_ttl_sec, self.rpc_config.gas_estimate_length_bucket
+            )
+
+        # (contract address, method selector, calldata length bucket)
+        #   -> (access list or None if it does not lower gas, gas without the list, stored_at)
+        self.__access_lists: Dict[Tuple[str, str, int], Tuple[Optional[list], Optional[int], float]] = dict()
+        self.__access_lists_lock = threading.Lock()
+
+        # with fee_oracle, type2 fee parameters are served from memory, refreshed once per block
+        self.__fee_oracle: Optional[FeeOracle] = None
+        if self.__fee_config.type == 2 and self.__fee_config.fee_oracle:
+            if not self.rpc_config.head_tracker:
+                raise Exception("fee_config.fee_oracle of {} requires rpc_config.head_tracker".format(chain_name))
+            self.__fee_oracle = FeeOracle(
+                self, self.__fee_config.fee_history_blocks, self.__fee_config.fee_reward_percentile
+            )
+
     @classmethod
     def from_config_dict(cls, config: dict, private_config: dict = None):
         chain_config = merge_dict(config, private_config)
@@ -89,7 +134,8 @@ class EthChainManager(EthContractHandler):
             chain_config.get("bootstrap_latest_height"),
             chain_config.get("max_log_num"),
 
-            chain_config.get("fee_config")
+            chain_config.get("fee_config"),
+            chain_config.get("rpc_config")
         )
 
     @property
@@ -100,21 +146,68 @@ class EthChainManager(EthContractHandler):
     def address(self) -> Optional[EthAddress]:
         return None if self._account is None else self._account.address
 
-    def set_account(self, private_key: str):
+    def set_account(self, private_key: str, signer_secrets: List[str] = None, signer_min_balance: int = None):
+        """
+        set the main account; "signer_secrets" add more accounts to the signer pool,
+        whose transactions are spread over the accounts in round robin.
+        """
         self._account = EthAccount.from_secret(private_key)
-        self._nonce = self.eth_get_user_nonce(self._account.address, 'latest')
         super().set_signer(self._account.private_key)
+        accounts = [self._account]
+        for secret in [] if signer_secrets is None else signer_secrets:
+            account = EthAccount.from_secret(secret)
+            if account.address in [acc.address for acc in accounts]:
+                continue
+            super().add_signer(account.private_key)
+            accounts.append(account)
+
+        self.__signer_pool = SignerPool(self, accounts, signer_min_balance)
+        self.__nonce_manager = self.__signer_pool.lanes[0].nonce_manager
+        # with lazy_connect, the nonces are fetched when the first one is issued
+        if not self.rpc_config.lazy_connect:
+            for lane in self.__signer_pool.lanes:
+                lane.nonce_manager.sync()
+
+    @property
+    def nonce_manager(self) -> NonceManager:
+        if self.__nonce_manager is None:
+            self.__nonce_manager = NonceManager.of(self, self._account.address)
+        return self.__nonce_manager
+
+    @property
+    def confirmation_tracker(self) -> ConfirmationTracker:
+        """ the tracker of the transactions watched on this chain, started on first use """
+        with self.__confirmation_tracker_lock:
+            if self.__confirmation_tracker is None:
+                self.__confirmation_tracker = ConfirmationTracker(self)
+                self.__confirmation_tracker.start()
+            return self.__confirmation_tracker
+
+    @property
+    def gas_estimate_cache(self) -> Optional[GasEstimateCache]:
+        return self.__gas_estimate_cache
+
+    @property
+    def tx_replacer(self) -> TxReplacer:
+        return self.__tx_replacer
+
+    @property
+    def signer_pool(self) -> SignerPool:
+        if self.__signer_pool is None:
+            self.__signer_pool = SignerPool(self, [self._account])
+        return self.__signer_pool
+
+    def _signer_lane(self, signer: Optional[EthAccount]) -> SignerLane:
+        if signer is None:
+            return self.signer_pool.next_lane()
+        lane = self.signer_pool.lane_of(signer)
+        if lane is None:
+            raise Exception("Not a signer of {}: {}".format(self.chain_name, signer.address.hex()))
+        return lane
 
     @property
     def issue_nonce(self) -> Optional[int]:
-        if self._nonce is not None:
-            self._nonce_lock.acquire()
-            nonce = self._nonce
-            self._nonce += 1
-            self._nonce_lock.release()
-            return nonce
-        else:
-            return None
+        return self.nonce_manager.issue()
 
     @property
     def fee_config(self) -> FeeConfig:
@@ -139,16 +232,75 @@ class EthChainManager(EthContractHandler):
         data = contract.abi.get_method(method_name).encode_input_data(method_params)
         return data
 
-    def estimate_tx(self, transaction: EthTransaction, from_addr: EthAddress = None) -> int:
-        """ estimate the transaction and return its gas limit"""
+    @staticmethod
+    def _estimation_dict(transaction: EthTransaction, from_addr: EthAddress = None) -> dict:
         tx_dict = transaction.call_dict()
         if from_addr is not None:
             tx_dict["from"] = from_addr.with_checksum()
 
         if "chainId" in tx_dict:
             del tx_dict["chainId"]
+        if transaction.access_list:
+            tx_dict["accessList"] = transaction.access_list
+        return tx_dict
 
-        return self.eth_estimate_gas(tx_dict)
+    def estimate_tx(self, transaction: EthTransaction, from_addr: EthAddress = None) -> int:
+        """ estimate the transaction and return its gas limit; a reverting transaction raises RpcEVMError """
+        estimation_dict = self._estimation_dict(transaction, from_addr)
+        if self.__gas_estimate_cache is not None:
+            gas = self.__gas_estimate_cache.get(transaction)
+            if gas is not None:
+                # a cached estimate still checks the transaction for a revert
+                self.eth_call(estimation_dict)
+                return gas
+
+        gas = self.eth_estimate_gas(estimation_dict)
+        self._verify_access_list(transaction, gas)
+        if self.__gas_estimate_cache is not None:
+            self.__gas_estimate_cache.put(transaction, gas)
+        return gas
+
+    def estimate_txs(
+        self, transactions: List[EthTransaction], from_addr: EthAddress = None
+    ) -> List[Union[int, Exception]]:
+        """ estimate the transactions in one round trip; a failed estimation results in its exception
+
+        The transactions with a cached estimate are checked for a revert by eth_call in the same batch.
+        """
+        gas_cache = self.__gas_estimate_cache
+        cached = [None if gas_cache is None else gas_cache.get(tx) for tx in transactions]
+        requests = [
+            ("eth_estimateGas" if gas is None else "eth_call", [self._estimation_dict(tx, from_addr), "latest"])
+            for tx, gas in zip(transactions, cached)
+        ]
+        responses = self.send_batch_request(requests) if requests else list()
+
+        results: List[Union[int, Exception]] = list()
+        for tx, gas, response in zip(transactions, cached, responses):
+            if isinstance(response, Exception):
+                results.append(response)
+                continue
+            if gas is not None:
+                results.append(gas)
+                continue
+            gas = int(response, 16)
+            self._verify_access_list(tx, gas)
+            if gas_cache is not None:
+                gas_cache.put(tx, gas)
+            results.append(gas)
+        return results
+
+    def observe_receipt(self, tx_hash: EthHashBytes, receipt: EthReceipt):
+        """ learn from the receipt of a transaction sent by this manager: seeds or invalidates its gas estimate """
+        if self.__gas_estimate_cache is None:
+            return
+        transaction = self.__tx_replacer.tx_of(tx_hash)
+        if transaction is None:
+            return
+        if receipt.status == 1:
+            self.__gas_estimate_cache.put(transaction, receipt.gas_used)
+        else:
+            self.__gas_estimate_cache.invalidate(transaction)
 
     def call_transaction(
         self,
@@ -170,6 +322,45 @@ class EthChainManager(EthContractHandler):
         contract = self.get_contract_by_name(contract_name)
         return contract.abi.get_method(method_name).decode_output_data(result)
 
+    def _resolve_call(self, call: ContractCall) -> Tuple[EthAddress, AbiMethod, list]:
+        contract_name_or_addr, method, method_params = call
+        if isinstance(contract_name_or_addr, EthAddress):
+            address, contract = contract_name_or_addr, self.get_contract_by_addr(contract_name_or_addr)
+        else:
+            contract = self.get_contract_by_name(contract_name_or_addr)
+            if contract is None:
+                raise Exception("Unknown contract: {}".format(contract_name_or_addr))
+            address = contract.address
+
+        if isinstance(method, str):
+            if contract is None:
+                raise Exception("The abi of the method is required for an unregistered contract: {}".format(address))
+            method = contract.abi.get_method(method)
+        return address, method, method_params
+
+    def multicall(
+        self, calls: List[ContractCall], height: Union[int, str] = "latest"
+    ) -> List[Union[tuple, Exception]]:
+        """
+        Read every call in one round trip, at one block, through Multicall3.
+        Returns the decoded outputs of each call in order; a failed call results in its exception instead.
+        """
+        resolved_calls = [self._resolve_call(call) for call in calls]
+        raw_calls = [(address, method.encode_input_data(params)) for address, method, params in resolved_calls]
+        results = self.__multicall.aggregate(raw_calls, height)
+
+        decoded_results = list()
+        for (_, method, _), result in zip(resolved_calls, results):
+            if isinstance(result, Exception):
+                decoded_results.append(result)
+                continue
+            try:
+                decoded_results.append(method.decode_output_data(result))
+            except Exception as e:
+                # e.g. no contract code at the address, which returns empty data
+                decoded_results.append(e)
+        return decoded_results
+
     def build_transaction(
         self,
         contract_name: str,
@@ -181,7 +372,74 @@ class EthChainManager(EthContractHandler):
         contract_address = self.get_contract_by_name(contract_name).address
         value = EthAmount.zero() if value is None else value
 
-        return EthTransaction.init(self.chain_id, contract_address, value, data)
+        transaction = EthTransaction.init(self.chain_id, contract_address, value, data)
+        # the main account simulates the call; the class-level default one is no signer of this manager
+        if self.rpc_config.access_list and self.tx_type == 2 and self.signers:
+            access_list = self._access_list_of(transaction)
+            if access_list is not None:
+                transaction.set_access_list(access_list)
+        return transaction
+
+    def _access_list_key(self, transaction: EthTransaction) -> Tuple[str, str, int]:
+        """ calls of one method with calldata of a similar size are expected to touch the same storage """
+        data = transaction.input.bytes() if transaction.input is not None else b""
+        length_bucket = self.rpc_config.gas_estimate_length_bucket
+        return transaction.to.hex().lower(), data[:4].hex(), len(data) // (length_bucket or 1)
+
+    def _access_list_of(self, transaction: EthTransaction) -> Optional[list]:
+        """ the access list of the contract method if it lowers the estimated gas, cached for access_list_ttl_sec """
+        key = self._access_list_key(transaction)
+        with self.__access_lists_lock:
+            entry = self.__access_lists.get(key)
+        if entry is not None and time.monotonic() - entry[2] <= self.rpc_config.access_list_ttl_sec:
+            return entry[0]
+
+        # the list and the gas without it, from the same state in one round trip
+        call_dict = self._estimation_dict(transaction, self.address)
+        created, estimated = self.send_batch_request(
+            [("eth_createAccessList", [call_dict, "latest"]), ("eth_estimateGas", [call_dict, "latest"])]
+        )
+        access_list, gas_without_list = None, None
+        if isinstance(created, Exception) or isinstance(estimated, Exception):
+            # e.g. eth_createAccessList is not served; the method is built without a list until the entry expires
+            error = created if isinstance(created, Exception) else estimated
+            global_logger.formatted_log("AccessList", related_chain_name=self.chain_name, msg=str(error))
+        elif created.get("error"):
+            global_logger.formatted_log("AccessList", related_chain_name=self.chain_name, msg=str(created["error"]))
+        elif created["accessList"] and int(created["gasUsed"], 16) < int(estimated, 16):
+            access_list, gas_without_list = created["accessList"], int(estimated, 16)
+
+        with self.__access_lists_lock:
+            self.__access_lists[key] = (access_list, gas_without_list, time.monotonic())
+        return access_list
+
+    def _verify_access_list(self, transaction: EthTransaction, gas: int):
+        """ drop the cached access list once a call estimated with it costs more than the method did without it """
+        if not transaction.access_list:
+            return
+        key = self._access_list_key(transaction)
+        with self.__access_lists_lock:
+            entry = self.__access_lists.get(key)
+            if entry is not None and entry[1] is not None and gas >= entry[1]:
+                del self.__access_lists[key]
+
+    @property
+    def fee_oracle(self) -> Optional[FeeOracle]:
+        return self.__fee_oracle
+
+    def _fetch_type2_fee_parameters(self) -> (int, int):
+        """ (priority fee, next base fee) from the fee oracle, or from the network if eth_feeHistory is not served """
+        if self.__fee_oracle is not None:
+            try:
+                snapshot = self.__fee_oracle.get()
+                return snapshot.priority_fee, snapshot.next_base_fee
+            except Exception as e:
+                global_logger.formatted_log("FeeOracle", related_chain_name=self.chain_name, msg=str(e))
+                # e.g. eth_feeHistory is not served by the chain; a transient failure keeps the oracle
+                if self.retry_policy.classify(e) == RpcErrorClass.FATAL:
+                    self.__fee_oracle.close()
+                    self.__fee_oracle = None
+        return self.eth_get_priority_fee_per_gas(), self.eth_get_next_base_fee()
 
     def fetch_network_fee_parameters(self) -> (Optional[int], Optional[int], Optional[int]):
         """ fetch fee parameters from the network """
@@ -189,8 +447,7 @@ class EthChainManager(EthContractHandler):
         if self.tx_type == 0:
             gas_price = self.eth_get_gas_price()
         elif self.tx_type == 2:
-            priority_fee_price = self.eth_get_priority_fee_per_gas()
-            base_fee_price = self.eth_get_next_base_fee()
+            priority_fee_price, base_fee_price = self._fetch_type2_fee_parameters()
 
             # bifrost specific config
             if self.chain_name.split("_")[0] == "BFC":
@@ -206,14 +463,18 @@ class EthChainManager(EthContractHandler):
         gas_limit_multiplier: float = 1.0,
         boost: bool = False,
         sender_account: EthAccount = None,
+        fee_parameters: Tuple[Optional[int], Optional[int], Optional[int]] = None
     ) -> (bool, EthTransaction):
+        """ "fee_parameters" are the ones prefetched by fetch_network_fee_parameters, if any """
 
         if gas_limit is None:
             gas_limit = self.estimate_tx(tx, sender_account.address)
         tx.set_gas_limit(int(gas_limit * gas_limit_multiplier))
 
         # fetch fee from network
-        net_gas_price, net_base_fee_price, net_priority_fee_price = self.fetch_network_fee_parameters()
+        if fee_parameters is None:
+            fee_parameters = self.fetch_network_fee_parameters()
+        net_gas_price, net_base_fee_price, net_priority_fee_price = fee_parameters
 
         if self.tx_type < 2:
             net_gas_price = int(net_gas_price * TYPE0_GAS_MULTIPLIER)
@@ -235,15 +496,53 @@ class EthChainManager(EthContractHandler):
 
         return is_sendable, tx
 
+    @staticmethod
+    def _sign_transaction(tx_with_fee: EthTransaction, account: EthAccount) -> EthHexBytes:
+        if not tx_with_fee.is_sendable():
+            raise Exception("Check transaction parameters")
+        return tx_with_fee.sign_transaction(account)
+
+    @staticmethod
+    def _settle_failed_nonce(nonce_manager: NonceManager, nonce: int, error: Exception):
+        """ settle the nonce of a transaction whose signing has failed, or which the nodes have rejected """
+        if isinstance(error, (NonceTooLow, ReplaceTransactionUnderpriced)):
+            # the nonce has been taken on the network; learn the next one from it
+            nonce_manager.mark_broadcast(nonce, None)
+            nonce_manager.sync()
+        else:
+            nonce_manager.release(nonce)
+
+    def _settle_broadcast(
+        self, lane: SignerLane, tx_with_fee: EthTransaction, tx_hash: EthHashBytes, error: Exception = None
+    ) -> Union[EthHashBytes, Exception]:
+        """
+        settle the nonce of a signed transaction after its broadcast, and return its hash or the error rejecting it.
+        the transaction is tracked by its local hash once a node has accepted (or already known) it, and also if
+        no node has answered, since it may have reached one; the replacer re-sends it if it has not.
+        """
+        if error is not None and not isinstance(error, EthAlreadyImported):
+            if not self.is_unanswered(error):
+                self._settle_failed_nonce(lane.nonce_manager, tx_with_fee.nonce, error)
+                return error
+            global_logger.formatted_log(
+                "Broadcast", related_chain_name=self.chain_name, msg="{}:Unanswered:{}".format(tx_hash.hex(), str(error))
+            )
+        lane.nonce_manager.mark_broadcast(tx_with_fee.nonce, tx_hash)
+        self.__tx_replacer.track(tx_hash, tx_with_fee, lane.account, lane.nonce_manager)
+        return tx_hash
+
     def send_transaction(
         self,
         transaction: EthTransaction,
         gas_limit: int = None,
         boost: bool = False,
-        gas_limit_multiplier: float = 1.0
+        gas_limit_multiplier: float = 1.0,
+        signer: EthAccount = None
     ) -> EthHashBytes:
+        """ send the transaction from "signer", or from the next lane of the signer pool if it is None """
         if self._account is None:
             raise Exception("No account")
+        lane = self._signer_lane(signer)
 
         # estimate tx and setting gas parameter
         is_sendable, tx_with_fee = self.set_gas_limit_and_fee(
@@ -251,23 +550,130 @@ class EthChainManager(EthContractHandler):
             gas_limit=gas_limit,
             boost=boost,
             gas_limit_multiplier=gas_limit_multiplier,
-            sender_account=self._account
+            sender_account=lane.account
         )
 
         if is_sendable:
-            tx_with_fee.set_nonce(self.issue_nonce)
-
-            if not tx_with_fee.is_sendable():
-                raise Exception("Check transaction parameters")
-            signed_raw_tx = tx_with_fee.sign_transaction(self._account)
-            tx_hash = self.eth_send_raw_transaction(signed_raw_tx)
-            if tx_hash is None:
-                tx_hash = EthHashBytes.default()
+            nonce = lane.nonce_manager.issue()
+            tx_with_fee.set_nonce(nonce)
+            try:
+                signed_raw_tx = self._sign_transaction(tx_with_fee, lane.account)
+            except Exception as e:
+                self._settle_failed_nonce(lane.nonce_manager, nonce, e)
+                raise
+
+            # the hash is known before the broadcast, whatever its outcome
+            tx_hash, error = keccak_hash(signed_raw_tx), None
+            try:
+                self.eth_send_raw_transaction(signed_raw_tx)
+            except Exception as e:
+                error = e
+            result = self._settle_broadcast(lane, tx_with_fee, tx_hash, error)
+            if isinstance(result, Exception):
+                raise result
         else:
             tx_hash = EthHashBytes.default()
 
         return tx_hash
 
+    def send_transactions(
+        self,
+        transactions: List[EthTransaction],
+        gas_limit_multipliers: List[float] = None,
+        signer: EthAccount = None
+    ) -> List[Union[EthHashBytes, Exception]]:
+        """
+        Send the transactions from one signer (the next lane of the signer pool if "signer" is None)
+        with consecutive nonces, in their order, in a few round trips:
+        one batch of gas estimations, the fee parameters once, and one batch of broadcasts (to every endpoint).
+        A nonce rejected below a broadcast one is taken by a no-op transfer, so the later ones are not held back.
+        Each result is the hash of the transaction, a zero hash if the fee is beyond the cap (as send_transaction),
+        or the exception of its estimation, signing or broadcast.
+        """
+        if self._account is None:
+            raise Exception("No account")
+        if gas_limit_multipliers is None:
+            gas_limit_multipliers = [1.0] * len(transactions)
+        lane = self._signer_lane(signer)
+
+        gas_limits = self.estimate_txs(transactions, lane.account.address)
+        fee_parameters = self.fetch_network_fee_parameters()
+
+        results: List[Union[EthHashBytes, Exception, None]] = [None] * len(transactions)
+        signed_txs = list()  # (index, transaction, signed raw tx)
+        for idx, transaction in enumerate(transactions):
+            gas_limit, multiplier = gas_limits[idx], gas_limit_multipliers[idx]
+            if isinstance(gas_limit, Exception):
+                results[idx] = gas_limit
+                continue
+
+            is_sendable, tx_with_fee = self.set_gas_limit_and_fee(
+                transaction,
+                gas_limit=gas_limit,
+                gas_limit_multiplier=multiplier,
+                sender_account=lane.account,
+                fee_parameters=fee_parameters
+            )
+            if not is_sendable:
+                results[idx] = EthHashBytes.default()
+                continue
+
+            nonce = lane.nonce_manager.issue()
+            tx_with_fee.set_nonce(nonce)
+            try:
+                signed_txs.append((idx, tx_with_fee, self._sign_transaction(tx_with_fee, lane.account)))
+            except Exception as e:
+                self._settle_failed_nonce(lane.nonce_manager, nonce, e)
+                results[idx] = e
+
+        if not signed_txs:
+            return results
+
+        responses = self.eth_send_raw_transactions([signed_raw_tx for _, _, signed_raw_tx in signed_txs])
+        for (idx, tx_with_fee, signed_raw_tx), response in zip(signed_txs, responses):
+            error = response if isinstance(response, Exception) else None
+            results[idx] = self._settle_broadcast(lane, tx_with_fee, keccak_hash(signed_raw_tx), error)
+
+        # a nonce rejected below a broadcast one holds the later transactions back until it is taken
+        sent_nonces = [tx.nonce for idx, tx, _ in signed_txs if not isinstance(results[idx], Exception)]
+        for idx, tx_with_fee, _ in signed_txs:
+            if isinstance(results[idx], Exception) and sent_nonces and tx_with_fee.nonce < max(sent_nonces):
+                self._fill_nonce_gap(lane, tx_with_fee)
+        return results
+
+    def _fill_nonce_gap(self, lane: SignerLane, rejected_tx: EthTransaction):
+        """
+        take the released nonce of a rejected transaction with a no-op transfer to the signer itself.
+        the filler is priced from the current network fees, since the rejected one may have been underpriced.
+        """
+        if not lane.nonce_manager.claim(rejected_tx.nonce):
+            # e.g. the nonce has been taken on the network already
+            return
+        filler = EthTransaction.init(self.chain_id, lane.account.address, EthAmount.zero(), EthHexBytes("0x"))
+        filler.set_nonce(rejected_tx.nonce)
+
+        try:
+            is_sendable, filler = self.set_gas_limit_and_fee(
+                filler, gas_limit=TRANSFER_GAS, sender_account=lane.account
+            )
+            if not is_sendable:
+                raise Exception("the network fee exceeds fee_config")
+            signed_raw_tx = self._sign_transaction(filler, lane.account)
+        except Exception as e:
+            self._settle_failed_nonce(lane.nonce_manager, filler.nonce, e)
+            result = e
+        else:
+            tx_hash, error = keccak_hash(signed_raw_tx), None
+            try:
+                self.eth_send_raw_transaction(signed_raw_tx)
+            except Exception as e:
+                error = e
+            result = self._settle_broadcast(lane, filler, tx_hash, error)
+        global_logger.formatted_log(
+            "Broadcast", related_chain_name=self.chain_name,
+            msg="NonceGap:{}:{}".format(filler.nonce, result if isinstance(result, Exception) else result.hex())
+        )
+
     def native_balance(self, addr: EthAddress = None) -> EthAmount:
         if self._account is None and addr is None:
             raise Exception("No Account")
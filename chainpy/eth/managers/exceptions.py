@@ -12,6 +12,32 @@ class RpCMaxRetry(CustomException):
 
 
 class RpcOutOfStatusCode(CustomException):
+    def __init__(
+        self, related_chain_name: str, msg: str, status_code: int = None, retry_after_sec: Optional[float] = None
+    ):
+        super().__init__(related_chain_name, msg)
+        self.status_code = status_code
+        self.retry_after_sec = retry_after_sec
+
+
+class RpcRateLimited(CustomException):
+    def __init__(self, related_chain_name: str, msg: str):
+        super().__init__(related_chain_name, msg)
+
+
+class RpcNodeBehind(CustomException):
+    """ the node has not imported the requested block yet """
+    def __init__(self, related_chain_name: str, msg: str):
+        super().__init__(related_chain_name, msg)
+
+
+class RpcFilterNotFound(CustomException):
+    """ the filter has expired (or been installed on another node) """
+    def __init__(self, related_chain_name: str, msg: str):
+        super().__init__(related_chain_name, msg)
+
+
+class TransactionNotFound(CustomException):
     def __init__(self, related_chain_name: str, msg: str):
         super().__init__(related_chain_name, msg)
 
@@ -64,10 +90,12 @@ def raise_integrated_exception(
     error_json: Optional[Union[str, dict]] = None,
     is_none_result: bool = False
 ):
+    error_code = None
     if is_none_result:
         raise RpcNoneResult(chain_name, "None rpc-result")
     elif isinstance(error_json, dict):
         error_msg = error_json["message"]
+        error_code = error_json.get("code")
     else:
         error_msg = str(e)
 
@@ -79,6 +107,8 @@ def raise_integrated_exception(
         raise RpcEVMError(chain_name, error_msg)
     elif error_msg.startswith("submit transaction to pool failed: Pool(AlreadyImported("):
         raise EthAlreadyImported(chain_name, error_msg)
+    elif error_msg.lower().startswith("already known") or error_msg.lower().startswith("known transaction"):
+        raise EthAlreadyImported(chain_name, error_msg)
     elif error_msg.startswith("nonce too low"):
         raise NonceTooLow(chain_name, error_msg)
     elif error_msg.startswith("replacement transaction underpriced") or error_msg.startswith("transaction underpriced"):
@@ -89,5 +119,11 @@ def raise_integrated_exception(
         raise NonceTooLow(chain_name, error_msg)
     elif error_msg.startswith("submit transaction to pool failed: Pool(InvalidTransaction"):
         raise NonceTooLow(chain_name, error_msg)
+    elif error_msg.startswith("header not found") or error_msg.startswith("unknown block"):
+        raise RpcNodeBehind(chain_name, error_msg)
+    elif "filter not found" in error_msg.lower() or ("filter" in error_msg.lower() and "not exist" in error_msg.lower()):
+        raise RpcFilterNotFound(chain_name, error_msg)
+    elif error_code == -32005 or "rate limit" in error_msg.lower() or "too many requests" in error_msg.lower():
+        raise RpcRateLimited(chain_name, error_msg)
     else:
         raise Exception("Not handled error on {}: {}".format(chain_name, error_msg))
@@ -0,0 +1,87 @@
+import statistics
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from .consts import DEFAULT_FEE_HISTORY_BLOCKS, DEFAULT_FEE_REWARD_PERCENTILE
+from .headtracker import HeadSnapshot
+from .rpchandler import EthRpcClient
+
+
+class FeeSnapshot(NamedTuple):
+    height: int  # the newest block of the fee history
+    base_fee: int  # base fee of that block
+    next_base_fee: int  # base fee of the block to come
+    priority_fee: int  # median over the window of the per-block reward percentile
+    fetched_at: float
+
+
+class FeeOracle:
+    """ Serves EIP-1559 fee parameters of a chain from memory, refreshed once per block by eth_feeHistory.
+
+    A single eth_feeHistory call gives the base fees of the window (including the next block's, computed by
+    the node from the last block's gas usage) and the priority fees paid at "reward_percentile" in each block.
+    A head published by the head tracker only marks the snapshot behind; it is refreshed on the next "get",
+    so the publishing thread never waits for eth_feeHistory. Run the head tracker, so that "get" reads the head
+    from memory instead of fetching it.
+    """
+
+    def __init__(
+        self,
+        rpc_client: EthRpcClient,
+        history_blocks: int = DEFAULT_FEE_HISTORY_BLOCKS,
+        reward_percentile: float = DEFAULT_FEE_REWARD_PERCENTILE
+    ):
+        self.__rpc_client = rpc_client
+        self.__history_blocks = history_blocks
+        self.__reward_percentile = reward_percentile
+        self.__lock = threading.Lock()
+        self.__snapshot: Optional[FeeSnapshot] = None
+        self.__head_height: Optional[int] = None  # the newest head published
+
+        rpc_client.head_tracker.add_listener(self._on_new_head)
+
+    @property
+    def snapshot(self) -> Optional[FeeSnapshot]:
+        return self.__snapshot
+
+    def close(self):
+        self.__rpc_client.head_tracker.remove_listener(self._on_new_head)
+
+    def _on_new_head(self, head: HeadSnapshot):
+        if self.__head_height is None or self.__head_height < head.latest:
+            self.__head_height = head.latest
+
+    def refresh(self) -> FeeSnapshot:
+        with self.__lock:
+            history = self.__rpc_client.eth_fee_history(self.__history_blocks, "latest", [self.__reward_percentile])
+            base_fees = [int(base_fee, 16) for base_fee in history["baseFeePerGas"]]
+            if not base_fees or base_fees[-1] == 0:
+                raise Exception("No base fee on {}".format(self.__rpc_client.chain_name))
+
+            # the blocks without a transaction pay no reward, so they say nothing about the priority fee
+            rewards = [int(reward[0], 16) for reward in history.get("reward", list()) if reward]
+            rewards = [reward for reward in rewards if reward > 0]
+            priority_fee = int(statistics.median(rewards)) if rewards else self.__rpc_client.eth_get_priority_fee_per_gas()
+
+            newest_height = int(history["oldestBlock"], 16) + len(base_fees) - 2
+            snapshot = FeeSnapshot(newest_height, base_fees[-2], base_fees[-1], priority_fee, time.monotonic())
+            if self.__snapshot is None or self.__snapshot.height <= snapshot.height:
+                self.__snapshot = snapshot
+            return self.__snapshot
+
+    def get(self) -> FeeSnapshot:
+        """ the snapshot of the current head; refreshed at once if a newer block has been published """
+        head_height = self.__head_height
+        if head_height is None:
+            head_height = self.__rpc_client.head_tracker.get().latest
+        snapshot = self.__snapshot
+        if snapshot is None or snapshot.height < head_height:
+            snapshot = self.refresh()
+        return snapshot
+
+    def next_base_fee(self) -> int:
+        return self.get().next_base_fee
+
+    def priority_fee(self) -> int:
+        return self.get().priority_fee
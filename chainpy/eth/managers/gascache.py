@@ -0,0 +1,65 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .consts import DEFAULT_GAS_ESTIMATE_CACHE_TTL_SEC
+from ..ethtype.transaction import EthTransaction
+
+# (contract address, method selector, calldata length bucket or None)
+GasKey = Tuple[str, str, Optional[int]]
+
+
+class GasEstimateCache:
+    """ Gas estimates of the transactions of a chain, shared by the transactions calling the same method.
+
+    A transaction is keyed by its contract, its method selector and, with "length_bucket", the bucket of its
+    calldata size (calldata of variable length costs gas per byte). The cache is filled by estimations and by the
+    gas used in receipts, keeping the largest value seen until the entry, counted from its first store, is older
+    than "ttl_sec". An entry is dropped on a revert.
+    """
+
+    def __init__(self, ttl_sec: float = DEFAULT_GAS_ESTIMATE_CACHE_TTL_SEC, length_bucket: int = None):
+        self.__ttl_sec = ttl_sec
+        self.__length_bucket = length_bucket
+        self.__lock = threading.Lock()
+        self.__entries: Dict[GasKey, Tuple[int, float]] = dict()  # key -> (gas, stored_at)
+
+    def key_of(self, tx: EthTransaction) -> Optional[GasKey]:
+        """ None for the transactions which call no method, e.g. native transfers """
+        data = tx.input.bytes() if tx.input is not None else b""
+        if not tx.to or len(data) < 4:
+            return None
+        bucket = None if self.__length_bucket is None else len(data) // self.__length_bucket
+        return tx.to.hex().lower(), data[:4].hex(), bucket
+
+    def get(self, tx: EthTransaction) -> Optional[int]:
+        key = self.key_of(tx)
+        if key is None:
+            return None
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > self.__ttl_sec:
+                del self.__entries[key]
+                return None
+            return entry[0]
+
+    def put(self, tx: EthTransaction, gas: int):
+        key = self.key_of(tx)
+        if key is None:
+            return
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and now - entry[1] <= self.__ttl_sec:
+                # merging keeps the first store time, so the ttl bounds the age of the value
+                gas, now = max(gas, entry[0]), entry[1]
+            self.__entries[key] = (gas, now)
+
+    def invalidate(self, tx: EthTransaction):
+        key = self.key_of(tx)
+        if key is None:
+            return
+        with self.__lock:
+            self.__entries.pop(key, None)
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional
+
+from ...logger import global_logger
+
+
+class HeadSnapshot(NamedTuple):
+    latest: int
+    matured: int
+    fetched_at: float  # time.monotonic() of the fetch
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+HeadListener = Callable[[HeadSnapshot], None]
+
+
+class ChainHeadTracker:
+    """ Publishes the latest and matured heights of a chain through an in-memory snapshot.
+
+    The snapshot is refreshed by a background thread once per block period (after "start"), and by any caller
+    that finds it staler than "staleness_sec". Listeners are called whenever the head advances, on the thread which
+    published it, so per-block jobs do not need to poll eth_blockNumber on their own; they must return quickly.
+    """
+
+    def __init__(
+        self,
+        chain_name: str,
+        fetch_latest_height: Callable[[], int],
+        block_aging_period: int,
+        period_sec: float,
+        staleness_sec: float,
+        poll_latest_height: Callable[[], int] = None
+    ):
+        self.__chain_name = chain_name
+        self.__fetch_latest_height = fetch_latest_height
+        self.__poll_latest_height = fetch_latest_height if poll_latest_height is None else poll_latest_height
+        self.__block_aging_period = block_aging_period
+        self.__period_sec = period_sec
+        self.__staleness_sec = staleness_sec
+
+        self.__snapshot: Optional[HeadSnapshot] = None
+        self.__listeners: List[HeadListener] = list()
+        self.__listeners_lock = threading.Lock()
+
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> Optional[HeadSnapshot]:
+        """ the latest published snapshot regardless of its age. """
+        return self.__snapshot
+
+    @property
+    def staleness_sec(self) -> float:
+        return self.__staleness_sec
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def fresh_snapshot(self) -> Optional[HeadSnapshot]:
+        """ the latest snapshot, or None if it is older than the staleness bound. """
+        snapshot = self.__snapshot
+        if snapshot is None or snapshot.age_sec > self.__staleness_sec:
+            return None
+        return snapshot
+
+    def get(self) -> HeadSnapshot:
+        """ return a fresh snapshot, fetching the head synchronously when the published one is stale. """
+        snapshot = self.fresh_snapshot()
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def publish(self, latest_height: int) -> HeadSnapshot:
+        previous = self.__snapshot
+        snapshot = HeadSnapshot(latest_height, latest_height - self.__block_aging_period, time.monotonic())
+        # never move the head backward on a late answer of a lagging node
+        if previous is not None and previous.latest > latest_height:
+            snapshot = HeadSnapshot(previous.latest, previous.matured, snapshot.fetched_at)
+        self.__snapshot = snapshot
+
+        if previous is None or snapshot.latest > previous.latest:
+            with self.__listeners_lock:
+                listeners = list(self.__listeners)
+            for listener in listeners:
+                try:
+                    listener(snapshot)
+                except Exception as e:
+                    global_logger.formatted_log("HeadTracker", related_chain_name=self.__chain_name, msg=str(e))
+        return snapshot
+
+    def refresh(self) -> HeadSnapshot:
+        return self.publish(self.__fetch_latest_height())
+
+    def add_listener(self, listener: HeadListener):
+        with self.__listeners_lock:
+            self.__listeners.append(listener)
+
+    def remove_listener(self, listener: HeadListener):
+        with self.__listeners_lock:
+            if listener in self.__listeners:
+                self.__listeners.remove(listener)
+
+    def start(self):
+        if self.is_running:
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self._run, name="head-tracker-{}".format(self.__chain_name), daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop_event.set()
+
+    def _run(self):
+        while not self.__stop_event.is_set():
+            try:
+                self.publish(self.__poll_latest_height())
+            except Exception as e:
+                global_logger.formatted_log("HeadTracker", related_chain_name=self.__chain_name, msg=str(e))
+            self.__stop_event.wait(self.__period_sec)
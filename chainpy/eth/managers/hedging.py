@@ -0,0 +1,98 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Deque, List, Optional, TypeVar
+
+from .consts import HEDGE_LATENCY_WINDOW, HEDGE_MIN_LATENCY_SAMPLES
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """ Sliding window of the latest latencies per rpc method. """
+
+    def __init__(self, window: int = HEDGE_LATENCY_WINDOW, min_samples: int = HEDGE_MIN_LATENCY_SAMPLES):
+        self.__window = window
+        self.__min_samples = min_samples
+        self.__lock = threading.Lock()
+        self.__samples: Dict[str, Deque[float]] = dict()
+
+    def record(self, method: str, latency_sec: float):
+        with self.__lock:
+            if method not in self.__samples:
+                self.__samples[method] = deque(maxlen=self.__window)
+            self.__samples[method].append(latency_sec)
+
+    def percentile(self, method: str, percentile: float) -> Optional[float]:
+        """ return the latency percentile (0 < percentile < 1), or None until enough samples are collected. """
+        with self.__lock:
+            samples = sorted(self.__samples.get(method, []))
+        if len(samples) < self.__min_samples:
+            return None
+        idx = min(int(len(samples) * percentile), len(samples) - 1)
+        return samples[idx]
+
+
+class RequestHedger:
+    """ Sends a second (hedged) request when the first one is slower than the usual latency of the method.
+
+    The hedge is fired only after the first request has been outstanding for the configured latency percentile
+    of its method, so it adds load to the slowest few percent of the calls only. The first preferred answer wins;
+    the slower request is left to finish in the background and its answer is ignored.
+    """
+
+    def __init__(self, methods: List[str], percentile: float, max_workers: int):
+        self.__methods = set(methods)
+        self.__percentile = percentile
+        self.__latencies = LatencyTracker()
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rpc-hedge")
+
+        self.__lock = threading.Lock()
+        self.hedged_num = 0
+        self.hedge_won_num = 0
+
+    @property
+    def latencies(self) -> LatencyTracker:
+        return self.__latencies
+
+    def is_hedged_method(self, method: str) -> bool:
+        return method in self.__methods
+
+    def hedge_delay(self, method: str) -> Optional[float]:
+        if not self.is_hedged_method(method):
+            return None
+        return self.__latencies.percentile(method, self.__percentile)
+
+    def run(
+        self,
+        primary: Callable[[], T],
+        hedge: Callable[[], T],
+        delay_sec: float,
+        is_preferred: Callable[[T], bool] = lambda result: True
+    ) -> T:
+        """
+        run "primary" and, if it has not answered within "delay_sec", "hedge" as well.
+        the first result satisfying "is_preferred" is returned; otherwise the first result (or error) of both.
+        """
+        first = self.__executor.submit(primary)
+        done, _ = wait([first], timeout=delay_sec)
+        if done:
+            return first.result()
+
+        with self.__lock:
+            self.hedged_num += 1
+        second = self.__executor.submit(hedge)
+
+        pending = {first, second}
+        fallback: Optional[Future] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and is_preferred(future.result()):
+                    if future is second:
+                        with self.__lock:
+                            self.hedge_won_num += 1
+                    return future.result()
+                if fallback is None or (fallback.exception() is not None and future.exception() is None):
+                    fallback = future
+        return fallback.result()
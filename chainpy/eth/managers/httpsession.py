@@ -0,0 +1,108 @@
+import threading
+from typing import Type
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from .utils import RpcConfig
+
+
+class ConnectionStats:
+    """ Thread-safe counters of the connections opened by a pooled rpc session. """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+
+    def add_request(self):
+        with self._lock:
+            self._requests += 1
+
+    def add_new_connection(self):
+        with self._lock:
+            self._new_connections += 1
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def new_connections(self) -> int:
+        return self._new_connections
+
+    @property
+    def reused_connections(self) -> int:
+        """ requests served by a kept-alive connection, i.e. without a new tcp/tls handshake. """
+        return max(self._requests - self._new_connections, 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections
+        }
+
+
+def _counting_pool_class(base: Type[HTTPConnectionPool], stats: ConnectionStats) -> Type[HTTPConnectionPool]:
+    """ build a connection pool class which reports every newly opened connection to the stats. """
+    def _new_conn(self):
+        stats.add_new_connection()
+        return base._new_conn(self)
+
+    return type("Counting" + base.__name__, (base,), {"_new_conn": _new_conn})
+
+
+class RpcHTTPAdapter(HTTPAdapter):
+    """ HTTPAdapter that keeps connections alive and counts new versus reused connections. """
+
+    def __init__(self, stats: ConnectionStats, pool_size: int):
+        self.stats = stats
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats)
+        }
+
+    def send(self, request, *args, **kwargs):
+        self.stats.add_request()
+        return super().send(request, *args, **kwargs)
+
+
+class RpcSession:
+    """ A keep-alive http session shared by every json-rpc call of a single EthRpcClient. """
+
+    def __init__(self, rpc_config: RpcConfig = None):
+        self.__config = RpcConfig() if rpc_config is None else rpc_config
+        self.__stats = ConnectionStats()
+
+        self.__session = requests.Session()
+        adapter = RpcHTTPAdapter(self.__stats, self.__config.pool_size)
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+
+        self.__session.headers.update({"Content-type": "application/json"})
+        if not self.__config.keep_alive:
+            self.__session.headers.update({"Connection": "close"})
+
+    @property
+    def session(self) -> requests.Session:
+        return self.__session
+
+    @property
+    def stats(self) -> ConnectionStats:
+        return self.__stats
+
+    @property
+    def config(self) -> RpcConfig:
+        return self.__config
+
+    def post(self, url: str, body) -> requests.Response:
+        return self.__session.post(url, json=body, timeout=self.__config.timeout)
+
+    def close(self):
+        self.__session.close()
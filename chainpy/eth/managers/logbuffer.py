@@ -0,0 +1,62 @@
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .eventobj import DetectedEvent
+from ..ethtype.receipt import EthLog
+
+if TYPE_CHECKING:
+    from .contracthandler import EthContractHandler
+
+
+class MaturedLogBuffer:
+    """ Holds logs pushed by a node (a subscription or a log filter) until their block is matured.
+
+    The node reports the logs of the blocks produced after the push source was set up ("start_from");
+    the blocks up to it are range-polled once matured instead. Logs withdrawn by a reorg (removed=true)
+    are dropped. "release" advances the handler's latest_height, so the handler must not be polled by others.
+    """
+
+    def __init__(self, handler: "EthContractHandler"):
+        self.__handler = handler
+        self.__lock = threading.Lock()
+        self.__logs: Dict[Tuple[str, int], EthLog] = dict()
+        self.__pushed_from: Optional[int] = None  # the first block whose logs are pushed by the node
+
+    def __len__(self) -> int:
+        return len(self.__logs)
+
+    def start_from(self, head_height: int):
+        """ the push source has been (re)set up while the head was at "head_height" """
+        with self.__lock:
+            self.__pushed_from = head_height + 1
+
+    def add(self, log: EthLog):
+        key = (log.block_hash.hex(), log.log_index)
+        with self.__lock:
+            if log.removed:
+                self.__logs.pop(key, None)
+            elif log.block_number > self.__handler.latest_height:
+                self.__logs[key] = log
+
+    def release(self, head_height: int) -> List[DetectedEvent]:
+        """ return the events matured at "head_height" in chain order """
+        latest_height, matured_height = self.__handler.latest_height, head_height - self.__handler.block_aging_period
+        if matured_height <= latest_height or self.__pushed_from is None:
+            return list()
+
+        polled_height, matured_logs = latest_height, list()
+        if latest_height + 1 < self.__pushed_from:
+            polled_height = min(matured_height, self.__pushed_from - 1)
+            matured_logs += [event.log for event in self.__handler.collect_every_event(latest_height + 1, polled_height)]
+
+        with self.__lock:
+            matured_keys = [key for key, log in self.__logs.items() if log.block_number <= matured_height]
+            for key in matured_keys:
+                log = self.__logs.pop(key)
+                # a polled block may have been pushed as well
+                if log.block_number > polled_height:
+                    matured_logs.append(log)
+            self.__handler.latest_height = matured_height
+
+        matured_logs.sort(key=lambda log: (log.block_number, log.log_index))
+        return self.__handler.detect_events(matured_logs)
@@ -0,0 +1,137 @@
+import asyncio
+import itertools
+import json
+import threading
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+from .consts import WS_HEARTBEAT_SEC, WS_RECONNECT_DELAY_SEC
+from .contracthandler import EthContractHandler
+from .eventobj import DetectedEvent
+from .logbuffer import MaturedLogBuffer
+from .utils import build_log_filter
+from ..ethtype.receipt import EthLog
+from ...logger import global_logger
+
+EventsCallback = Callable[[List[DetectedEvent]], None]
+
+
+class ChainLogSubscriber:
+    """ Streams the events registered in an EthContractHandler over a websocket (eth_subscribe).
+
+    Logs pushed by the "logs" subscription are held in a MaturedLogBuffer, which hands them over to
+    "on_events" in chain order as the "newHeads" subscription reports their block matured. The blocks
+    produced before a (re)connection are range-polled by the buffer, so no event is lost while disconnected.
+    The handler's latest_height is advanced by this subscriber only; do not poll the same handler concurrently.
+    """
+
+    def __init__(
+        self,
+        handler: EthContractHandler,
+        ws_url: str,
+        on_events: EventsCallback,
+        reconnect_delay_sec: float = WS_RECONNECT_DELAY_SEC
+    ):
+        self.__handler = handler
+        self.__ws_url = ws_url
+        self.__on_events = on_events
+        self.__reconnect_delay_sec = reconnect_delay_sec
+
+        self.__buffer = MaturedLogBuffer(handler)
+        self.__request_ids = itertools.count(1)
+
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.connected = False
+
+    @property
+    def chain_name(self) -> str:
+        return self.__handler.chain_name
+
+    @property
+    def buffered_log_num(self) -> int:
+        return len(self.__buffer)
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=lambda: asyncio.run(self._run()), name="log-subscriber-{}".format(self.chain_name), daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop_event.set()
+
+    async def _run(self):
+        while not self.__stop_event.is_set():
+            try:
+                await self._stream()
+            except Exception as e:
+                global_logger.formatted_log("LogSubscriber", related_chain_name=self.chain_name, msg=str(e))
+            self.connected = False
+            await asyncio.sleep(self.__reconnect_delay_sec)
+
+    async def _subscribe(self, ws: aiohttp.ClientWebSocketResponse, params: list) -> int:
+        request_id = next(self.__request_ids)
+        await ws.send_str(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": "eth_subscribe", "params": params}))
+        return request_id
+
+    async def _stream(self):
+        log_filter = build_log_filter(self.__handler.get_emitter_addresses(), self.__handler.get_every_topics())
+        loop = asyncio.get_running_loop()
+
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.__ws_url, heartbeat=WS_HEARTBEAT_SEC) as ws:
+                request_ids = {
+                    await self._subscribe(ws, ["newHeads"]): "newHeads",
+                    await self._subscribe(ws, ["logs", log_filter]): "logs"
+                }
+                subscriptions: Dict[str, str] = dict()
+
+                async for msg in ws:
+                    if self.__stop_event.is_set():
+                        break
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        if msg.type in [aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR]:
+                            break
+                        continue
+                    data = json.loads(msg.data)
+
+                    # the answer of eth_subscribe always precedes its notifications
+                    if data.get("id") in request_ids:
+                        if "result" not in data:
+                            raise Exception("eth_subscribe rejected: {}".format(data.get("error")))
+                        subscriptions[data["result"]] = request_ids[data["id"]]
+                        if len(subscriptions) == len(request_ids):
+                            # subscribed; the earlier blocks are range-polled as they mature
+                            head_height = (await loop.run_in_executor(None, self.__handler.head_tracker.refresh)).latest
+                            self.__buffer.start_from(head_height)
+                            await loop.run_in_executor(None, self._release, head_height)
+                            self.connected = True
+                        continue
+
+                    if data.get("method") != "eth_subscription":
+                        continue
+                    params = data["params"]
+                    kind = subscriptions.get(params["subscription"])
+                    if kind == "logs":
+                        self.__buffer.add(EthLog.from_dict(params["result"]))
+                    elif kind == "newHeads":
+                        await loop.run_in_executor(None, self._on_new_head, int(params["result"]["number"], 16))
+
+    def _on_new_head(self, head_height: int):
+        # a pushed head also serves the head tracker's readers (e.g. the confirmation tracker)
+        self.__handler.head_tracker.publish(head_height)
+        self._release(head_height)
+
+    def _release(self, head_height: int):
+        detected_events = self.__buffer.release(head_height)
+        if detected_events:
+            self.__on_events(detected_events)
@@ -0,0 +1,86 @@
+from typing import List, Tuple, Union
+
+from .consts import MULTICALL3_ADDRESS, DEFAULT_MULTICALL_MAX_CALLS
+from .exceptions import RpcEVMError
+from .rpchandler import EthRpcClient
+from ..ethtype.contract import AbiMethod
+from ..ethtype.hexbytes import EthAddress, EthHexBytes
+
+# aggregate3((address target, bool allowFailure, bytes callData)[]) returns ((bool success, bytes returnData)[])
+AGGREGATE3_ABI = {
+    "type": "function",
+    "name": "aggregate3",
+    "stateMutability": "payable",
+    "inputs": [{
+        "name": "calls", "type": "tuple[]", "components": [
+            {"name": "target", "type": "address"},
+            {"name": "allowFailure", "type": "bool"},
+            {"name": "callData", "type": "bytes"}
+        ]
+    }],
+    "outputs": [{
+        "name": "returnData", "type": "tuple[]", "components": [
+            {"name": "success", "type": "bool"},
+            {"name": "returnData", "type": "bytes"}
+        ]
+    }]
+}
+
+RawCall = Tuple[EthAddress, EthHexBytes]  # (target, encoded call data)
+
+
+class Multicall:
+    """ Aggregates eth_calls into Multicall3 "aggregate3" calls.
+
+    Every call is allowed to fail on its own: its result is then an RpcEVMError carrying the revert data
+    instead of the return data. Calls beyond "max_calls" are split into several aggregate3 calls, which are
+    sent in one batch request against the same block, so every result is read at one consistent height.
+    """
+
+    def __init__(
+        self,
+        rpc_client: EthRpcClient,
+        address: Union[EthAddress, str] = MULTICALL3_ADDRESS,
+        max_calls: int = DEFAULT_MULTICALL_MAX_CALLS
+    ):
+        self.__rpc_client = rpc_client
+        self.__address = address if isinstance(address, EthAddress) else EthAddress(address)
+        self.__max_calls = max_calls
+        self.__aggregate3 = AbiMethod.from_dict(AGGREGATE3_ABI)
+
+    @property
+    def address(self) -> EthAddress:
+        return self.__address
+
+    def _build_call_tx(self, calls: List[RawCall]) -> dict:
+        aggregated_calls = [(target.hex(), True, call_data.bytes()) for target, call_data in calls]
+        data = self.__aggregate3.encode_input_data([aggregated_calls])
+        return {"to": self.__address.with_checksum(), "data": data.hex()}
+
+    def aggregate(self, calls: List[RawCall], height: Union[int, str] = "latest") -> List[Union[EthHexBytes, Exception]]:
+        """ return the return data of each call (or its error), in the order of the calls """
+        if not calls:
+            return list()
+        if height == "latest" and len(calls) > self.__max_calls:
+            # pin the height, so the chunks are evaluated against the same block
+            height = self.__rpc_client.eth_get_latest_block_number()
+
+        chunks = [calls[i:i + self.__max_calls] for i in range(0, len(calls), self.__max_calls)]
+        if len(chunks) == 1:
+            responses = [self.__rpc_client.eth_call(self._build_call_tx(chunks[0]), height)]
+        else:
+            responses = self.__rpc_client.eth_call_batch([self._build_call_tx(chunk) for chunk in chunks], height)
+
+        results = list()
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                results += [response] * len(chunk)
+                continue
+            for success, return_data in self.__aggregate3.decode_output_data(response)[0]:
+                if success:
+                    results.append(EthHexBytes(return_data))
+                else:
+                    results.append(RpcEVMError(
+                        self.__rpc_client.chain_name, "execution reverted: 0x{}".format(return_data.hex())
+                    ))
+        return results
@@ -1,5 +1,7 @@
 import json
-from typing import Optional, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List
 
 from .utils import merge_dict
 from ..ethtype.account import EthAccount
@@ -10,6 +12,7 @@ from ..ethtype.receipt import EthReceipt
 from ..ethtype.transaction import EthTransaction
 from ..managers.contracthandler import DetectedEvent
 from ..managers.ethchainmanager import EthChainManager
+from ...logger import global_logger
 
 
 class MultiChainManager:
@@ -25,17 +28,43 @@ class MultiChainManager:
 
         self._supported_chains = entity_config["supporting_chains"]
 
-        # config for each chain
+        # extra signer lanes of each chain, kept for the account set later on
+        self._signer_configs: Dict[str, tuple] = {
+            chain_name: (
+                multichain_config[chain_name].get("signer_secret_hexes"),
+                multichain_config[chain_name].get("signer_min_balance")
+            )
+            for chain_name in self._supported_chains
+        }
+
+        # config for each chain; chains are connected concurrently so one slow endpoint does not delay the others
         self._chain_managers = dict()
-        for chain_name in self._supported_chains:
-            chain_config = multichain_config[chain_name]
-            chain_manager = EthChainManager.from_config_dict(chain_config)
-            if private_key is not None and private_key != "":
-                chain_manager.set_account(private_key)
-            self._chain_managers[chain_name] = chain_manager
+        self._startup_secs: Dict[str, float] = dict()
+        with ThreadPoolExecutor(max_workers=max(len(self._supported_chains), 1)) as executor:
+            futures = {
+                chain_name: executor.submit(self._init_chain_manager, multichain_config[chain_name], private_key)
+                for chain_name in self._supported_chains
+            }
+            for chain_name in self._supported_chains:
+                self._chain_managers[chain_name], self._startup_secs[chain_name] = futures[chain_name].result()
+
+        for chain_name, startup_sec in self._startup_secs.items():
+            global_logger.formatted_log(
+                "Startup", related_chain_name=chain_name, msg="connected in {:.2f} secs".format(startup_sec)
+            )
 
         self._multichain_config = multichain_config["multichain_config"]
 
+    @staticmethod
+    def _init_chain_manager(chain_config: dict, private_key: Optional[str]) -> (EthChainManager, float):
+        started = time.monotonic()
+        chain_manager = EthChainManager.from_config_dict(chain_config)
+        if private_key is not None and private_key != "":
+            chain_manager.set_account(
+                private_key, chain_config.get("signer_secret_hexes"), chain_config.get("signer_min_balance")
+            )
+        return chain_manager, time.monotonic() - started
+
     @classmethod
     def from_configs(cls, config: dict, private_config: dict):
         merged_config = merge_dict(config, private_config)
@@ -55,7 +84,8 @@ class MultiChainManager:
     def set_account(self, private_key: str):
         for chain_name in self.supported_chain_list:
             chain_manager = self.get_chain_manager_of(chain_name)
-            chain_manager.set_account(private_key)
+            signer_secrets, signer_min_balance = self._signer_configs[chain_name]
+            chain_manager.set_account(private_key, signer_secrets, signer_min_balance)
         self._active_account = EthAccount.from_secret(private_key)
 
     @property
@@ -85,6 +115,11 @@ class MultiChainManager:
     def supported_chain_list(self) -> List[str]:
         return list(self._chain_managers.keys())
 
+    @property
+    def startup_secs(self) -> Dict[str, float]:
+        """ seconds spent to connect each chain on startup """
+        return dict(self._startup_secs)
+
     @property
     def multichain_config(self) -> dict:
         return self._multichain_config
@@ -121,10 +156,12 @@ class MultiChainManager:
     def world_receipt_with_wait(
         self, chain_name: str, tx_hash: EthHashBytes
     ) -> EthReceipt:
+        """ blocks until the receipt; EventBridge polls receipts without waiting, this is kept for external callers """
         chain_manager = self.get_chain_manager_of(chain_name)
         return chain_manager.eth_receipt_with_wait(tx_hash)
 
     def try_replace_transaction(self, chain_name: str, tx_hash: EthHashBytes) -> (EthHashBytes, bool):
+        """ EventBridge bumps its stuck transactions by the TxReplacer; this is kept for external callers """
         chain_manager = self.get_chain_manager_of(chain_name)
         return chain_manager.eth_replace_transaction(tx_hash)
 
@@ -132,9 +169,9 @@ class MultiChainManager:
         chain_manager = self.get_chain_manager_of(chain_name)
         return chain_manager.eth_receipt_without_wait(tx_hash)
 
-    def collect_unchecked_multichain_events(self) -> List[DetectedEvent]:
+    def collect_unchecked_multichain_events(self, chain_names: List[str] = None) -> List[DetectedEvent]:
         unchecked_events = list()
-        for chain_name in self._supported_chains:
+        for chain_name in self._supported_chains if chain_names is None else chain_names:
             chain_manager = self.get_chain_manager_of(chain_name)
             unchecked_events += chain_manager.collect_unchecked_single_chain_events()
         return unchecked_events
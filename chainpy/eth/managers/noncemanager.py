@@ -0,0 +1,158 @@
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .rpchandler import EthRpcClient
+from ..ethtype.hexbytes import EthAddress, EthHashBytes
+
+
+class NonceManager:
+    """ Issues the nonces of one account on one chain.
+
+    The manager seeds itself from the "pending" transaction count and tracks every nonce it hands out:
+    - issued: handed out, but not yet sent
+    - broadcast: sent to the network (the hash is None if the node's answer was lost)
+    - mined: below the "latest" transaction count
+    A nonce released by a caller that could not send its transaction is handed out again before any new one.
+    "sync" (run at most once per "sync_interval_sec" on issue) reconciles with the chain: the first nonce the node has
+    no transaction for (e.g. a dropped one) is released, so the gap is filled by the next send and the transactions
+    queued behind it are mined.
+    """
+    __instances: Dict[Tuple[str, EthAddress], "NonceManager"] = dict()
+    __instances_lock = threading.Lock()
+
+    def __init__(self, rpc_client: EthRpcClient, address: EthAddress, sync_interval_sec: float = None):
+        self.__rpc_client = rpc_client
+        self.__address = address
+        self.__sync_interval_sec = rpc_client.block_period_sec if sync_interval_sec is None else sync_interval_sec
+        # a broadcast transaction unknown to the node after this long is considered dropped
+        self.__drop_grace_sec = rpc_client.tx_commit_time_sec + rpc_client.block_period_sec
+
+        self.__lock = threading.Lock()
+        self.__next_nonce: Optional[int] = None
+        self.__mined_nonce: Optional[int] = None  # the "latest" transaction count, i.e. every lower nonce is mined
+        self.__released: List[int] = list()  # min-heap
+        self.__issued: Dict[int, float] = dict()
+        self.__broadcast: Dict[int, Tuple[Optional[EthHashBytes], float]] = dict()
+        self.__synced_at = 0.0
+
+    @classmethod
+    def of(cls, rpc_client: EthRpcClient, address: EthAddress) -> "NonceManager":
+        """ the manager of the account on the chain of "rpc_client", shared within the process """
+        key = (rpc_client.chain_name, address)
+        with cls.__instances_lock:
+            if key not in cls.__instances:
+                cls.__instances[key] = cls(rpc_client, address)
+            return cls.__instances[key]
+
+    @property
+    def address(self) -> EthAddress:
+        return self.__address
+
+    @property
+    def next_nonce(self) -> Optional[int]:
+        return self.__next_nonce
+
+    @property
+    def mined_nonce(self) -> Optional[int]:
+        return self.__mined_nonce
+
+    @property
+    def released_nonces(self) -> List[int]:
+        with self.__lock:
+            return sorted(self.__released)
+
+    @property
+    def issued_nonces(self) -> List[int]:
+        with self.__lock:
+            return sorted(self.__issued.keys())
+
+    @property
+    def broadcast_nonces(self) -> List[int]:
+        with self.__lock:
+            return sorted(self.__broadcast.keys())
+
+    @property
+    def oldest_broadcast_sec(self) -> float:
+        """ seconds since the oldest broadcast but not yet mined transaction was sent (0 if there is none) """
+        with self.__lock:
+            if not self.__broadcast:
+                return 0.0
+            return time.monotonic() - min(sent_at for _, sent_at in self.__broadcast.values())
+
+    def issue(self) -> int:
+        with self.__lock:
+            if self.__next_nonce is None or time.monotonic() - self.__synced_at >= self.__sync_interval_sec:
+                self._sync()
+
+            if self.__released:
+                nonce = heapq.heappop(self.__released)
+            else:
+                nonce = self.__next_nonce
+                self.__next_nonce += 1
+            self.__issued[nonce] = time.monotonic()
+            return nonce
+
+    def release(self, nonce: int):
+        """ the transaction of the nonce has never reached the network; hand the nonce out again """
+        with self.__lock:
+            self.__issued.pop(nonce, None)
+            self.__broadcast.pop(nonce, None)
+            if nonce not in self.__released and (self.__mined_nonce is None or nonce >= self.__mined_nonce):
+                heapq.heappush(self.__released, nonce)
+
+    def claim(self, nonce: int) -> bool:
+        """ issue the released "nonce" itself; False if it is not released (any more) """
+        with self.__lock:
+            if nonce not in self.__released:
+                return False
+            self.__released.remove(nonce)
+            heapq.heapify(self.__released)
+            self.__issued[nonce] = time.monotonic()
+            return True
+
+    def mark_broadcast(self, nonce: int, tx_hash: Optional[EthHashBytes]):
+        with self.__lock:
+            self.__issued.pop(nonce, None)
+            self.__broadcast[nonce] = (tx_hash, time.monotonic())
+
+    def sync(self):
+        with self.__lock:
+            self._sync()
+
+    def sync_if_due(self):
+        """ sync unless it has been done within "sync_interval_sec" """
+        with self.__lock:
+            if time.monotonic() - self.__synced_at >= self.__sync_interval_sec:
+                self._sync()
+
+    def _sync(self):
+        latest_count = self.__rpc_client.eth_get_user_nonce(self.__address, "latest")
+        pending_count = max(self.__rpc_client.eth_get_user_nonce(self.__address, "pending"), latest_count)
+        now = time.monotonic()
+        self.__synced_at = now
+
+        self.__mined_nonce = latest_count if self.__mined_nonce is None else max(self.__mined_nonce, latest_count)
+        if self.__next_nonce is None or self.__next_nonce < pending_count:
+            # the first sync, or the account has been used by another sender
+            self.__next_nonce = pending_count
+
+        # forget the mined nonces, and the released ones which the node has got a transaction for anyway
+        for nonce in [nonce for nonce in self.__broadcast if nonce < self.__mined_nonce]:
+            del self.__broadcast[nonce]
+        self.__released = [nonce for nonce in self.__released if nonce >= pending_count]
+
+        # the "pending" count stops at the first nonce the node has no transaction for: that one is the gap,
+        # unless it is in flight or has been broadcast only just now. the later nonces may still be queued
+        # behind it on the node (not counted as pending), so they are kept and mined once the gap is filled.
+        released = set(self.__released)
+        gap_nonce = max(self.__mined_nonce, pending_count)
+        if gap_nonce < self.__next_nonce and gap_nonce not in self.__issued and gap_nonce not in released:
+            broadcast = self.__broadcast.get(gap_nonce)
+            if broadcast is None or now - broadcast[1] >= self.__drop_grace_sec:
+                self.__broadcast.pop(gap_nonce, None)
+                released.add(gap_nonce)
+
+        self.__released = list(released)
+        heapq.heapify(self.__released)
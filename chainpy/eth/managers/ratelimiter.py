@@ -0,0 +1,120 @@
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+from .utils import RpcConfig
+
+# relative cost of a call; the other methods cost 1.0
+DEFAULT_METHOD_WEIGHTS: Dict[str, float] = {
+    "eth_getLogs": 5.0,
+    "eth_estimateGas": 3.0,
+    "eth_sendRawTransaction": 3.0,
+    "eth_call": 2.0,
+    "eth_feeHistory": 2.0,
+    "eth_getBlockByNumber": 1.5,
+    "eth_getBlockByHash": 1.5
+}
+
+
+class TokenBucket:
+    """ Token bucket refilled at "rate_per_sec" up to "burst" tokens.
+
+    A caller reserves its tokens at once, even if the bucket goes negative, and then waits exactly until
+    the deficit is refilled; so concurrent callers are served in the order of their reservations.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: float):
+        self.__rate_per_sec = rate_per_sec
+        self.__burst = burst
+        self.__lock = threading.Lock()
+        self.__tokens = burst
+        self.__updated_at = time.monotonic()
+
+        self.throttled_num = 0
+        self.waited_sec = 0.0
+
+    @property
+    def rate_per_sec(self) -> float:
+        return self.__rate_per_sec
+
+    @property
+    def utilization(self) -> float:
+        """ share of the burst in use: 0.0 for a full bucket, 1.0 (or more) for a drained one with waiters """
+        with self.__lock:
+            self._refill(time.monotonic())
+            return (self.__burst - self.__tokens) / self.__burst
+
+    def _refill(self, now: float):
+        self.__tokens = min(self.__burst, self.__tokens + (now - self.__updated_at) * self.__rate_per_sec)
+        self.__updated_at = now
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """ take "cost" tokens and return how long the caller must wait before using them """
+        with self.__lock:
+            self._refill(time.monotonic())
+            self.__tokens -= cost
+            if self.__tokens >= 0:
+                return 0.0
+            wait_sec = -self.__tokens / self.__rate_per_sec
+            self.throttled_num += 1
+            self.waited_sec += wait_sec
+            return wait_sec
+
+    def acquire(self, cost: float = 1.0) -> float:
+        wait_sec = self.reserve(cost)
+        if wait_sec > 0:
+            time.sleep(wait_sec)
+        return wait_sec
+
+
+class RpcRateLimiter:
+    """ One token bucket per rpc endpoint; a call costs the weight of its method (a batch, the sum of its calls). """
+
+    def __init__(self, rate_per_sec: float, burst: Optional[float] = None, method_weights: Dict[str, float] = None):
+        if rate_per_sec <= 0:
+            raise Exception("rate_per_sec must be positive, but {}".format(rate_per_sec))
+        self.__rate_per_sec = rate_per_sec
+        self.__burst = rate_per_sec if burst is None else burst
+        self.__method_weights = dict(DEFAULT_METHOD_WEIGHTS)
+        if method_weights is not None:
+            self.__method_weights.update(method_weights)
+
+        self.__lock = threading.Lock()
+        self.__buckets: Dict[str, TokenBucket] = dict()
+
+    @property
+    def buckets(self) -> Dict[str, TokenBucket]:
+        return dict(self.__buckets)
+
+    @property
+    def utilization(self) -> float:
+        """ the utilization of the busiest endpoint """
+        return max([bucket.utilization for bucket in self.buckets.values()], default=0.0)
+
+    @property
+    def waited_sec(self) -> float:
+        return sum([bucket.waited_sec for bucket in self.buckets.values()])
+
+    def bucket(self, url: str) -> TokenBucket:
+        with self.__lock:
+            if url not in self.__buckets:
+                self.__buckets[url] = TokenBucket(self.__rate_per_sec, self.__burst)
+            return self.__buckets[url]
+
+    def cost(self, body: Union[dict, List[dict]]) -> float:
+        bodies = body if isinstance(body, list) else [body]
+        return sum([self.__method_weights.get(item.get("method"), 1.0) for item in bodies])
+
+    def reserve(self, url: str, body: Union[dict, List[dict]]) -> float:
+        return self.bucket(url).reserve(self.cost(body))
+
+    def acquire(self, url: str, body: Union[dict, List[dict]]) -> float:
+        """ block until the endpoint may take the body; return the seconds waited """
+        return self.bucket(url).acquire(self.cost(body))
+
+
+def build_rate_limiter(rpc_config: RpcConfig) -> Optional[RpcRateLimiter]:
+    """ return the limiter configured by "rate_limit_per_sec", or None if rpc calls are not limited """
+    if rpc_config.rate_limit_per_sec is None:
+        return None
+    return RpcRateLimiter(rpc_config.rate_limit_per_sec, rpc_config.rate_limit_burst, rpc_config.method_weights)
@@ -0,0 +1,110 @@
+import asyncio
+import random
+import sys
+import time
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from json import JSONDecodeError
+from typing import Optional
+
+from requests.exceptions import RequestException
+
+from .consts import (
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_BASE_DELAY_SEC,
+    DEFAULT_RETRY_MAX_DELAY_SEC,
+    DEFAULT_RETRY_DEADLINE_SEC
+)
+from .exceptions import RpcOutOfStatusCode, RpcRateLimited, RpcNodeBehind, RpcEVMError
+
+
+class RpcErrorClass(Enum):
+    TRANSIENT = 1  # connection error, timeout, 5xx or a broken response body
+    RATE_LIMITED = 2  # 429 or a rate-limit error of the provider
+    NODE_BEHIND = 3  # the node has not imported the requested block yet
+    EVM_REVERT = 4
+    FATAL = 5  # anything else, e.g. invalid params or a rejected transaction
+
+
+RETRYABLE_ERROR_CLASSES = {RpcErrorClass.TRANSIENT, RpcErrorClass.RATE_LIMITED, RpcErrorClass.NODE_BEHIND}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """ parse the Retry-After header (delta-seconds or http-date) into seconds """
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """ Decides whether and when a failed rpc call is sent again.
+
+    Retryable errors are retried with exponential backoff and full jitter (a uniform delay up to
+    base * 2^attempt, capped by "max_delay_sec"); a rate-limited call waits at least for its Retry-After.
+    The call gives up once "max_attempts" is reached or the next attempt would start after its deadline.
+    Subclass it and override "classify" or "delay_sec" to plug in a different policy.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS,
+        base_delay_sec: float = DEFAULT_RETRY_BASE_DELAY_SEC,
+        max_delay_sec: float = DEFAULT_RETRY_MAX_DELAY_SEC,
+        deadline_sec: float = DEFAULT_RETRY_DEADLINE_SEC
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self.deadline_sec = deadline_sec
+
+    def classify(self, error: Exception) -> RpcErrorClass:
+        if isinstance(error, RpcRateLimited):
+            return RpcErrorClass.RATE_LIMITED
+        if isinstance(error, RpcOutOfStatusCode):
+            if error.status_code == 429:
+                return RpcErrorClass.RATE_LIMITED
+            if error.status_code is None or error.status_code >= 500:
+                return RpcErrorClass.TRANSIENT
+            return RpcErrorClass.FATAL
+        if isinstance(error, RpcNodeBehind):
+            return RpcErrorClass.NODE_BEHIND
+        if isinstance(error, RpcEVMError):
+            return RpcErrorClass.EVM_REVERT
+        if isinstance(error, (RequestException, JSONDecodeError, asyncio.TimeoutError)):
+            return RpcErrorClass.TRANSIENT
+        # an aiohttp error exists only once the async client has imported aiohttp; the sync path never does
+        aiohttp = sys.modules.get("aiohttp")
+        if aiohttp is not None and isinstance(error, aiohttp.ClientError):
+            return RpcErrorClass.TRANSIENT
+        return RpcErrorClass.FATAL
+
+    def delay_sec(self, error_class: RpcErrorClass, attempt: int, error: Exception) -> float:
+        """ delay before the retry following the "attempt"-th (0-based) failed attempt """
+        delay = random.uniform(0, min(self.max_delay_sec, self.base_delay_sec * 2 ** attempt))
+        if error_class == RpcErrorClass.RATE_LIMITED:
+            retry_after_sec = getattr(error, "retry_after_sec", None)
+            if retry_after_sec is not None:
+                delay = max(delay, retry_after_sec)
+        return delay
+
+    def next_delay(
+        self, error: Exception, attempt: int, elapsed_sec: float, deadline_sec: float = None, max_attempts: int = None
+    ) -> Optional[float]:
+        """ return the delay before the next attempt, or None to give up and raise the error """
+        error_class = self.classify(error)
+        max_attempts = self.max_attempts if max_attempts is None else max_attempts
+        if error_class not in RETRYABLE_ERROR_CLASSES or attempt + 1 >= max_attempts:
+            return None
+
+        deadline_sec = self.deadline_sec if deadline_sec is None else deadline_sec
+        delay = self.delay_sec(error_class, attempt, error)
+        if elapsed_sec + delay > deadline_sec:
+            return None
+        return delay
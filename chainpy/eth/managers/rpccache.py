@@ -0,0 +1,189 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .consts import DEFAULT_RPC_CACHE_MAX_ENTRIES, DEFAULT_RPC_CACHE_TTL_SEC
+
+CACHE_MISS = (False, None)
+
+# methods whose results may become immutable; anything else is never cached
+CACHEABLE_METHODS = {
+    "eth_chainId",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getTransactionByHash",
+    "eth_getTransactionByBlockHashAndIndex",
+    "eth_getTransactionByBlockNumberAndIndex",
+    "eth_getTransactionReceipt",
+    "eth_getLogs"
+}
+
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def add(self, hits: int = 0, misses: int = 0, evictions: int = 0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def to_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class RpcCacheBackend(metaclass=ABCMeta):
+    """ Storage of the rpc response cache. Implementations must be thread-safe and store json-able values. """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """ return (True, value) on a hit, or (False, None) on a miss """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any):
+        pass
+
+
+class LruTtlCache(RpcCacheBackend):
+    """ In-process LRU cache whose entries also expire after "ttl_sec". """
+
+    def __init__(self, max_entries: int = DEFAULT_RPC_CACHE_MAX_ENTRIES, ttl_sec: float = DEFAULT_RPC_CACHE_TTL_SEC):
+        super().__init__()
+        self.__max_entries = max_entries
+        self.__ttl_sec = ttl_sec
+        self.__lock = threading.Lock()
+        self.__entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.stats.add(misses=1)
+                return CACHE_MISS
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.__entries[key]
+                self.stats.add(misses=1, evictions=1)
+                return CACHE_MISS
+            self.__entries.move_to_end(key)
+        self.stats.add(hits=1)
+        return True, value
+
+    def set(self, key: str, value: Any):
+        evicted = 0
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.__ttl_sec, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.stats.add(evictions=evicted)
+
+
+class SqliteCache(RpcCacheBackend):
+    """ LRU/TTL cache in a sqlite file, shared by every relayer process on the host which opens the same path. """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_RPC_CACHE_MAX_ENTRIES,
+        ttl_sec: float = DEFAULT_RPC_CACHE_TTL_SEC
+    ):
+        super().__init__()
+        self.__max_entries = max_entries
+        self.__ttl_sec = ttl_sec
+        self.__lock = threading.Lock()
+
+        self.__conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS rpc_cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.__conn.execute("CREATE INDEX IF NOT EXISTS rpc_cache_accessed ON rpc_cache (accessed_at)")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        # wall-clock time, since entries are shared between processes
+        now = time.time()
+        with self.__lock:
+            row = self.__conn.execute("SELECT value, expires_at FROM rpc_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats.add(misses=1)
+                return CACHE_MISS
+            if row[1] < now:
+                self.__conn.execute("DELETE FROM rpc_cache WHERE key = ?", (key,))
+                self.stats.add(misses=1, evictions=1)
+                return CACHE_MISS
+            self.__conn.execute("UPDATE rpc_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        self.stats.add(hits=1)
+        return True, json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        now = time.time()
+        with self.__lock:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO rpc_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now + self.__ttl_sec, now)
+            )
+            cursor = self.__conn.execute(
+                "DELETE FROM rpc_cache WHERE key IN "
+                "(SELECT key FROM rpc_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.__max_entries,)
+            )
+        if cursor.rowcount > 0:
+            self.stats.add(evictions=cursor.rowcount)
+
+
+def cache_key(chain_name: str, method: str, params: list) -> str:
+    """ the chain name is part of the key since a backend may be shared by clients of several chains. """
+    return json.dumps([chain_name, method, params], sort_keys=True, separators=(",", ":"))
+
+
+def _is_hex_height_at_most(height: Any, max_height: int) -> bool:
+    return isinstance(height, str) and height.startswith("0x") and int(height, 16) <= max_height
+
+
+def is_immutable_result(method: str, params: list, result: Any, matured_height: Optional[int]) -> bool:
+    """
+    whether the result can never change: it is pinned by a block hash, or it lies at or below the matured height.
+    a missing result (None) is never immutable since the object may still appear.
+    """
+    if method not in CACHEABLE_METHODS or result is None:
+        return False
+
+    if method in ["eth_chainId", "eth_getBlockByHash", "eth_getTransactionByBlockHashAndIndex"]:
+        return True
+
+    if matured_height is None:
+        return False
+
+    if method in ["eth_getBlockByNumber", "eth_getTransactionByBlockNumberAndIndex"]:
+        return _is_hex_height_at_most(params[0], matured_height)
+
+    if method in ["eth_getTransactionByHash", "eth_getTransactionReceipt"]:
+        return isinstance(result, dict) and _is_hex_height_at_most(result.get("blockNumber"), matured_height)
+
+    if method == "eth_getLogs":
+        log_filter = params[0]
+        if "blockHash" in log_filter:
+            return True
+        return _is_hex_height_at_most(log_filter.get("fromBlock"), matured_height) \
+            and _is_hex_height_at_most(log_filter.get("toBlock"), matured_height)
+
+    return False
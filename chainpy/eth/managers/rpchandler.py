@@ -1,51 +1,91 @@
+import itertools
 import json
+import math
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from json import JSONDecodeError
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union, TYPE_CHECKING
 
-import requests
-from eth_typing import HexStr
+from eth_keys.datatypes import PrivateKey
 from requests import Response
-from web3 import Web3
-from web3.exceptions import TimeExhausted, TransactionNotFound
-from web3.types import TxReceipt, TxData
+from requests.exceptions import RequestException
 
 from .consts import *
-from .exceptions import raise_integrated_exception, RpcOutOfStatusCode, RpCMaxRetry
-from .utils import merge_dict, hex_height_or_latest
+from .endpointselector import EndpointSelector, RpcEndpoint
+from .exceptions import (
+    raise_integrated_exception, EthAlreadyImported, RpcOutOfStatusCode, RpCMaxRetry, TransactionNotFound,
+    RpcFilterNotFound
+)
+from .headtracker import ChainHeadTracker
+from .hedging import RequestHedger
+from .httpsession import RpcSession, ConnectionStats
+from .ratelimiter import RpcRateLimiter, build_rate_limiter
+from .retrypolicy import RetryPolicy, RpcErrorClass, parse_retry_after
+from .rpccache import (
+    RpcCacheBackend, LruTtlCache, SqliteCache, CACHE_MISS, CACHEABLE_METHODS, cache_key, is_immutable_result
+)
+from .singleflight import SingleFlight, COALESCED_METHODS, request_key
+from .utils import merge_dict, hex_height_or_latest, build_log_filter, RpcConfig
+from ..ethtype.account import EthAccount
 from ..ethtype.amount import EthAmount
 from ..ethtype.block import EthBlock
 from ..ethtype.exceptions import *
 from ..ethtype.hexbytes import EthAddress, EthHashBytes, EthHexBytes
 from ..ethtype.receipt import EthReceipt, EthLog
 from ..ethtype.transaction import EthTransaction
+from ..ethtype.utils import keccak_hash
 from ...logger import global_logger
 from ...prometheus_metric import PrometheusExporter
 
+if TYPE_CHECKING:
+    from web3 import Web3
+
+T = TypeVar("T")
+
+
+def build_request_body(method: str, params: list, request_id: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params,
+        "id": request_id
+    }
+
+
+def extract_result(chain_name: str, response_json: dict) -> Optional[Union[dict, str, list]]:
+    """ return the result of a json-rpc response, or raise the integrated exception of its error. """
+    if "result" in list(response_json.keys()):
+        return response_json["result"]
+
+    # Evm error always gets caught here.
+    PrometheusExporter.exporting_rpc_failed(chain_name=chain_name)
+    if "error" in list(response_json.keys()):
+        raise_integrated_exception(chain_name, error_json=response_json["error"])
+    else:
+        raise Exception("Not handled error on {}: {}".format(chain_name, response_json))
+
 
 class EthRpcClient:
     """ Client class for Ethereum JSON RPC.
 
     The following methods have not yet been implemented
-    - eth_newFilter
-    - eth_getFilterChanges
-    - eth_newBlockFilter
     - eth_getStorageAt
     - eth_getCode
     """
 
     def __init__(
         self,
-        url_with_access_key: str,
+        url_with_access_key: Union[str, List[str]],
         chain_name: str = DEFAULT_CHAIN_NAME,
         receipt_max_try: int = DEFAULT_RECEIPT_MAX_RETRY,
         block_period_sec: int = DEFAULT_BLOCK_PERIOD_SECS,
         block_aging_period: int = DEFAULT_BLOCK_AGING_BLOCKS,
         rpc_server_downtime_allow_sec: int = DEFAULT_RPC_RESEND_DELAY_SEC,
-        transaction_block_delay: int = DEFAULT_RPC_TX_BLOCK_DELAY
+        transaction_block_delay: int = DEFAULT_RPC_TX_BLOCK_DELAY,
+        rpc_config: dict = None
     ):
         self.__chain_name: str = chain_name
-        self.__url_with_access_key = url_with_access_key
         self.__receipt_max_try = DEFAULT_RECEIPT_MAX_RETRY if receipt_max_try is None else receipt_max_try
         self.__block_period_sec = DEFAULT_BLOCK_PERIOD_SECS if block_period_sec is None else block_period_sec
         self.__block_aging_period = DEFAULT_BLOCK_AGING_BLOCKS if block_aging_period is None else block_aging_period
@@ -54,16 +94,66 @@ class EthRpcClient:
         self.__transaction_block_delay = DEFAULT_RPC_TX_BLOCK_DELAY \
             if transaction_block_delay is None else transaction_block_delay
 
+        # keep-alive connection pool shared by every rpc call of this client
+        self.__rpc_config = RpcConfig() if rpc_config is None else RpcConfig.from_dict(rpc_config)
+        self.__session = RpcSession(self.__rpc_config)
+
+        # one or more endpoints of the chain, ranked by latency, error rate and head height
+        self.__selector = self._build_selector(url_with_access_key)
+        self.__hedger = RequestHedger(
+            self.__rpc_config.hedged_methods, self.__rpc_config.hedge_percentile, self.__rpc_config.pool_size
+        )
+
+        self.__request_ids = itertools.count(1)
+        self.__rate_limiter = build_rate_limiter(self.__rpc_config)
+        self.__retry_policy = RetryPolicy(
+            self.__rpc_config.retry_max_attempts,
+            self.__rpc_config.retry_base_delay_sec,
+            self.__rpc_config.retry_max_delay_sec,
+            self.__rpc_config.retry_deadline_sec
+        )
+
+        # every height-dependent call reads the head from this snapshot (always re-fetched without head_tracker)
+        staleness_sec = self.__rpc_config.head_staleness_sec
+        if staleness_sec is None:
+            staleness_sec = self.__block_period_sec if self.__rpc_config.head_tracker else 0
+        self.__head_tracker = ChainHeadTracker(
+            self.__chain_name,
+            self._fetch_latest_height,
+            self.__block_aging_period,
+            self.__block_period_sec,
+            staleness_sec,
+            poll_latest_height=self._poll_latest_height
+        )
+
+        # opt-in cache of the results which can never change (see is_immutable_result)
+        self.__cache: Optional[RpcCacheBackend] = self._build_cache()
+
+        # concurrent identical read calls (e.g. of the monitor and sender threads) share one request
+        self.__single_flight = SingleFlight() if self.__rpc_config.coalesce_requests else None
+
+        # a filter lives on the node which installed it; its calls are never failed over
+        self.__filter_urls: Dict[str, str] = dict()
+
         # for debug and monitoring
         self.call_num = 0
 
-        # check connection
-        self.__chain_id: Optional[int] = None
-        if self.__url_with_access_key:
+        # check connection, unless the chain id is pinned in the config or resolved on first use (lazy_connect)
+        self.__chain_id: Optional[int] = self.__rpc_config.chain_id
+        self.__lazy_lock = threading.Lock()
+        if self.__chain_id is None and not self.__rpc_config.lazy_connect and self.__selector.endpoints:
             resp = self.send_request("eth_chainId", [])
             self.__chain_id = int(resp, 16)
 
-        self.w3 = Web3(Web3.HTTPProvider(url_with_access_key))
+        # web3 is imported and built only if "w3" is used; every rpc call of this client goes through the session
+        self.__w3: Optional["Web3"] = None
+        self.__signer: Optional[EthAccount] = None
+        self.__signers: Dict[EthAddress, EthAccount] = dict()
+        self.__broadcast_lock = threading.Lock()
+        self.__broadcast_executor: Optional[ThreadPoolExecutor] = None
+
+        if self.__rpc_config.head_tracker and self.__selector.endpoints:
+            self.__head_tracker.start()
 
     @classmethod
     def from_config_dict(cls, config: dict, private_config: dict = None):
@@ -78,7 +168,9 @@ class EthRpcClient:
             chain_config.get("receipt_max_try"),
             chain_config.get("block_period_sec"),
             chain_config.get("block_aging_period"),
-            chain_config.get("rpc_server_downtime_allow_sec")
+            chain_config.get("rpc_server_downtime_allow_sec"),
+            chain_config.get("transaction_block_delay"),
+            chain_config.get("rpc_config")
         )
 
     @classmethod
@@ -92,13 +184,56 @@ class EthRpcClient:
                 private_config = json.load(f)
         return cls.from_config_dict(config, private_config)
 
+    def _build_selector(self, url_with_access_key: Union[str, List[str]]) -> EndpointSelector:
+        return EndpointSelector(
+            url_with_access_key,
+            self.__rpc_config.endpoint_failure_cooldown_sec,
+            self.__rpc_config.endpoint_max_lag_blocks
+        )
+
+    def _build_cache(self) -> Optional[RpcCacheBackend]:
+        if not self.__rpc_config.cache:
+            return None
+        if self.__rpc_config.cache_path is not None:
+            return SqliteCache(
+                self.__rpc_config.cache_path, self.__rpc_config.cache_max_entries, self.__rpc_config.cache_ttl_sec
+            )
+        return LruTtlCache(self.__rpc_config.cache_max_entries, self.__rpc_config.cache_ttl_sec)
+
     @property
     def url(self) -> str:
-        return self.__url_with_access_key
+        """ url of the endpoint currently preferred for rpc calls. """
+        primary = self.__selector.primary()
+        return "" if primary is None else primary.url
 
     @url.setter
-    def url(self, url: str):
-        self.__url_with_access_key = url
+    def url(self, url: Union[str, List[str]]):
+        self.__selector = self._build_selector(url)
+        # the broadcast executor is sized by the endpoints; the next broadcast builds one for the new list
+        with self.__broadcast_lock:
+            executor, self.__broadcast_executor = self.__broadcast_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @property
+    def urls(self) -> List[str]:
+        return self.__selector.urls
+
+    @property
+    def endpoint_selector(self) -> EndpointSelector:
+        return self.__selector
+
+    @property
+    def hedger(self) -> RequestHedger:
+        return self.__hedger
+
+    @property
+    def head_tracker(self) -> ChainHeadTracker:
+        return self.__head_tracker
+
+    @property
+    def block_period_sec(self) -> int:
+        return self.__block_period_sec
 
     @property
     def block_aging_period(self) -> int:
@@ -119,73 +254,288 @@ class EthRpcClient:
 
     @property
     def chain_id(self) -> int:
-        """ return chain id emitted by the rpc node. """
+        """ return chain id emitted by the rpc node (or pinned in the config). """
+        if self.__chain_id is None and self.__selector.endpoints:
+            with self.__lazy_lock:
+                if self.__chain_id is None:
+                    self.__chain_id = int(self.send_request("eth_chainId", []), 16)
         return self.__chain_id
 
-    def send_request_base(self, method: str, params: list, cnt: int = 0) -> Response:
+    @property
+    def w3(self) -> "Web3":
+        """ web3 instance sharing the connection pool of this client, built on first use. """
+        if self.__w3 is None:
+            with self.__lazy_lock:
+                if self.__w3 is None:
+                    from web3 import Web3
+                    self.__w3 = Web3(Web3.HTTPProvider(
+                        self.url,
+                        request_kwargs={"timeout": self.__rpc_config.timeout},
+                        session=self.__session.session
+                    ))
+        return self.__w3
+
+    @property
+    def signer(self) -> Optional[EthAccount]:
+        return self.__signer
+
+    @property
+    def signers(self) -> List[EthAccount]:
+        return list(self.__signers.values())
+
+    def set_signer(self, private_key: PrivateKey):
+        """ set the main account, which signs replacement transactions along with the added signers """
+        self.__signer = self.add_signer(private_key)
+
+    def add_signer(self, private_key: PrivateKey) -> EthAccount:
+        """ register an account to sign the replacements of its own transactions """
+        account = EthAccount(private_key)
+        self.__signers[account.address] = account
+        return account
+
+    @property
+    def rpc_config(self) -> RpcConfig:
+        return self.__rpc_config
+
+    @property
+    def cache(self) -> Optional[RpcCacheBackend]:
+        return self.__cache
+
+    @cache.setter
+    def cache(self, backend: Optional[RpcCacheBackend]):
+        """ plug a custom backend (e.g. one shared by several processes), or None to disable caching. """
+        self.__cache = backend
+
+    @property
+    def rate_limiter(self) -> Optional[RpcRateLimiter]:
+        return self.__rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.__retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, policy: RetryPolicy):
+        self.__retry_policy = policy
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        return self.__single_flight
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """ counters of new and reused (kept-alive) connections to the rpc node. """
+        return self.__session.stats
+
+    def _build_request_body(self, method: str, params: list) -> dict:
+        return build_request_body(method, params, next(self.__request_ids))
+
+    def _post(self, body: Union[dict, list], cnt: int = 0, url: str = None) -> Response:
         if cnt > RPC_MAX_RESEND_ITER:
             raise RpCMaxRetry(self.chain_name, "Exceeded max re-try cnt")
 
-        body = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": 1
-        }
-        headers = {'Content-type': 'application/json'}
-
         PrometheusExporter.exporting_rpc_requested(chain_name=self.chain_name)
         self.call_num += 1
 
-        response = requests.post(self.url, json=body, headers=headers)
+        url = self.url if url is None else url
+        if self.__rate_limiter is not None:
+            self.__rate_limiter.acquire(url, body)
+            PrometheusExporter.exporting_rpc_rate_limiter(self.chain_name, self.__rate_limiter)
+
+        response = self.__session.post(url, body)
+        PrometheusExporter.exporting_rpc_connections(self.chain_name, self.connection_stats)
         code = response.status_code
         if code < 200 or 400 < code:
-            raise RpcOutOfStatusCode(self.chain_name, "code({}), msg({})".format(code, response.content))
+            raise RpcOutOfStatusCode(
+                self.chain_name,
+                "code({}), msg({})".format(code, response.content),
+                code,
+                parse_retry_after(response.headers.get("Retry-After"))
+            )
 
         return response
 
-    def send_request(
-        self, method: str, params: list, cnt: int = 0, resend_on_fail: bool = False
-    ) -> Optional[Union[dict, str]]:
-        while True:
+    def send_request_base(self, method: str, params: list, cnt: int = 0) -> Response:
+        return self._post(self._build_request_body(method, params), cnt)
+
+    def _post_with_failover(
+        self, body: Union[dict, list], cnt: int = 0, min_height: int = None
+    ) -> Union[dict, list]:
+        """
+        post the body to the best endpoint and fail over to the next candidate at once on a transport error.
+        a hedged method is also posted to the second-best endpoint once it is slower than its latency percentile.
+        """
+        candidates = self.__selector.candidates(min_height)
+        method = body.get("method") if isinstance(body, dict) else None
+        hedge_delay = self.__hedger.hedge_delay(method)
+        if hedge_delay is None or len(candidates) < 2:
+            return self._post_to_candidates(body, cnt, candidates)
+
+        hedge_candidates = candidates[1:] + candidates[:1]
+        return self.__hedger.run(
+            lambda: self._post_to_candidates(body, cnt, candidates),
+            lambda: self._post_to_candidates(body, cnt, hedge_candidates),
+            hedge_delay,
+            is_preferred=lambda response_json: "result" in response_json
+        )
+
+    def _post_to_candidates(self, body: Union[dict, list], cnt: int, candidates: List[RpcEndpoint]) -> Union[dict, list]:
+        """ the error of the last candidate is raised only when every candidate has failed. """
+        last_error = None
+        for endpoint in candidates:
+            started = time.monotonic()
             try:
-                cnt += 1
-                response = self.send_request_base(method, params, cnt)
-                response_json = response.json()
-                break
-            except RpcOutOfStatusCode or JSONDecodeError as e:
-                # export log for out-of-status error
+                response_json = self._post(body, cnt, endpoint.url).json()
+            except (RpcOutOfStatusCode, RequestException, JSONDecodeError) as e:
+                self.__selector.record_failure(endpoint)
                 PrometheusExporter.exporting_rpc_failed(chain_name=self.chain_name)
-                global_logger.formatted_log("RPCException", related_chain_name=self.__chain_name, msg=str(e))
+                global_logger.formatted_log(
+                    "RPCFailover", related_chain_name=self.__chain_name, msg="{}:{}".format(endpoint.url, str(e))
+                )
+                last_error = e
+                continue
+
+            latency_sec = time.monotonic() - started
+            self.__selector.record_success(endpoint, latency_sec)
+            if isinstance(body, dict):
+                self.__hedger.latencies.record(body["method"], latency_sec)
+                if body["method"] == "eth_blockNumber" and "result" in response_json:
+                    endpoint.record_head(int(response_json["result"], 16))
+            return response_json
+
+        if last_error is None:
+            raise Exception("No rpc endpoint on {}".format(self.chain_name))
+        raise last_error
+
+    def _call_with_retry(self, call: Callable[[int], T], resend_on_fail: bool = False) -> T:
+        """
+        run "call" (given the 0-based attempt number) until it succeeds or the retry policy gives up.
+        "resend_on_fail" extends the deadline of the call to rpc_server_downtime_allow_sec.
+        """
+        policy = self.__retry_policy
+        deadline_sec, max_attempts = policy.deadline_sec, None
+        if resend_on_fail:
+            deadline_sec, max_attempts = max(deadline_sec, self.__rpc_server_downtime_allow_sec), RPC_MAX_RESEND_ITER
 
-                # sleep
-                sleep_notify_msg = "re-tried after {} secs".format(self.__rpc_server_downtime_allow_sec)
-                global_logger.formatted_log("RPCException", related_chain_name=self.__chain_name, msg=sleep_notify_msg)
-                time.sleep(self.__rpc_server_downtime_allow_sec)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return call(attempt)
+            except RpCMaxRetry:
+                raise
+            except Exception as e:
+                delay = policy.next_delay(e, attempt, time.monotonic() - started, deadline_sec, max_attempts)
+                if delay is None:
+                    if isinstance(e, (RequestException, JSONDecodeError)):
+                        raise_integrated_exception(self.chain_name, e)
+                    raise e
 
-                # re-send the request
-                resend_notify_msg = "re-send rpc request: method({}), params({})".format(method, params)
-                global_logger.formatted_log("RPCException", related_chain_name=self.__chain_name, msg=resend_notify_msg)
+                retry_notify_msg = "attempt({}) failed, re-sent after {:.2f} secs: {}".format(attempt + 1, delay, e)
+                global_logger.formatted_log("RPCRetry", related_chain_name=self.__chain_name, msg=retry_notify_msg)
+                time.sleep(delay)
+                attempt += 1
+
+    def _send_body(
+        self, body: Union[dict, list], cnt: int = 0, resend_on_fail: bool = False, min_height: int = None
+    ) -> Union[dict, list]:
+        """ post the json-rpc body (single or batch) and return the decoded response json. """
+        return self._call_with_retry(
+            lambda attempt: self._post_with_failover(body, cnt + attempt + 1, min_height), resend_on_fail
+        )
 
-                if not resend_on_fail:
-                    raise e
+    def _extract_result(self, response_json: dict) -> Optional[Union[dict, str, list]]:
+        return extract_result(self.chain_name, response_json)
+
+    def _cache_lookup(self, method: str, params: list) -> Tuple[bool, Any]:
+        cache = self.__cache
+        if cache is None or method not in CACHEABLE_METHODS:
+            return CACHE_MISS
+        cached = cache.get(cache_key(self.chain_name, method, params))
+        PrometheusExporter.exporting_rpc_cache(self.chain_name, cache.stats)
+        return cached
+
+    def _cache_store(self, method: str, params: list, result: Any):
+        cache = self.__cache
+        if cache is None:
+            return
+        # the last published matured height is enough; it only grows, so a stale one is merely conservative
+        snapshot = self.__head_tracker.snapshot
+        matured_height = None if snapshot is None else snapshot.matured
+        if is_immutable_result(method, params, result, matured_height):
+            cache.set(cache_key(self.chain_name, method, params), result)
 
-            except RpCMaxRetry:
-                raise RpCMaxRetry(self.chain_name, "Exceeded max re-try cnt")
+    def send_request(
+        self, method: str, params: list, cnt: int = 0, resend_on_fail: bool = False, min_height: int = None
+    ) -> Optional[Union[dict, str]]:
+        """ "min_height" restricts the call to endpoints known to have reached that height. """
+        hit, result = self._cache_lookup(method, params)
+        if hit:
+            return result
+
+        if self.__single_flight is None or method not in COALESCED_METHODS:
+            return self._send_request(method, params, cnt, resend_on_fail, min_height)
+        return self.__single_flight.do(
+            request_key(method, params), lambda: self._send_request(method, params, cnt, resend_on_fail, min_height)
+        )
 
-            except Exception as e:
-                # raise not handled exception
-                raise_integrated_exception(self.chain_name, e)
+    def _send_request(
+        self, method: str, params: list, cnt: int, resend_on_fail: bool, min_height: Optional[int]
+    ) -> Optional[Union[dict, str]]:
+        body = self._build_request_body(method, params)
+        # an error answer (e.g. of a node behind the head) is retried as well as a transport error
+        result = self._call_with_retry(
+            lambda attempt: self._extract_result(self._post_with_failover(body, cnt + attempt + 1, min_height)),
+            resend_on_fail
+        )
+        self._cache_store(method, params, result)
+        return result
 
-        if "result" in list(response_json.keys()):
-            return response_json["result"]
+    def send_request_to(self, url: str, method: str, params: list) -> Optional[Union[dict, str, list]]:
+        """ send the request to the endpoint of "url" only (retried, but neither failed over nor cached) """
+        body = self._build_request_body(method, params)
+        return self._call_with_retry(lambda attempt: self._extract_result(self._post(body, attempt + 1, url).json()))
 
-        # Evm error always gets caught here.
-        PrometheusExporter.exporting_rpc_failed(chain_name=self.chain_name)
-        if "error" in list(response_json.keys()):
-            raise_integrated_exception(self.chain_name, error_json=response_json["error"])
-        else:
-            raise Exception("Not handled error on {}: {}".format(self.chain_name, response.content))
+    def send_batch_request(
+        self, calls: List[Tuple[str, list]], resend_on_fail: bool = False
+    ) -> List[Union[dict, str, list, None, Exception]]:
+        """
+        Send several calls as json-rpc 2.0 batches and return their results in the order of the calls.
+        A failed call does not fail the batch; its slot holds the exception mapped by raise_integrated_exception.
+        Batches larger than rpc_config.max_batch_size are split into several round trips.
+        Calls answered by the cache are not sent at all.
+        """
+        results: List[Union[dict, str, list, None, Exception]] = [None] * len(calls)
+        missed_indices = list()
+        for idx, (method, params) in enumerate(calls):
+            hit, result = self._cache_lookup(method, params)
+            if hit:
+                results[idx] = result
+            else:
+                missed_indices.append(idx)
+
+        max_batch_size = self.__rpc_config.max_batch_size
+        for offset in range(0, len(missed_indices), max_batch_size):
+            chunk_indices = missed_indices[offset:offset + max_batch_size]
+            bodies = [self._build_request_body(*calls[idx]) for idx in chunk_indices]
+            response_json = self._send_body(bodies, resend_on_fail=resend_on_fail)
+            if not isinstance(response_json, list):
+                # the node rejected the batch as a whole
+                self._extract_result(response_json)
+                raise Exception("Not handled batch response on {}: {}".format(self.chain_name, response_json))
+
+            responses_by_id = {item.get("id"): item for item in response_json}
+            for idx, body in zip(chunk_indices, bodies):
+                item = responses_by_id.get(body["id"])
+                try:
+                    if item is None:
+                        raise_integrated_exception(self.chain_name, is_none_result=True)
+                    results[idx] = self._extract_result(item)
+                except Exception as e:
+                    results[idx] = e
+                    continue
+                self._cache_store(body["method"], body["params"], results[idx])
+        return results
 
     def amend_height_to_matured_height(self, height: Union[int, str]) -> Union[List[str], str]:
         """
@@ -202,14 +552,36 @@ class EthRpcClient:
         else:
             raise Exception("Invalid type of height: {}".format(height))
 
-    def eth_get_latest_block_number(self, matured_only: bool = False) -> int:
-        """ returns the latest block height. """
+    def _fetch_latest_height(self) -> int:
         resp = self.send_request("eth_blockNumber", [])
-        latest_height = int(resp, 16)
-        return latest_height if not matured_only else latest_height - self.__block_aging_period
+        return int(resp, 16)
 
-    def _get_block(self, method: str, params: list, matured_only: bool = False) -> Optional[EthBlock]:
-        resp = self.send_request(method, params)
+    def _poll_latest_height(self) -> int:
+        """ ask every endpoint for its head, so that lagging endpoints are known, and return the highest one. """
+        endpoints = self.__selector.endpoints
+        if len(endpoints) < 2:
+            return self._fetch_latest_height()
+
+        for endpoint in endpoints:
+            try:
+                self._post_to_candidates(self._build_request_body("eth_blockNumber", []), 1, [endpoint])
+            except Exception:
+                continue
+        best_head_height = self.__selector.best_head_height
+        if best_head_height is None:
+            return self._fetch_latest_height()
+        return best_head_height
+
+    def eth_get_latest_block_number(self, matured_only: bool = False) -> int:
+        """ returns the latest block height, read from the head snapshot while it is fresh. """
+        snapshot = self.__head_tracker.get()
+        return snapshot.latest if not matured_only else snapshot.matured
+
+    def _get_block(
+        self, method: str, params: list, matured_only: bool = False, min_height: int = None
+    ) -> Optional[EthBlock]:
+        """ "min_height" (the height of a block requested by number) skips the endpoints lagging behind it """
+        resp = self.send_request(method, params, min_height=min_height)
         if resp is None:
             return resp
 
@@ -219,9 +591,30 @@ class EthRpcClient:
 
         return block
 
+    def _decode_batch_results(
+        self, results: list, decoder: Callable[[dict], Any], height_of: Callable[[Any], int], matured_only: bool
+    ) -> list:
+        """ decode each result of a batch, keeping the failed (exception) or empty (None) slots as they are. """
+        matured_max_height = self.eth_get_latest_block_number(matured_only=True) if matured_only else None
+
+        decoded = list()
+        for result in results:
+            if result is None or isinstance(result, Exception):
+                decoded.append(result)
+                continue
+            item = decoder(result)
+            if matured_only and height_of(item) >= matured_max_height:
+                item = None
+            decoded.append(item)
+        return decoded
+
     def eth_get_latest_block(self, verbose: bool = False, matured_only: bool = False) -> EthBlock:
         latest_height = self.eth_get_latest_block_number(matured_only)
-        return self._get_block("eth_getBlockByNumber", [hex(latest_height), verbose])
+        block = self._get_block("eth_getBlockByNumber", [hex(latest_height), verbose], min_height=latest_height)
+        if block is None and not matured_only:
+            # no endpoint is known to have reached the published head yet; the head of the endpoint will do
+            block = self._get_block("eth_getBlockByNumber", ["latest", verbose])
+        return block
 
     def eth_get_block_by_hash(
         self, block_hash: EthHashBytes, verbose: bool = False, matured_only: bool = False
@@ -234,7 +627,16 @@ class EthRpcClient:
         self, height: Union[int, str] = "latest", verbose: bool = False, matured_only: bool = False
     ) -> Optional[EthBlock]:
         height_hex_or_latest = hex_height_or_latest(height)
-        return self._get_block("eth_getBlockByNumber", [height_hex_or_latest, verbose], matured_only)
+        min_height = int(height_hex_or_latest, 16) if height_hex_or_latest.startswith("0x") else None
+        return self._get_block("eth_getBlockByNumber", [height_hex_or_latest, verbose], matured_only, min_height)
+
+    def eth_get_block_by_height_batch(
+        self, heights: List[Union[int, str]], verbose: bool = False, matured_only: bool = False
+    ) -> List[Union[EthBlock, None, Exception]]:
+        """ batch variant of eth_get_block_by_height; fetches every block in a single round trip. """
+        calls = [("eth_getBlockByNumber", [hex_height_or_latest(height), verbose]) for height in heights]
+        results = self.send_batch_request(calls)
+        return self._decode_batch_results(results, EthBlock.from_dict, lambda block: block.number, matured_only)
 
     def _get_transaction(self, method: str, params: list, matured_only: bool = False) -> Optional[EthTransaction]:
         resp = self.send_request(method, params)
@@ -251,6 +653,16 @@ class EthRpcClient:
             raise EthTypeError(EthHashBytes, type(tx_hash))
         return self._get_transaction("eth_getTransactionByHash", [tx_hash.hex()], matured_only)
 
+    def eth_get_transaction_by_hash_batch(
+        self, tx_hashes: List[EthHashBytes], matured_only: bool = False
+    ) -> List[Union[EthTransaction, None, Exception]]:
+        """ batch variant of eth_get_transaction_by_hash; fetches every transaction in a single round trip. """
+        for tx_hash in tx_hashes:
+            if not isinstance(tx_hash, EthHashBytes):
+                raise EthTypeError(EthHashBytes, type(tx_hash))
+        results = self.send_batch_request([("eth_getTransactionByHash", [tx_hash.hex()]) for tx_hash in tx_hashes])
+        return self._decode_batch_results(results, EthTransaction.from_dict, lambda tx: tx.block_number, matured_only)
+
     def eth_get_transaction_by_height_and_index(self, height: int, tx_index: int, matured_only: bool = False) -> Optional[EthTransaction]:
         if not isinstance(height, int):
             raise EthTypeError(int, type(height))
@@ -280,29 +692,65 @@ class EthRpcClient:
     def eth_receipt_without_wait(self, tx_hash: EthHashBytes, matured_only: bool = False) -> Optional[EthReceipt]:
         return self._get_receipt(tx_hash, matured_only)
 
-    def eth_receipt_with_wait(self, tx_hash: EthHashBytes) -> Optional[TxReceipt]:
-        try:
-            return self.w3.eth.wait_for_transaction_receipt(transaction_hash=tx_hash, timeout=self.__block_period_sec)
-        except TimeExhausted:
-            return None
+    def eth_receipt_without_wait_batch(
+        self, tx_hashes: List[EthHashBytes], matured_only: bool = False
+    ) -> List[Union[EthReceipt, None, Exception]]:
+        """ batch variant of eth_receipt_without_wait; fetches every receipt in a single round trip. """
+        results = self.send_batch_request([("eth_getTransactionReceipt", [tx_hash.hex()]) for tx_hash in tx_hashes])
+        return self._decode_batch_results(
+            results, EthReceipt.from_dict, lambda receipt: receipt.block_number, matured_only
+        )
+
+    def eth_receipt_with_wait(
+        self, tx_hash: EthHashBytes, timeout_sec: float = None, poll_interval_sec: float = RECEIPT_POLL_INTERVAL_SEC
+    ) -> Optional[EthReceipt]:
+        """ poll the receipt until it is found or "timeout_sec" (a block period by default) elapses. """
+        timeout_sec = self.__block_period_sec if timeout_sec is None else timeout_sec
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            receipt = self._get_receipt(tx_hash)
+            if receipt is not None:
+                return receipt
+            remaining_sec = deadline - time.monotonic()
+            if remaining_sec <= 0:
+                return None
+            time.sleep(min(poll_interval_sec, remaining_sec))
 
     def eth_replace_transaction(self, tx_hash: EthHashBytes) -> (EthHashBytes, bool):
-        try:
-            transaction: TxData = self.w3.eth.get_transaction(transaction_hash=HexStr(tx_hash.hex()))
-            if transaction['blockHash'] is None:
-                new_tx_hash = self.w3.eth.replace_transaction(transaction_hash=tx_hash, new_transaction={
-                    'to': transaction['to'],
-                    'from': transaction['from'],
-                    'value': transaction['value'],
-                    'data': transaction['input'],
-                    'gas': transaction['gas']
-                })
-                return EthHashBytes(new_tx_hash.hex()), True
-            else:
-                return tx_hash, False
+        """
+        re-send a pending transaction of the signer with the same nonce and its fees bumped by
+        REPLACEMENT_FEE_BUMP_RATE (or raised to the current network fees, whichever is higher).
+        returns the original hash and False if the transaction has already been mined.
+        """
+        resp = self.send_request("eth_getTransactionByHash", [tx_hash.hex()])
+        if resp is None:
+            raise TransactionNotFound(self.chain_name, "Undone action lost in txpool: {}".format(tx_hash.hex()))
+        if resp.get("blockHash") is not None:
+            return tx_hash, False
+
+        signer = self.__signers.get(EthAddress(resp["from"]))
+        if signer is None:
+            raise Exception("No signer of {} to replace the transaction on {}".format(resp["from"], self.chain_name))
 
-        except TransactionNotFound:
-            raise Exception(f"Undone action lost in txpool.")
+        def bump(fee_hex: str) -> int:
+            return math.ceil(int(fee_hex, 16) * REPLACEMENT_FEE_BUMP_RATE)
+
+        replacement = EthTransaction.init(
+            self.chain_id, EthAddress(resp["to"]), EthAmount(int(resp["value"], 16)), EthHexBytes(resp["input"])
+        )
+        replacement.set_nonce(int(resp["nonce"], 16)).set_gas_limit(int(resp["gas"], 16))
+        if resp.get("maxFeePerGas") is not None:
+            priority_fee = max(bump(resp["maxPriorityFeePerGas"]), self.eth_get_priority_fee_per_gas())
+            base_fee = self.eth_get_next_base_fee()
+            max_fee = max(bump(resp["maxFeePerGas"]), priority_fee + (0 if base_fee is None else base_fee))
+            replacement.set_gas_prices(max_fee, priority_fee)
+        else:
+            replacement.set_gas_price(max(bump(resp["gasPrice"]), self.eth_get_gas_price()))
+        if resp.get("accessList"):
+            replacement.set_access_list(resp["accessList"])
+
+        signed_raw_tx = replacement.sign_transaction(signer)
+        return self.eth_send_raw_transaction(signed_raw_tx), True
 
     def eth_get_logs(
         self,
@@ -316,28 +764,67 @@ class EthRpcClient:
 
         amended_block_nums = [self.amend_height_to_matured_height(height) for height in [from_block, to_block]]
 
-        topic_hexes = list()
-        for topic in topics:
-            if isinstance(topic, list):
-                item = list()
-                for tp in topic:
-                    item.append(tp.hex())
-                topic_hexes.append(item)
-            else:
-                topic_hexes.append(topic.hex())
-
-        params: list = [{
-            "fromBlock": amended_block_nums[0],
-            "toBlock": amended_block_nums[1],
-            "address": [address.with_checksum() for address in addresses],
-            "topics": topic_hexes
-        }]
-        resp = self.send_request("eth_getLogs", params)
+        params: list = [build_log_filter(addresses, topics, amended_block_nums[0], amended_block_nums[1])]
+        # lagging endpoints have not indexed the range yet
+        resp = self.send_request("eth_getLogs", params, min_height=int(amended_block_nums[1], 16))
         try:
             return [EthLog.from_dict(log) for log in resp]
         except KeyError:
             raise RpcExceedRequestTime("Node: getLog time out")
 
+    # **************************************** filter ************************************************
+    def _install_filter(self, method: str, params: list) -> str:
+        """ install the filter on the first endpoint which answers; its changes are polled from that endpoint only """
+        last_error = None
+        for endpoint in self.__selector.candidates():
+            try:
+                filter_id = self.send_request_to(endpoint.url, method, params)
+            except Exception as e:
+                if not self.is_unanswered(e):
+                    raise
+                self.__selector.record_failure(endpoint)
+                last_error = e
+                continue
+            self.__filter_urls[filter_id] = endpoint.url
+            return filter_id
+
+        if last_error is None:
+            raise Exception("No rpc endpoint on {}".format(self.chain_name))
+        raise last_error
+
+    def eth_new_filter(
+        self, addresses: List[EthAddress], topics: List[Union[EthHashBytes, List[EthHashBytes]]]
+    ) -> str:
+        """ install a log filter on the first endpoint which answers; its changes are the logs of the blocks imported since """
+        return self._install_filter("eth_newFilter", [build_log_filter(addresses, topics)])
+
+    def eth_new_block_filter(self) -> str:
+        """ install a block filter on the first endpoint which answers; its changes are the hashes of the new blocks """
+        return self._install_filter("eth_newBlockFilter", [])
+
+    def eth_get_filter_changes(self, filter_id: str) -> List[Union[EthLog, EthHashBytes]]:
+        """
+        the logs (or block hashes) since the last poll.
+        raises RpcFilterNotFound once the filter has expired, or once the endpoint holding it stops answering.
+        """
+        url = self.__filter_urls.get(filter_id, self.url)
+        try:
+            resp = self.send_request_to(url, "eth_getFilterChanges", [filter_id])
+        except Exception as e:
+            if not self.is_unanswered(e):
+                raise
+            # the filter is lost with its endpoint; it is reinstalled on another one as an expired filter is
+            self.__filter_urls.pop(filter_id, None)
+            for endpoint in self.__selector.endpoints:
+                if endpoint.url == url:
+                    self.__selector.record_failure(endpoint)
+            raise RpcFilterNotFound(self.chain_name, "The endpoint of filter {} is unanswered: {}".format(filter_id, e))
+        return [EthHashBytes(item) if isinstance(item, str) else EthLog.from_dict(item) for item in resp]
+
+    def eth_uninstall_filter(self, filter_id: str) -> bool:
+        url = self.__filter_urls.pop(filter_id, self.url)
+        return self.send_request_to(url, "eth_uninstallFilter", [filter_id])
+
     # **************************************** fee data ************************************************
     def eth_get_priority_fee_per_gas(self) -> int:
         resp = self.send_request("eth_maxPriorityFeePerGas", [])
@@ -360,15 +847,39 @@ class EthRpcClient:
         next_base_fee = current_base_fee * (1 + gas_change_rate)
         return int(next_base_fee)
 
+    def eth_fee_history(
+        self, block_count: int, newest_height: Union[int, str] = "latest", reward_percentiles: List[float] = None
+    ) -> dict:
+        """ base fees (one more than the blocks, for the next block), gas used ratios and rewards of the blocks """
+        reward_percentiles = list() if reward_percentiles is None else reward_percentiles
+        return self.send_request(
+            "eth_feeHistory", [hex(block_count), hex_height_or_latest(newest_height), reward_percentiles]
+        )
+
     def eth_get_gas_price(self) -> int:
         resp = self.send_request("eth_gasPrice", [])
         return int(resp, 16)
 
     # **************************************** basic method ************************************************
-    def eth_call(self, call_tx: dict) -> EthHexBytes:
-        resp = self.send_request('eth_call', [call_tx, "latest"])
+    def eth_call(self, call_tx: dict, height: Union[int, str] = "latest") -> EthHexBytes:
+        resp = self.send_request('eth_call', [call_tx, hex_height_or_latest(height)])
         return EthHexBytes(resp)
 
+    def eth_call_batch(
+        self, call_txs: List[dict], height: Union[int, str] = "latest"
+    ) -> List[Union[EthHexBytes, Exception]]:
+        """ batch variant of eth_call; every call is evaluated against the same block in a single round trip. """
+        height_hex_or_latest = hex_height_or_latest(height)
+        results = self.send_batch_request([("eth_call", [call_tx, height_hex_or_latest]) for call_tx in call_txs])
+        return [result if isinstance(result, Exception) else EthHexBytes(result) for result in results]
+
+    def eth_create_access_list(self, call_tx: dict, height: Union[int, str] = "latest") -> Tuple[list, int]:
+        """ the access list of the call, and the gas the call uses with that list """
+        resp = self.send_request("eth_createAccessList", [call_tx, hex_height_or_latest(height)])
+        if resp.get("error"):
+            raise_integrated_exception(self.chain_name, error_json={"message": resp["error"]})
+        return resp["accessList"], int(resp["gasUsed"], 16)
+
     def eth_estimate_gas(self, tx: dict):
         resp = self.send_request("eth_estimateGas", [tx, "latest"])
         return int(resp, 16)
@@ -392,6 +903,119 @@ class EthRpcClient:
         resp = self.send_request("eth_getTransactionCount", [address.hex(), height_hex_or_latest])
         return int(resp, 16)
 
+    def is_unanswered(self, error: Exception) -> bool:
+        """ whether the request failed without an answer of a node, e.g. on a timeout (checking the wrapped error too) """
+        if isinstance(error, RpCMaxRetry):
+            return True
+        return any(
+            cause is not None and self.__retry_policy.classify(cause) == RpcErrorClass.TRANSIENT
+            for cause in (error, error.__context__)
+        )
+
+    def _try_send_raw_transaction(self, url: Optional[str], signed_serialized_tx: EthHexBytes) -> Optional[Exception]:
+        """ the error of the broadcast to the endpoint of "url" (any endpoint if None); None if it is accepted """
+        params = [signed_serialized_tx.hex()]
+        try:
+            if url is None:
+                self.send_request("eth_sendRawTransaction", params)
+            else:
+                self.send_request_to(url, "eth_sendRawTransaction", params)
+        except EthAlreadyImported:
+            pass
+        except Exception as e:
+            return e
+        return None
+
+    def _try_send_raw_transactions(
+        self, url: Optional[str], signed_serialized_txs: List[EthHexBytes]
+    ) -> List[Optional[Exception]]:
+        """ batch variant of _try_send_raw_transaction; a failed round trip fails every transaction of it """
+        errors: List[Optional[Exception]] = list()
+        max_batch_size = self.__rpc_config.max_batch_size
+        for offset in range(0, len(signed_serialized_txs), max_batch_size):
+            chunk = signed_serialized_txs[offset:offset + max_batch_size]
+            bodies = [self._build_request_body("eth_sendRawTransaction", [tx.hex()]) for tx in chunk]
+            try:
+                if url is None:
+                    response_json = self._send_body(bodies)
+                else:
+                    response_json = self._call_with_retry(lambda attempt: self._post(bodies, attempt + 1, url).json())
+                if not isinstance(response_json, list):
+                    # the node rejected the batch as a whole
+                    self._extract_result(response_json)
+                    raise Exception("Not handled batch response on {}: {}".format(self.chain_name, response_json))
+            except Exception as e:
+                errors.extend([e] * len(chunk))
+                continue
+
+            responses_by_id = {item.get("id"): item for item in response_json}
+            for body in bodies:
+                item = responses_by_id.get(body["id"])
+                try:
+                    if item is None:
+                        raise_integrated_exception(self.chain_name, is_none_result=True)
+                    self._extract_result(item)
+                except EthAlreadyImported:
+                    pass
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                errors.append(None)
+        return errors
+
+    def _broadcast_error_of(self, errors: Iterable[Optional[Exception]]) -> Optional[Exception]:
+        """ None if an endpoint has accepted the transaction, else a rejection in preference to a transport error """
+        rejection, transport_error = None, None
+        for error in errors:
+            if error is None:
+                return None
+            if self.is_unanswered(error):
+                transport_error = error
+            else:
+                rejection = error
+        return rejection if rejection is not None else transport_error
+
+    def _broadcast_to_urls(self, fn: Callable[[str], T]) -> List[Future]:
+        urls = self.urls
+        with self.__broadcast_lock:
+            if self.__broadcast_executor is None:
+                self.__broadcast_executor = ThreadPoolExecutor(
+                    max_workers=len(urls), thread_name_prefix="rpc-broadcast-{}".format(self.chain_name)
+                )
+            return [self.__broadcast_executor.submit(fn, url) for url in urls]
+
     def eth_send_raw_transaction(self, signed_serialized_tx: EthHexBytes) -> EthHashBytes:
-        resp = self.send_request("eth_sendRawTransaction", [signed_serialized_tx.hex()])
-        return EthHashBytes(resp)
+        """
+        broadcast the signed transaction to every endpoint at once and return its hash, computed locally.
+        an endpoint which already knows the transaction counts as accepting it. unless an endpoint accepts it,
+        the rejection of a node is raised, or the transport error if no node has answered.
+        """
+        tx_hash = keccak_hash(signed_serialized_tx)
+        if len(self.urls) < 2:
+            errors = iter([self._try_send_raw_transaction(None, signed_serialized_tx)])
+        else:
+            futures = self._broadcast_to_urls(lambda url: self._try_send_raw_transaction(url, signed_serialized_tx))
+            # the first acceptance ends the wait for the other endpoints
+            errors = (future.result() for future in as_completed(futures))
+
+        error = self._broadcast_error_of(errors)
+        if error is not None:
+            raise error
+        return tx_hash
+
+    def eth_send_raw_transactions(self, signed_serialized_txs: List[EthHexBytes]) -> List[Union[EthHashBytes, Exception]]:
+        """
+        batch variant of eth_send_raw_transaction: the batch goes to every endpoint at once, and each result is
+        the local hash of the transaction, or the error chosen as eth_send_raw_transaction raises it.
+        """
+        if len(self.urls) < 2:
+            errors_by_endpoint = [self._try_send_raw_transactions(None, signed_serialized_txs)]
+        else:
+            futures = self._broadcast_to_urls(lambda url: self._try_send_raw_transactions(url, signed_serialized_txs))
+            errors_by_endpoint = [future.result() for future in futures]
+
+        results: List[Union[EthHashBytes, Exception]] = list()
+        for idx, signed_serialized_tx in enumerate(signed_serialized_txs):
+            error = self._broadcast_error_of(errors[idx] for errors in errors_by_endpoint)
+            results.append(keccak_hash(signed_serialized_tx) if error is None else error)
+        return results
@@ -0,0 +1,109 @@
+import threading
+import time
+from typing import List, Optional
+
+from .noncemanager import NonceManager
+from .rpchandler import EthRpcClient
+from ..ethtype.account import EthAccount
+from ..ethtype.amount import EthAmount
+from ...logger import global_logger
+from ...prometheus_metric import PrometheusExporter
+
+
+class SignerLane:
+    """ One signer account of a chain, with its own nonce stream. """
+
+    def __init__(self, rpc_client: EthRpcClient, account: EthAccount):
+        self.account = account
+        self.nonce_manager = NonceManager.of(rpc_client, account.address)
+        self.balance: Optional[EthAmount] = None
+        self.assigned_num = 0
+
+    @property
+    def stalled_sec(self) -> float:
+        """ how long the oldest transaction of the lane has been waiting to be mined """
+        return self.nonce_manager.oldest_broadcast_sec
+
+
+class SignerPool:
+    """ Assigns the transactions of a chain to several signer accounts (lanes) in round robin.
+
+    Each lane has its own nonce manager, so a stuck transaction delays its own lane only. Lanes whose
+    oldest transaction has waited longer than "stall_sec", or whose balance (refreshed in one batch request
+    at most once per block period) is below "min_balance", are skipped while a healthy lane is left.
+    A lane is synced with the chain before it is judged stalled, so it comes back once its transactions are mined.
+    """
+
+    def __init__(
+        self,
+        rpc_client: EthRpcClient,
+        accounts: List[EthAccount],
+        min_balance: Optional[int] = None,
+        stall_sec: float = None
+    ):
+        if not accounts:
+            raise Exception("A signer pool needs at least one account")
+        self.__rpc_client = rpc_client
+        self.__lanes = [SignerLane(rpc_client, account) for account in accounts]
+        self.__min_balance = min_balance
+        self.__stall_sec = rpc_client.tx_commit_time_sec + rpc_client.block_period_sec if stall_sec is None else stall_sec
+
+        self.__lock = threading.Lock()
+        self.__next_idx = 0
+        self.__balances_updated_at: Optional[float] = None
+
+    @property
+    def lanes(self) -> List[SignerLane]:
+        return list(self.__lanes)
+
+    def lane_of(self, account: EthAccount) -> Optional[SignerLane]:
+        for lane in self.__lanes:
+            if lane.account.address == account.address:
+                return lane
+        return None
+
+    def is_healthy(self, lane: SignerLane) -> bool:
+        if lane.stalled_sec > self.__stall_sec:
+            # nothing is issued on a skipped lane; sync it so its mined transactions stop counting as stalled
+            try:
+                lane.nonce_manager.sync_if_due()
+            except Exception as e:
+                global_logger.formatted_log("SignerPool", related_chain_name=self.__rpc_client.chain_name, msg=str(e))
+            if lane.stalled_sec > self.__stall_sec:
+                return False
+        if self.__min_balance is not None and lane.balance is not None and lane.balance.int() < self.__min_balance:
+            return False
+        return True
+
+    def refresh_balances(self):
+        results = self.__rpc_client.send_batch_request(
+            [("eth_getBalance", [lane.account.address.hex(), "latest"]) for lane in self.__lanes]
+        )
+        for lane, result in zip(self.__lanes, results):
+            if isinstance(result, Exception):
+                global_logger.formatted_log("SignerPool", related_chain_name=self.__rpc_client.chain_name, msg=str(result))
+                continue
+            lane.balance = EthAmount(result)
+            PrometheusExporter.exporting_signer_balance(
+                self.__rpc_client.chain_name, lane.account.address.hex(), lane.balance.float_str
+            )
+        self.__balances_updated_at = time.monotonic()
+
+    def next_lane(self) -> SignerLane:
+        """ the next healthy lane in round robin, or simply the next one if no lane is healthy """
+        if len(self.__lanes) == 1:
+            return self.__lanes[0]
+
+        updated_at = self.__balances_updated_at
+        if self.__min_balance is not None and (
+            updated_at is None or time.monotonic() - updated_at >= self.__rpc_client.block_period_sec
+        ):
+            self.refresh_balances()
+
+        with self.__lock:
+            lane_num = len(self.__lanes)
+            candidates = [self.__lanes[(self.__next_idx + i) % lane_num] for i in range(lane_num)]
+            lane = next((lane for lane in candidates if self.is_healthy(lane)), candidates[0])
+            self.__next_idx = (self.__lanes.index(lane) + 1) % lane_num
+            lane.assigned_num += 1
+            return lane
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+# read-only methods whose concurrent identical calls are answered by a single request
+COALESCED_METHODS = {
+    "eth_chainId",
+    "eth_blockNumber",
+    "eth_getBalance",
+    "eth_getTransactionCount",
+    "eth_call",
+    "eth_estimateGas",
+    "eth_gasPrice",
+    "eth_maxPriorityFeePerGas",
+    "eth_feeHistory",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+    "eth_getLogs"
+}
+
+
+def request_key(method: str, params: list) -> str:
+    return json.dumps([method, params], sort_keys=True, separators=(",", ":"))
+
+
+class SingleFlight:
+    """ Deduplicates identical in-flight calls among threads.
+
+    The first caller of a key (the leader) runs the call; callers arriving while it is in flight wait on its
+    future and get the same result or exception. The key is forgotten as soon as the call completes,
+    so nothing is cached beyond the lifetime of a single request.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls: Dict[str, Future] = dict()
+        self.shared_num = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self.__lock:
+            future = self.__calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self.__calls[key] = future
+            else:
+                self.shared_num += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+
+class AsyncSingleFlight:
+    """ The asyncio counterpart of SingleFlight; a call is shared by the coroutines of one event loop. """
+
+    def __init__(self):
+        self.__calls: Dict[str, asyncio.Future] = dict()
+        self.shared_num = 0
+
+    async def do(self, key: str, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self.__calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_fn())
+            self.__calls[key] = task
+            task.add_done_callback(lambda _: self.__calls.pop(key, None))
+        else:
+            self.shared_num += 1
+        # a cancelled waiter must not cancel the call shared with the others
+        return await asyncio.shield(task)
@@ -0,0 +1,219 @@
+import copy
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .consts import DEFAULT_FEE_UPDATE_BLOCKS, REPLACEMENT_FEE_BUMP_RATE
+from .exceptions import NonceTooLow, ReplaceTransactionUnderpriced, TransactionNotFound
+from .noncemanager import NonceManager
+from ..ethtype.account import EthAccount
+from ..ethtype.amount import EthAmount
+from ..ethtype.hexbytes import EthHashBytes
+from ..ethtype.transaction import EthTransaction
+from ..ethtype.utils import keccak_hash
+from ...logger import global_logger
+
+if TYPE_CHECKING:
+    from .ethchainmanager import EthChainManager
+
+
+class PendingTx:
+    """ Every transaction sent with one nonce of one account: the original and its replacements. """
+
+    def __init__(self, tx: EthTransaction, account: EthAccount, nonce_manager: NonceManager, tx_hash: EthHashBytes):
+        self.tx = tx
+        self.account = account
+        self.nonce_manager = nonce_manager
+        self.hashes: List[EthHashBytes] = [tx_hash]
+        self.original_fees: Tuple[int, int] = PendingTx.fees_of(tx)
+        self.step = 0
+        self.sent_at = time.monotonic()
+
+    @property
+    def nonce(self) -> int:
+        return self.tx.nonce
+
+    @staticmethod
+    def fees_of(tx: EthTransaction) -> Tuple[int, int]:
+        """ (max fee, priority fee) of a type2 transaction, or (gas price, 0) """
+        if tx.type == 2:
+            return tx.max_fee_per_gas, tx.max_priority_fee_per_gas
+        return tx.gas_price, 0
+
+
+class TxReplacer:
+    """ Re-sends the pending transactions of a chain with the same nonce and bumped fees.
+
+    Every "fee_update_interval_sec" a transaction stays unmined, "bump_if_due" re-signs it with its original
+    fees multiplied by the next rate of FeeConfig.fee_update_rates (at least REPLACEMENT_FEE_BUMP_RATE times the
+    last fees, and no less than the current network fees), capped at the limits of the FeeConfig.
+    All hashes sent for a nonce are kept, since any of them may be the one mined.
+    """
+
+    def __init__(self, chain_manager: "EthChainManager"):
+        self.__chain_manager = chain_manager
+        fee_config = chain_manager.fee_config
+        self.__rates = fee_config.fee_update_rates
+        self.__interval_sec = fee_config.fee_update_interval_sec
+        if self.__interval_sec is None:
+            self.__interval_sec = chain_manager.block_period_sec * DEFAULT_FEE_UPDATE_BLOCKS
+
+        self.__lock = threading.Lock()
+        self.__pending: Dict[EthHashBytes, PendingTx] = dict()
+
+    @property
+    def interval_sec(self) -> float:
+        return self.__interval_sec
+
+    @property
+    def pending_num(self) -> int:
+        with self.__lock:
+            return len(set(id(pending) for pending in self.__pending.values()))
+
+    def track(self, tx_hash: EthHashBytes, tx: EthTransaction, account: EthAccount, nonce_manager: NonceManager):
+        """ start tracking a transaction just sent; the ones whose nonce has been mined are forgotten """
+        pending = PendingTx(copy.copy(tx), account, nonce_manager, tx_hash)
+        with self.__lock:
+            self.__pending[tx_hash] = pending
+            for known_hash, known in list(self.__pending.items()):
+                mined_nonce = known.nonce_manager.mined_nonce
+                if mined_nonce is not None and known.nonce < mined_nonce:
+                    del self.__pending[known_hash]
+
+    def hashes_of(self, tx_hash: EthHashBytes) -> List[EthHashBytes]:
+        """ every hash sent with the nonce of the transaction, oldest first """
+        with self.__lock:
+            pending = self.__pending.get(tx_hash)
+            return [tx_hash] if pending is None else list(pending.hashes)
+
+    def tx_of(self, tx_hash: EthHashBytes) -> Optional[EthTransaction]:
+        """ the latest transaction sent with the nonce of the hash, if it is tracked """
+        with self.__lock:
+            pending = self.__pending.get(tx_hash)
+        return None if pending is None else pending.tx
+
+    def resolve(self, tx_hash: EthHashBytes):
+        """ forget the transaction, e.g. once one of its hashes has been mined """
+        with self.__lock:
+            pending = self.__pending.get(tx_hash)
+            for known_hash in [tx_hash] if pending is None else pending.hashes:
+                self.__pending.pop(known_hash, None)
+
+    def _adopt(self, tx_hash: EthHashBytes) -> Optional[PendingTx]:
+        """ track a transaction sent before (e.g. by another process) from the node's copy of it """
+        chain_manager = self.__chain_manager
+        sent_tx = chain_manager.eth_get_transaction_by_hash(tx_hash)
+        if sent_tx is None:
+            raise TransactionNotFound(chain_manager.chain_name, "Undone action lost in txpool: {}".format(tx_hash.hex()))
+        if sent_tx.block_number:
+            return None
+
+        account = next((signer for signer in chain_manager.signers if signer.address == sent_tx.sender), None)
+        if account is None:
+            raise Exception("No signer of {} to replace the transaction on {}".format(
+                sent_tx.sender.hex(), chain_manager.chain_name
+            ))
+
+        tx = EthTransaction.init(chain_manager.chain_id, sent_tx.to, EthAmount(sent_tx.value), sent_tx.input)
+        tx.set_nonce(sent_tx.nonce).set_gas_limit(sent_tx.gas)
+        if sent_tx.type == 2:
+            tx.set_gas_prices(sent_tx.max_fee_per_gas, sent_tx.max_priority_fee_per_gas)
+        else:
+            tx.set_gas_price(sent_tx.gas_price)
+        if sent_tx.access_list:
+            tx.set_access_list(sent_tx.access_list)
+
+        pending = PendingTx(tx, account, NonceManager.of(chain_manager, account.address), tx_hash)
+        with self.__lock:
+            self.__pending[tx_hash] = pending
+        return pending
+
+    def _bumped_fees(self, pending: PendingTx) -> Optional[Tuple[int, int]]:
+        """ the fees of the next replacement, or None if the caps leave no room for one """
+        rate = self.__rates[pending.step]
+        fee_config = self.__chain_manager.fee_config
+        gas_price, base_fee, priority_fee = self.__chain_manager.fetch_network_fee_parameters()
+        min_fees = [math.ceil(fee * REPLACEMENT_FEE_BUMP_RATE) for fee in PendingTx.fees_of(pending.tx)]
+        stepped_fees = [math.ceil(fee * rate) for fee in pending.original_fees]
+
+        if pending.tx.type == 2:
+            new_priority_fee = max(stepped_fees[1], min_fees[1], priority_fee)
+            new_max_fee = max(stepped_fees[0], min_fees[0], new_priority_fee + base_fee)
+            new_max_fee = min(new_max_fee, fee_config.max_gas_price)
+            new_priority_fee = min(new_priority_fee, fee_config.max_priority_price, new_max_fee)
+            if new_max_fee < min_fees[0] or new_priority_fee < min_fees[1]:
+                return None
+            return new_max_fee, new_priority_fee
+
+        new_gas_price = min(max(stepped_fees[0], min_fees[0], gas_price), fee_config.gas_price)
+        if new_gas_price < min_fees[0]:
+            return None
+        return new_gas_price, 0
+
+    def bump_if_due(self, tx_hash: EthHashBytes) -> Optional[EthHashBytes]:
+        """
+        send the next replacement of the transaction if it is due, and return its hash (None if nothing is sent).
+        nothing is sent once the confirmation tracker has found one of the hashes of the nonce in a block.
+        raises TransactionNotFound if the node knows none of the hashes of the nonce any more.
+        """
+        with self.__lock:
+            pending = self.__pending.get(tx_hash)
+        if pending is None:
+            pending = self._adopt(tx_hash)
+            if pending is None:
+                return None
+
+        now = time.monotonic()
+        if now - pending.sent_at < self.__interval_sec:
+            return None
+
+        chain_manager = self.__chain_manager
+        tracker = chain_manager.confirmation_tracker
+        if any(tracker.is_included(sent_hash) for sent_hash in pending.hashes):
+            # mined and waiting for its confirmations; a replacement would only be rejected as nonce too low
+            return None
+        if pending.step >= len(self.__rates):
+            # nothing left to bump; the transaction has been dropped if the node knows none of its hashes
+            sent_txs = chain_manager.eth_get_transaction_by_hash_batch(pending.hashes)
+            if all(sent_tx is None for sent_tx in sent_txs):
+                self.resolve(tx_hash)
+                raise TransactionNotFound(
+                    chain_manager.chain_name, "Undone action lost in txpool: {}".format(tx_hash.hex())
+                )
+            pending.sent_at = now
+            return None
+
+        fees = self._bumped_fees(pending)
+        if fees is None:
+            pending.step = len(self.__rates)
+            return None
+        pending.step += 1
+
+        replacement = copy.copy(pending.tx)
+        if replacement.type == 2:
+            replacement.set_gas_prices(*fees)
+        else:
+            replacement.set_gas_price(fees[0])
+        signed_raw_tx = chain_manager._sign_transaction(replacement, pending.account)
+        new_tx_hash = keccak_hash(signed_raw_tx)
+        try:
+            chain_manager.eth_send_raw_transaction(signed_raw_tx)
+        except NonceTooLow:
+            # one of the hashes of the nonce has been mined; its receipt resolves the transaction
+            return None
+        except ReplaceTransactionUnderpriced as e:
+            global_logger.formatted_log("TxReplacer", related_chain_name=chain_manager.chain_name, msg=str(e))
+            return None
+        except Exception as e:
+            # the replacement may have reached a node if none has answered; it is tracked as sent then
+            if not chain_manager.is_unanswered(e):
+                raise
+
+        pending.tx = replacement
+        pending.hashes.append(new_tx_hash)
+        pending.sent_at = time.monotonic()
+        pending.nonce_manager.mark_broadcast(pending.nonce, new_tx_hash)
+        with self.__lock:
+            self.__pending[new_tx_hash] = pending
+        return new_tx_hash
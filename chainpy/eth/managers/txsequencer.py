@@ -0,0 +1,92 @@
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .consts import DEFAULT_TX_SEQUENCER_BATCH_SIZE
+from .ethchainmanager import EthChainManager
+from ..ethtype.hexbytes import EthHashBytes
+from ..ethtype.transaction import EthTransaction
+from ...logger import global_logger
+
+SentCallback = Callable[[Any, EthTransaction, Union[EthHashBytes, Exception]], None]
+
+
+class TxSequencer:
+    """ Sends the transactions submitted for one chain in a worker thread, in the order of submission.
+
+    The worker takes every transaction queued so far (up to "max_batch_size") and sends them at once by
+    EthChainManager.send_transactions, i.e. from the next lane of the chain's signer pool with consecutive nonces,
+    one batch of gas estimations and one batch of broadcasts. The callers never wait: "on_sent" is called (in the
+    worker) with the context given on submission, the transaction and its hash or exception.
+    """
+
+    def __init__(
+        self,
+        chain_manager: EthChainManager,
+        on_sent: SentCallback,
+        max_batch_size: int = DEFAULT_TX_SEQUENCER_BATCH_SIZE
+    ):
+        self.__chain_manager = chain_manager
+        self.__on_sent = on_sent
+        self.__max_batch_size = max_batch_size
+        self.__queue: "queue.Queue[Tuple[EthTransaction, float, Any]]" = queue.Queue()
+
+        self.__stop_event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def pending_num(self) -> int:
+        return self.__queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def submit(self, transaction: EthTransaction, gas_limit_multiplier: float = 1.0, context: Any = None):
+        self.__queue.put((transaction, gas_limit_multiplier, context))
+
+    def start(self):
+        if self.is_running:
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self._run, name="tx-sequencer-{}".format(self.__chain_manager.chain_name), daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop_event.set()
+
+    def _take_batch(self) -> List[Tuple[EthTransaction, float, Any]]:
+        try:
+            batch = [self.__queue.get(timeout=self.__chain_manager.block_period_sec)]
+        except queue.Empty:
+            return list()
+        while len(batch) < self.__max_batch_size:
+            try:
+                batch.append(self.__queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self.__stop_event.is_set():
+            batch = self._take_batch()
+            if not batch:
+                continue
+
+            transactions = [transaction for transaction, _, _ in batch]
+            try:
+                results = self.__chain_manager.send_transactions(
+                    transactions, [multiplier for _, multiplier, _ in batch]
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (transaction, _, context), result in zip(batch, results):
+                try:
+                    self.__on_sent(context, transaction, result)
+                except Exception as e:
+                    global_logger.formatted_log(
+                        "TxSequencer", related_chain_name=self.__chain_manager.chain_name, msg=str(e)
+                    )
@@ -1,8 +1,30 @@
-from dataclasses import dataclass
-from typing import List, Optional, Union
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
 
 from dataclasses_json import dataclass_json, LetterCase
 
+from .consts import (
+    DEFAULT_RPC_POOL_SIZE,
+    DEFAULT_RPC_CONNECT_TIMEOUT_SEC,
+    DEFAULT_RPC_READ_TIMEOUT_SEC,
+    DEFAULT_RPC_MAX_BATCH_SIZE,
+    DEFAULT_ENDPOINT_FAILURE_COOLDOWN_SEC,
+    DEFAULT_ENDPOINT_MAX_LAG_BLOCKS,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_RPC_CACHE_MAX_ENTRIES,
+    DEFAULT_RPC_CACHE_TTL_SEC,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_BASE_DELAY_SEC,
+    DEFAULT_RETRY_MAX_DELAY_SEC,
+    DEFAULT_RETRY_DEADLINE_SEC,
+    MULTICALL3_ADDRESS,
+    DEFAULT_FEE_HISTORY_BLOCKS,
+    DEFAULT_FEE_REWARD_PERCENTILE,
+    DEFAULT_GAS_ESTIMATE_CACHE_TTL_SEC,
+    DEFAULT_ACCESS_LIST_TTL_SEC
+)
+from ..ethtype.hexbytes import EthAddress, EthHashBytes
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
@@ -12,6 +34,10 @@ class FeeConfig:
     max_gas_price: Optional[int] = None
     max_priority_price: Optional[int] = None
     fee_update_rates: Optional[List[float]] = None
+    fee_oracle: bool = False  # type2 fees from eth_feeHistory, refreshed once per head (needs the head tracker)
+    fee_history_blocks: int = DEFAULT_FEE_HISTORY_BLOCKS
+    fee_reward_percentile: float = DEFAULT_FEE_REWARD_PERCENTILE
+    fee_update_interval_sec: Optional[float] = None  # None: DEFAULT_FEE_UPDATE_BLOCKS block periods
 
     def __post_init__(self):
         if self.type != 0 and self.type != 2:
@@ -25,6 +51,82 @@ class FeeConfig:
 
         if self.fee_update_rates is None:
             self.fee_update_rates = [1.1, 1.2, 1.3, 2]
+        if not self.fee_update_rates or min(self.fee_update_rates) < 1:
+            raise Exception("fee_update_rates must be rates of at least 1, but {}".format(self.fee_update_rates))
+        if self.fee_update_interval_sec is not None and self.fee_update_interval_sec <= 0:
+            raise Exception("fee_update_interval_sec must be positive, but {}".format(self.fee_update_interval_sec))
+        if self.fee_history_blocks < 1:
+            raise Exception("fee_history_blocks must be positive, but {}".format(self.fee_history_blocks))
+        if not 0 <= self.fee_reward_percentile <= 100:
+            raise Exception("fee_reward_percentile must be in [0, 100], but {}".format(self.fee_reward_percentile))
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class RpcConfig:
+    pool_size: int = DEFAULT_RPC_POOL_SIZE
+    keep_alive: bool = True
+    connect_timeout_sec: float = DEFAULT_RPC_CONNECT_TIMEOUT_SEC
+    read_timeout_sec: float = DEFAULT_RPC_READ_TIMEOUT_SEC
+    max_batch_size: int = DEFAULT_RPC_MAX_BATCH_SIZE
+    endpoint_failure_cooldown_sec: float = DEFAULT_ENDPOINT_FAILURE_COOLDOWN_SEC
+    endpoint_max_lag_blocks: int = DEFAULT_ENDPOINT_MAX_LAG_BLOCKS
+    hedged_methods: List[str] = field(default_factory=list)
+    hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE
+    head_tracker: bool = False
+    head_staleness_sec: Optional[float] = None
+    cache: bool = False
+    cache_max_entries: int = DEFAULT_RPC_CACHE_MAX_ENTRIES
+    cache_ttl_sec: float = DEFAULT_RPC_CACHE_TTL_SEC
+    cache_path: Optional[str] = None
+    coalesce_requests: bool = True
+    retry_max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
+    retry_base_delay_sec: float = DEFAULT_RETRY_BASE_DELAY_SEC
+    retry_max_delay_sec: float = DEFAULT_RETRY_MAX_DELAY_SEC
+    retry_deadline_sec: float = DEFAULT_RETRY_DEADLINE_SEC
+    rate_limit_per_sec: Optional[float] = None
+    rate_limit_burst: Optional[float] = None
+    method_weights: Dict[str, float] = field(default_factory=dict)
+    lazy_connect: bool = False
+    chain_id: Optional[int] = None
+    ws_url: Optional[str] = None
+    log_filter: bool = False
+    multicall_address: str = MULTICALL3_ADDRESS
+    gas_estimate_cache: bool = False
+    gas_estimate_cache_ttl_sec: float = DEFAULT_GAS_ESTIMATE_CACHE_TTL_SEC
+    gas_estimate_length_bucket: Optional[int] = None
+    access_list: bool = False
+    access_list_ttl_sec: float = DEFAULT_ACCESS_LIST_TTL_SEC
+
+    def __post_init__(self):
+        if self.pool_size < 1:
+            raise Exception("pool_size must be positive, but {}".format(self.pool_size))
+        if self.connect_timeout_sec <= 0 or self.read_timeout_sec <= 0:
+            raise Exception("rpc timeouts must be positive")
+        if self.max_batch_size < 1:
+            raise Exception("max_batch_size must be positive, but {}".format(self.max_batch_size))
+        if self.endpoint_max_lag_blocks < 0:
+            raise Exception("endpoint_max_lag_blocks must not be negative")
+        if not 0 < self.hedge_percentile < 1:
+            raise Exception("hedge_percentile must be in (0, 1), but {}".format(self.hedge_percentile))
+        if self.cache_max_entries < 1 or self.cache_ttl_sec <= 0:
+            raise Exception("cache_max_entries and cache_ttl_sec must be positive")
+        if self.retry_max_attempts < 1:
+            raise Exception("retry_max_attempts must be positive, but {}".format(self.retry_max_attempts))
+        if self.retry_base_delay_sec < 0 or self.retry_max_delay_sec < 0 or self.retry_deadline_sec < 0:
+            raise Exception("retry delays and deadline must not be negative")
+        if self.rate_limit_per_sec is not None and self.rate_limit_per_sec <= 0:
+            raise Exception("rate_limit_per_sec must be positive, but {}".format(self.rate_limit_per_sec))
+        if self.gas_estimate_cache_ttl_sec <= 0:
+            raise Exception("gas_estimate_cache_ttl_sec must be positive, but {}".format(self.gas_estimate_cache_ttl_sec))
+        if self.gas_estimate_length_bucket is not None and self.gas_estimate_length_bucket < 1:
+            raise Exception("gas_estimate_length_bucket must be positive, but {}".format(self.gas_estimate_length_bucket))
+        if self.access_list_ttl_sec <= 0:
+            raise Exception("access_list_ttl_sec must be positive, but {}".format(self.access_list_ttl_sec))
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return self.connect_timeout_sec, self.read_timeout_sec
 
 
 def merge_dict(base_dict: dict, add_dict: dict):
@@ -46,3 +148,31 @@ def hex_height_or_latest(height: Union[int, str] = "latest") -> str:
     if isinstance(height, int):
         return hex(height)
     raise Exception("height should be integer or \"latest\"")
+
+
+def build_log_filter(
+    addresses: List[EthAddress],
+    topics: List[Union[EthHashBytes, List[EthHashBytes]]],
+    from_block: str = None,
+    to_block: str = None
+) -> dict:
+    """ build the filter object of eth_getLogs (and eth_newFilter) """
+    topic_hexes = list()
+    for topic in topics:
+        if isinstance(topic, list):
+            item = list()
+            for tp in topic:
+                item.append(tp.hex())
+            topic_hexes.append(item)
+        else:
+            topic_hexes.append(topic.hex())
+
+    log_filter = {
+        "address": [address.with_checksum() for address in addresses],
+        "topics": topic_hexes
+    }
+    if from_block is not None:
+        log_filter["fromBlock"] = from_block
+    if to_block is not None:
+        log_filter["toBlock"] = to_block
+    return log_filter
@@ -2,17 +2,18 @@ import os
 import sys
 import threading
 from time import sleep
-from typing import Optional, Union, Any, Type
-
-from web3.exceptions import TransactionNotFound
+from typing import Optional, Union, Any, Type, Dict
 
 from .chaineventabc import ChainEventABC, TaskStatus, ReceiptParams
 from .multichainmonitor import MultiChainMonitor
 from .periodiceventabc import PeriodicEventABC
 from .utils import timestamp_msec
 from ..eth.ethtype.hexbytes import EthHashBytes
+from ..eth.ethtype.transaction import EthTransaction
 from ..eth.managers.consts import DEFAULT_CHAIN_NAME
-from ..eth.managers.exceptions import RpcEVMError
+from ..eth.managers.exceptions import RpcEVMError, TransactionNotFound
+from ..eth.managers.confirmationtracker import ConfirmationTracker
+from ..eth.managers.txsequencer import TxSequencer
 from ..logger import global_logger
 from ..prometheus_metric import PrometheusExporter
 
@@ -68,6 +69,27 @@ class EventBridge(MultiChainMonitor):
         super().__init__(multichain_config)
         self.cache = KeyValueCache(cache_value_type, max_length)
 
+        # with "pipelined_send", transactions are sent by a worker per destination chain (see TxSequencer)
+        self._pipelined_send = self.multichain_config.get("pipelined_send", False)
+        self._tx_sequencers: Dict[str, TxSequencer] = dict()
+        self._tx_sequencers_lock = threading.Lock()
+
+    def confirmation_tracker_of(self, chain_name: str) -> ConfirmationTracker:
+        """ the confirmation tracker of the chain, started on first use """
+        return self.get_chain_manager_of(chain_name).confirmation_tracker
+
+    def tx_sequencer_of(self, chain_name: str) -> TxSequencer:
+        """ the transaction sequencer of the chain, started on first use """
+        with self._tx_sequencers_lock:
+            if chain_name not in self._tx_sequencers:
+                sequencer = TxSequencer(
+                    self.get_chain_manager_of(chain_name),
+                    lambda event, tx, tx_hash: self._handle_send_result(event, chain_name, tx, tx_hash)
+                )
+                sequencer.start()
+                self._tx_sequencers[chain_name] = sequencer
+            return self._tx_sequencers[chain_name]
+
     def is_in_cache(self, key: int) -> bool:
         if self.cache is None:
             raise Exception("Authority checker is not initiated yet.")
@@ -109,73 +131,139 @@ class EventBridge(MultiChainMonitor):
         try:
             # build and send transaction
             tx = self.world_build_transaction(dst_chain_name, contract_name, method_name, params)
+            if self._pipelined_send:
+                # the result is handled by the sequencer of the chain, in the order of submission
+                self.tx_sequencer_of(dst_chain_name).submit(tx, event.gas_limit_multiplier(), event)
+                return None
             tx_hash = self.world_send_transaction(dst_chain_name, tx, event.gas_limit_multiplier())
+        except RpcEVMError as e:
+            tx, tx_hash = None, e
+        self._handle_send_result(event, dst_chain_name, tx, tx_hash)
+
+    def _handle_send_result(
+        self,
+        event: SendEventABC,
+        dst_chain_name: str,
+        tx: Optional[EthTransaction],
+        tx_hash: Union[EthHashBytes, Exception]
+    ):
+        if isinstance(tx_hash, RpcEVMError):
+            # not-consume user nonce.
+            global_logger.formatted_log(
+                "Evm",
+                address=self.active_account.address,
+                related_chain_name=dst_chain_name,
+                msg="{}:EvmError:{}".format(event.summary(), str(tx_hash))
+            )
+            # TODO does not update event when reverted poll filtered error occurs
+            updated_event = event.handle_tx_result_fail()
+            self.queue.enqueue(updated_event)
+            return
 
+        if isinstance(tx_hash, Exception):
+            # only a pipelined send gets here; retried as an expected fee issue is
             global_logger.formatted_log(
                 "Consumer",
                 address=self.active_account.address,
                 related_chain_name=dst_chain_name,
-                msg="{}:txHash({}):nonce({})".format(event.summary(), tx_hash.hex(), tx.nonce)
+                msg="{}:SendError:{}".format(event.summary(), str(tx_hash))
             )
+            event.time_lock = timestamp_msec() + 3000
+            self.queue.enqueue(event)
+            return
 
-            if tx_hash == EthHashBytes.default():
-                """ expected fee issue """
-                global_logger.formatted_log(
-                    "Consumer",
-                    address=self.active_account.address,
-                    related_chain_name=dst_chain_name,
-                    msg="{}:ZeroTxHash".format(event.summary())
-                )
-                event.time_lock = timestamp_msec() + 3000
-                self.queue.enqueue(event)
-            else:
-                """ set receipt params to the event """
-                delay = self.get_chain_manager_of(dst_chain_name).tx_commit_time_sec * 1000
-                receipt_time_lock = timestamp_msec() + delay
-                event.switch_to_check_receipt(dst_chain_name, tx_hash, receipt_time_lock)
-                self.queue.enqueue(event)
+        global_logger.formatted_log(
+            "Consumer",
+            address=self.active_account.address,
+            related_chain_name=dst_chain_name,
+            msg="{}:txHash({}):nonce({})".format(event.summary(), tx_hash.hex(), tx.nonce)
+        )
 
-        except RpcEVMError as e:
-            # not-consume user nonce.
+        if tx_hash == EthHashBytes.default():
+            """ expected fee issue """
             global_logger.formatted_log(
-                "Evm",
+                "Consumer",
                 address=self.active_account.address,
                 related_chain_name=dst_chain_name,
-                msg="{}:EvmError:{}".format(event.summary(), str(e))
+                msg="{}:ZeroTxHash".format(event.summary())
             )
-            # TODO does not update event when reverted poll filtered error occurs
-            updated_event = event.handle_tx_result_fail()
-            self.queue.enqueue(updated_event)
+            event.time_lock = timestamp_msec() + 3000
+            self.queue.enqueue(event)
+        else:
+            """ set receipt params to the event """
+            delay = self.get_chain_manager_of(dst_chain_name).tx_commit_time_sec * 1000
+            receipt_time_lock = timestamp_msec() + delay
+            self.confirmation_tracker_of(dst_chain_name).watch(tx_hash)
+            event.switch_to_check_receipt(dst_chain_name, tx_hash, receipt_time_lock)
+            self.queue.enqueue(event)
 
     def _handle_receipt_event(self, event: SendEventABC):
+        """
+        check the receipt resolved by the confirmation tracker without blocking the sender thread.
+        the event is re-enqueued once per block period until the receipt of its transaction, or of any replacement
+        of it, arrives. meanwhile the replacer of the chain re-sends the transaction with bumped fees on schedule.
+        """
         receipt_params: ReceiptParams = event.get_receipt_params()
-        receipt = self.world_receipt_with_wait(receipt_params.on_chain_name, receipt_params.tx_hash)
+        chain_name, tx_hash = receipt_params.on_chain_name, receipt_params.tx_hash
+        chain_manager = self.get_chain_manager_of(chain_name)
+        tracker = self.confirmation_tracker_of(chain_name)
+        replacer = chain_manager.tx_replacer
+
+        # a receipt is taken only once its block is as deep as the chain's aging period, so a reorg can not revoke it
+        min_confirmations = max(chain_manager.block_aging_period, 1)
+        tx_hashes = replacer.hashes_of(tx_hash)
+        receipt = None
+        for sent_tx_hash in tx_hashes:
+            receipt = tracker.pop_receipt(sent_tx_hash, min_confirmations)
+            if receipt is not None:
+                tx_hash = sent_tx_hash
+                break
 
         if receipt is None:
-            updating_func = event.handle_tx_result_fail
-            log_status = "no-receipt"
+            # e.g. an event switched to check receipt by itself
+            for sent_tx_hash in tx_hashes:
+                tracker.watch(sent_tx_hash)
+            dropped, new_tx_hash = False, None
             try:
-                new_tx_hash, replaced = self.try_replace_transaction(chain_name=receipt_params.on_chain_name, tx_hash=receipt_params.tx_hash)
-                if replaced:
+                new_tx_hash = replacer.bump_if_due(tx_hash)
+            except TransactionNotFound:
+                dropped = True
+            except Exception as e:
+                global_logger.formatted_log(
+                    "Receipt",
+                    address=self.active_account.address,
+                    related_chain_name=chain_name,
+                    msg="{}:ReplaceError:{}".format(event.summary(), str(e))
+                )
+
+            if not dropped:
+                if new_tx_hash is not None:
                     global_logger.formatted_log(
                         "Receipt",
                         address=self.active_account.address,
-                        related_chain_name=receipt_params.on_chain_name,
-                        msg="{}:Replaced: {} -> {}".format(event.summary(), receipt_params.tx_hash, new_tx_hash)
+                        related_chain_name=chain_name,
+                        msg="{}:Replaced: {} -> {}".format(event.summary(), tx_hash.hex(), new_tx_hash.hex())
                     )
-                    event.switch_to_check_receipt(
-                        target_chain_name=receipt_params.on_chain_name,
-                        tx_hash=new_tx_hash,
-                        time_lock=0
-                    )
-                    self.queue.enqueue(event)
-                    return
-                else:
-                    event.time_lock = 0
-                    self.queue.enqueue(event)
-                    return
-            except TransactionNotFound:
-                pass
+                    tracker.watch(new_tx_hash)
+                    tx_hash = new_tx_hash
+                event.switch_to_check_receipt(
+                    target_chain_name=chain_name,
+                    tx_hash=tx_hash,
+                    time_lock=timestamp_msec() + chain_manager.block_period_sec * 1000
+                )
+                self.queue.enqueue(event)
+                return
+
+        for sent_tx_hash in tx_hashes:
+            tracker.unwatch(sent_tx_hash)
+        if receipt is not None:
+            chain_manager.observe_receipt(tx_hash, receipt)
+        replacer.resolve(tx_hash)
+
+        if receipt is None:
+            # dropped by the network
+            updating_func = event.handle_tx_result_fail
+            log_status = "no-receipt"
         elif receipt.status == 1:
             updating_func = event.handle_tx_result_success
             log_status = "success"
@@ -188,21 +276,10 @@ class EventBridge(MultiChainMonitor):
         global_logger.formatted_log(
             "Receipt",
             address=self.active_account.address,
-            related_chain_name=receipt_params.on_chain_name,
-            msg="{}:receipt({}):{}".format(event.summary(), receipt_params.tx_hash.hex(), log_status)
+            related_chain_name=chain_name,
+            msg="{}:receipt({}):{}".format(event.summary(), tx_hash.hex(), log_status)
         )
 
-        # restart relayer after 60 secs
-        if log_status == "no-receipt":
-            global_logger.formatted_log(
-                "Receipt",
-                address=self.active_account.address,
-                related_chain_name=receipt_params.on_chain_name,
-                msg="{}:RestartAfter{}Second".format(event.summary(), 60)
-            )
-            sleep(60)
-            os.execl(sys.executable, sys.executable, *sys.argv)  # TODO: Remove super ugly reboot process
-
         updated_event = updating_func()
         self.queue.enqueue(updated_event)
 
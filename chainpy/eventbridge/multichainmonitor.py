@@ -1,6 +1,6 @@
 import time
 from queue import PriorityQueue
-from typing import Union, List, Tuple
+from typing import Dict, Union, List, Tuple, TYPE_CHECKING
 
 from chainpy.eth.managers.eventobj import DetectedEvent
 from chainpy.eth.managers.multichainmanager import MultiChainManager
@@ -9,6 +9,9 @@ from chainpy.eventbridge.periodiceventabc import PeriodicEventABC
 from chainpy.eventbridge.utils import timestamp_msec
 from chainpy.logger import global_logger
 
+if TYPE_CHECKING:
+    from chainpy.eth.managers.logsubscriber import ChainLogSubscriber
+
 
 class TimePriorityQueue:
     """
@@ -70,6 +73,7 @@ class MultiChainMonitor(MultiChainManager):
         self._queue = TimePriorityQueue()
         self._events_types = dict()  # event_name to event_type
         self._offchain_source_types = dict()
+        self._log_subscribers: Dict[str, "ChainLogSubscriber"] = dict()
 
     @property
     def queue(self) -> TimePriorityQueue:
@@ -131,23 +135,42 @@ class MultiChainMonitor(MultiChainManager):
                 self._queue.enqueue(not_handled_event)
         return True
 
+    def _enqueue_detected_events(self, detected_events: List[DetectedEvent]):
+        for detected_event in detected_events:
+            event_type = self._events_types[detected_event.event_name]
+
+            chain_event = event_type.init(detected_event, timestamp_msec(), self)
+            self._queue.enqueue(chain_event)
+
+            if chain_event is not None:
+                global_logger.formatted_log(
+                    "Monitor",
+                    address=self.active_account.address,
+                    related_chain_name=chain_event.on_chain_name,
+                    msg="{}:Detected".format(chain_event.summary())
+                )
+
+    def start_log_subscribers(self) -> List[str]:
+        """ stream the events of every chain configured with "ws_url"; returns the names of the streamed chains """
+        for chain_name in self.supported_chain_list:
+            chain_manager = self.get_chain_manager_of(chain_name)
+            ws_url = chain_manager.rpc_config.ws_url
+            if ws_url is None or chain_name in self._log_subscribers:
+                continue
+            # aiohttp is loaded only by the relayers streaming a chain
+            from chainpy.eth.managers.logsubscriber import ChainLogSubscriber
+            subscriber = ChainLogSubscriber(chain_manager, ws_url, self._enqueue_detected_events)
+            subscriber.start()
+            self._log_subscribers[chain_name] = subscriber
+        return list(self._log_subscribers.keys())
+
     def run_world_chain_monitor(self):
         """
         A runner to find the designated event from blockchains. Whenever detecting the event, enqueue it.
+        Chains with a websocket endpoint push their events instead, so they are not polled here.
         """
+        streamed_chains = self.start_log_subscribers()
+        polled_chains = [chain_name for chain_name in self.supported_chain_list if chain_name not in streamed_chains]
         while True:
-            detected_events = self.collect_unchecked_multichain_events()
-            for detected_event in detected_events:
-                event_type = self._events_types[detected_event.event_name]
-
-                chain_event = event_type.init(detected_event, timestamp_msec(), self)
-                self._queue.enqueue(chain_event)
-
-                if chain_event is not None:
-                    global_logger.formatted_log(
-                        "Monitor",
-                        address=self.active_account.address,
-                        related_chain_name=chain_event.on_chain_name,
-                        msg="{}:Detected".format(chain_event.summary())
-                    )
+            self._enqueue_detected_events(self.collect_unchecked_multichain_events(polled_chains))
             time.sleep(self.multichain_config["chain_monitor_period_sec"])
@@ -4,8 +4,12 @@ from chainpy.offchain.consts.chainlinkconst import ETH_CHAINLINK_SYMBOL_TO_CONTR
 from .priceapiabc import PriceApiABC, Symbol, QueryId, QueriedData, Price, Volume
 from .utils import restore_replace
 from ..eth.ethtype.amount import EthAmount
+from ..eth.ethtype.hexbytes import EthAddress, EthHexBytes
+from ..eth.managers.multicall import Multicall
 from ..eth.managers.rpchandler import EthRpcClient
 
+LATEST_ROUND_DATA_SELECTOR = EthHexBytes("0xfeaf968c")
+
 
 class ChainlinkApi(PriceApiABC):
     SYMBOL_REPLACE_MAP = {}
@@ -15,6 +19,7 @@ class ChainlinkApi(PriceApiABC):
 
         chain_config = {"chain_name": "ETH_MAIN", "block_period_sec": 13, "url_with_access_key": api_base_url}
         self.__rpc_cli = EthRpcClient.from_config_dict(chain_config)
+        self.__multicall = Multicall(self.__rpc_cli)
 
     def ping(self) -> bool:
         return isinstance(self.__rpc_cli.chain_id, int)
@@ -28,12 +33,20 @@ class ChainlinkApi(PriceApiABC):
         return ETH_CHAINLINK_SYMBOL_TO_CONTRACT_ADDRESS[symbol]
 
     def _fetch_asset_status_by_symbols(self, symbols: List[Symbol]) -> List[QueriedData]:
-        queried_data: List[QueriedData] = list()
+        calls = list()
         for symbol in symbols:
             contract_address = ETH_CHAINLINK_SYMBOL_TO_CONTRACT_ADDRESS[symbol]
             if contract_address == "0x0000000000000000000000000000000000000000":
                 raise Exception("Not supported symbol (zero address): {}".format(symbol))
-            result = self.__rpc_cli.eth_call({"to": contract_address, "data": "0xfeaf968c"})
+            calls.append((EthAddress(contract_address), LATEST_ROUND_DATA_SELECTOR))
+
+        # every feed is read in one round trip, at the same block
+        results = self.__multicall.aggregate(calls)
+
+        queried_data: List[QueriedData] = list()
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                raise result
             queried_data.append({"symbol": symbol, "data": result})
         return queried_data
 
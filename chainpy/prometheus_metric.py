@@ -1,11 +1,24 @@
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 
 from prometheus_client import Gauge, start_http_server
 
+if TYPE_CHECKING:
+    from .eth.managers.httpsession import ConnectionStats
+    from .eth.managers.ratelimiter import RpcRateLimiter
+    from .eth.managers.rpccache import CacheStats
+
 MONITOR_ALIVE_QUERY_NAME = "relayer_monitor_alive"
 SENDER_ALIVE_QUERY_NAME = "relayer_sender_alive"
 RPC_REQUESTS_QUERY_NAME = "relayer_rpc_requests_on_chain"
 RPC_FAILURES_QUERY_NAME = "relayer_rpc_failures_on_chain"
+RPC_NEW_CONNECTIONS_QUERY_NAME = "relayer_rpc_new_connections_on_chain"
+RPC_REUSED_CONNECTIONS_QUERY_NAME = "relayer_rpc_reused_connections_on_chain"
+RPC_CACHE_HITS_QUERY_NAME = "relayer_rpc_cache_hits_on_chain"
+RPC_CACHE_MISSES_QUERY_NAME = "relayer_rpc_cache_misses_on_chain"
+RPC_CACHE_EVICTIONS_QUERY_NAME = "relayer_rpc_cache_evictions_on_chain"
+RPC_LIMITER_UTILIZATION_QUERY_NAME = "relayer_rpc_limiter_utilization_on_chain"
+RPC_LIMITER_WAITED_QUERY_NAME = "relayer_rpc_limiter_waited_seconds_on_chain"
+SIGNER_BALANCE_QUERY_NAME = "relayer_signer_balance_on_chain"
 
 
 class PrometheusExporter:
@@ -17,6 +30,14 @@ class PrometheusExporter:
     RPC_CHAIN_INIT: Dict[str, bool] = dict()
     RPC_REQUESTED = Gauge(RPC_REQUESTS_QUERY_NAME, "Description", ["chain"])
     RPC_FAILED = Gauge(RPC_FAILURES_QUERY_NAME, "Description", ["chain"])
+    RPC_NEW_CONNECTIONS = Gauge(RPC_NEW_CONNECTIONS_QUERY_NAME, "Description", ["chain"])
+    RPC_REUSED_CONNECTIONS = Gauge(RPC_REUSED_CONNECTIONS_QUERY_NAME, "Description", ["chain"])
+    RPC_CACHE_HITS = Gauge(RPC_CACHE_HITS_QUERY_NAME, "Description", ["chain"])
+    RPC_CACHE_MISSES = Gauge(RPC_CACHE_MISSES_QUERY_NAME, "Description", ["chain"])
+    RPC_CACHE_EVICTIONS = Gauge(RPC_CACHE_EVICTIONS_QUERY_NAME, "Description", ["chain"])
+    RPC_LIMITER_UTILIZATION = Gauge(RPC_LIMITER_UTILIZATION_QUERY_NAME, "Description", ["chain"])
+    RPC_LIMITER_WAITED = Gauge(RPC_LIMITER_WAITED_QUERY_NAME, "Description", ["chain"])
+    SIGNER_BALANCE = Gauge(SIGNER_BALANCE_QUERY_NAME, "Description", ["chain", "address"])
 
     @staticmethod
     def init_prometheus_exporter(port: int = 8000):
@@ -41,6 +62,13 @@ class PrometheusExporter:
         if PrometheusExporter.RPC_CHAIN_INIT.get(chain_name) is None:
             PrometheusExporter.RPC_REQUESTED.labels(chain_name).set(0)
             PrometheusExporter.RPC_FAILED.labels(chain_name).set(0)
+            PrometheusExporter.RPC_NEW_CONNECTIONS.labels(chain_name).set(0)
+            PrometheusExporter.RPC_REUSED_CONNECTIONS.labels(chain_name).set(0)
+            PrometheusExporter.RPC_CACHE_HITS.labels(chain_name).set(0)
+            PrometheusExporter.RPC_CACHE_MISSES.labels(chain_name).set(0)
+            PrometheusExporter.RPC_CACHE_EVICTIONS.labels(chain_name).set(0)
+            PrometheusExporter.RPC_LIMITER_UTILIZATION.labels(chain_name).set(0)
+            PrometheusExporter.RPC_LIMITER_WAITED.labels(chain_name).set(0)
             PrometheusExporter.RPC_CHAIN_INIT[chain_name] = True
 
     @staticmethod
@@ -58,3 +86,39 @@ class PrometheusExporter:
         PrometheusExporter.init_metrics(chain_name=chain_name)
 
         PrometheusExporter.RPC_FAILED.labels(chain_name).inc()
+
+    @staticmethod
+    def exporting_rpc_connections(chain_name: str, stats: "ConnectionStats"):
+        if not PrometheusExporter.PROMETHEUS_ON:
+            return
+        PrometheusExporter.init_metrics(chain_name=chain_name)
+
+        PrometheusExporter.RPC_NEW_CONNECTIONS.labels(chain_name).set(stats.new_connections)
+        PrometheusExporter.RPC_REUSED_CONNECTIONS.labels(chain_name).set(stats.reused_connections)
+
+    @staticmethod
+    def exporting_rpc_cache(chain_name: str, stats: "CacheStats"):
+        if not PrometheusExporter.PROMETHEUS_ON:
+            return
+        PrometheusExporter.init_metrics(chain_name=chain_name)
+
+        PrometheusExporter.RPC_CACHE_HITS.labels(chain_name).set(stats.hits)
+        PrometheusExporter.RPC_CACHE_MISSES.labels(chain_name).set(stats.misses)
+        PrometheusExporter.RPC_CACHE_EVICTIONS.labels(chain_name).set(stats.evictions)
+
+    @staticmethod
+    def exporting_rpc_rate_limiter(chain_name: str, limiter: "RpcRateLimiter"):
+        if not PrometheusExporter.PROMETHEUS_ON:
+            return
+        PrometheusExporter.init_metrics(chain_name=chain_name)
+
+        PrometheusExporter.RPC_LIMITER_UTILIZATION.labels(chain_name).set(limiter.utilization)
+        PrometheusExporter.RPC_LIMITER_WAITED.labels(chain_name).set(limiter.waited_sec)
+
+    @staticmethod
+    def exporting_signer_balance(chain_name: str, address_hex: str, balance_float_str: str):
+        if not PrometheusExporter.PROMETHEUS_ON:
+            return
+        PrometheusExporter.init_metrics(chain_name=chain_name)
+
+        PrometheusExporter.SIGNER_BALANCE.labels(chain_name, address_hex).set(float(balance_float_str))
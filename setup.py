@@ -14,6 +14,7 @@ setup(
         "dataclasses-json==0.6.1",
         "prometheus-client==0.17.1",
         "jsonpath-ng==1.6.0",
-        "web3==6.11.0"
+        "web3==6.11.0",
+        "aiohttp==3.8.6"
     ]
 )
@@ -0,0 +1,185 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import pytest
+from aiohttp import web
+from eth_utils import keccak
+
+PING_ABI = [{
+    "type": "event", "name": "Ping", "anonymous": False,
+    "inputs": [{"name": "x", "type": "uint256", "indexed": False}]
+}]
+PING_TOPIC = "0x" + keccak(text="Ping(uint256)").hex().replace("0x", "")
+PING_EMITTER = "0x" + "33" * 20
+
+
+def make_log(height: int, log_index: int = 0, removed: bool = False) -> dict:
+    return {
+        "address": PING_EMITTER,
+        "blockHash": "0x{:064x}".format(height + 1),
+        "blockNumber": hex(height),
+        "data": "0x{:064x}".format(height),
+        "logIndex": hex(log_index),
+        "removed": removed,
+        "topics": [PING_TOPIC],
+        "transactionHash": "0x{:064x}".format(height * 100 + log_index),
+        "transactionIndex": "0x0"
+    }
+
+
+def wait_until(predicate: Callable[[], bool], timeout_sec: float = 10.0):
+    deadline = time.monotonic() + timeout_sec
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in {} secs".format(timeout_sec))
+        time.sleep(0.02)
+
+
+class StandInError(Exception):
+    """ raised by a handler to answer the call with a json-rpc error """
+    def __init__(self, message: str, code: int = -32000):
+        super().__init__(message)
+        self.code = code
+
+
+class StandInNode:
+    """ An in-process json-rpc node: http posts on "/" and eth_subscribe websockets on "/ws".
+
+    Calls are answered by "handlers" (method -> function of the params), falling back to a chain whose head is
+    "head" and whose logs are "logs". "fail_status" answers every http post with that status instead.
+    """
+
+    def __init__(self, chain_id: int = 1, head: int = 1000):
+        self.chain_id = chain_id
+        self.head = head
+        self.logs: List[dict] = list()
+        self.handlers: Dict[str, Callable[[list], object]] = dict()
+        self.fail_status: Optional[int] = None
+
+        self.calls: List[str] = list()
+        self.posts: List[int] = list()  # the number of calls in each http post
+        self.subscribe_num = 0
+
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target=self.__loop.run_forever, daemon=True)
+        self.__runner: Optional[web.AppRunner] = None
+        self.__sockets: List[web.WebSocketResponse] = list()
+        self.__subscriptions: Dict[str, web.WebSocketResponse] = dict()  # subscription id -> socket
+        self.__subscription_kinds: Dict[str, str] = dict()
+        self.port: Optional[int] = None
+
+    @property
+    def url(self) -> str:
+        return "http://127.0.0.1:{}/".format(self.port)
+
+    @property
+    def ws_url(self) -> str:
+        return "ws://127.0.0.1:{}/ws".format(self.port)
+
+    def start(self) -> "StandInNode":
+        self.__thread.start()
+        asyncio.run_coroutine_threadsafe(self._serve(), self.__loop).result()
+        return self
+
+    def stop(self):
+        self.drop_connections()
+        asyncio.run_coroutine_threadsafe(self.__runner.cleanup(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+
+    async def _serve(self):
+        app = web.Application()
+        app.router.add_post("/", self._on_post)
+        app.router.add_get("/ws", self._on_ws)
+        self.__runner = web.AppRunner(app)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def _result_of(self, method: str, params: list):
+        if method in self.handlers:
+            return self.handlers[method](params)
+        if method == "eth_chainId":
+            return hex(self.chain_id)
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getLogs":
+            from_height, to_height = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+            return [log for log in self.logs if from_height <= int(log["blockNumber"], 16) <= to_height]
+        raise StandInError("the method {} does not exist".format(method), -32601)
+
+    def _answer(self, body: dict) -> dict:
+        self.calls.append(body["method"])
+        try:
+            return {"jsonrpc": "2.0", "id": body["id"], "result": self._result_of(body["method"], body["params"])}
+        except StandInError as e:
+            return {"jsonrpc": "2.0", "id": body["id"], "error": {"code": e.code, "message": str(e)}}
+
+    async def _on_post(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.posts.append(len(body) if isinstance(body, list) else 1)
+        if self.fail_status is not None:
+            return web.Response(status=self.fail_status, text="stand-in failure")
+        if isinstance(body, list):
+            return web.json_response([self._answer(item) for item in body])
+        return web.json_response(self._answer(body))
+
+    async def _on_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.__sockets.append(ws)
+        async for msg in ws:
+            body = json.loads(msg.data)
+            if body["method"] != "eth_subscribe":
+                await ws.send_json(self._answer(body))
+                continue
+            self.subscribe_num += 1
+            subscription_id = "0x{:x}".format(len(self.__subscriptions) + 1)
+            self.__subscriptions[subscription_id] = ws
+            self.__subscription_kinds[subscription_id] = body["params"][0]
+            await ws.send_json({"jsonrpc": "2.0", "id": body["id"], "result": subscription_id})
+        return ws
+
+    async def _notify(self, kind: str, result: dict):
+        for subscription_id, ws in list(self.__subscriptions.items()):
+            if self.__subscription_kinds[subscription_id] != kind or ws.closed:
+                continue
+            await ws.send_json({
+                "jsonrpc": "2.0",
+                "method": "eth_subscription",
+                "params": {"subscription": subscription_id, "result": result}
+            })
+
+    def push_log(self, log: dict):
+        asyncio.run_coroutine_threadsafe(self._notify("logs", log), self.__loop).result()
+
+    def push_head(self, height: int):
+        self.head = height
+        asyncio.run_coroutine_threadsafe(self._notify("newHeads", {"number": hex(height)}), self.__loop).result()
+
+    def drop_connections(self):
+        """ close every websocket, as a restarted node does """
+        async def close_all():
+            for ws in self.__sockets:
+                await ws.close()
+            self.__sockets.clear()
+            self.__subscriptions.clear()
+        asyncio.run_coroutine_threadsafe(close_all(), self.__loop).result()
+
+
+@pytest.fixture
+def node():
+    stand_in = StandInNode().start()
+    yield stand_in
+    stand_in.stop()
+
+
+@pytest.fixture
+def ping_abi_path(tmp_path) -> str:
+    path = tmp_path / "ping.json"
+    path.write_text(json.dumps(PING_ABI))
+    return str(path)
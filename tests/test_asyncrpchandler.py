@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from chainpy.eth.ethtype.hexbytes import EthAddress, EthHexBytes
+from chainpy.eth.ethtype.utils import keccak_hash
+from chainpy.eth.managers.asyncrpchandler import AsyncEthRpcClient
+from chainpy.eth.managers.exceptions import (
+    NonceTooLow, RpcEVMError, RpcOutOfStatusCode, RpcNodeBehind, EthAlreadyImported
+)
+
+from conftest import StandInError, StandInNode
+
+NO_RETRY = {"retry_max_attempts": 1}
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_send_request_after_connect(node):
+    node.chain_id = 49088
+    node.handlers["eth_getBalance"] = lambda params: hex(10 ** 18)
+
+    async def scenario():
+        async with AsyncEthRpcClient(node.url, "STANDIN", rpc_config=NO_RETRY) as client:
+            assert client.chain_id == 49088
+            assert await client.send_request("eth_blockNumber", []) == hex(1000)
+            assert await client.eth_get_latest_block_number(matured_only=True) == 1000 - client.block_aging_period
+            balance = await client.eth_get_balance(EthAddress("0x" + "11" * 20))
+            return balance.int()
+
+    assert run(scenario()) == 10 ** 18
+    assert node.calls == ["eth_chainId", "eth_blockNumber", "eth_blockNumber", "eth_getBalance"]
+
+
+def test_send_request_before_connect():
+    client = AsyncEthRpcClient("http://127.0.0.1:1/", "STANDIN")
+    with pytest.raises(Exception, match="Not connected"):
+        run(client.send_request("eth_blockNumber", []))
+
+
+def test_batch_request_split_and_ordered(node):
+    def balance_of(params):
+        if params[0] == "0x" + "00" * 20:
+            raise StandInError("header not found")
+        return hex(int(params[0], 16) % 1000)
+
+    node.handlers["eth_getBalance"] = balance_of
+    addresses = ["0x" + "{:02x}".format(idx) * 20 for idx in range(5)]
+
+    async def scenario():
+        async with AsyncEthRpcClient(node.url, "STANDIN", rpc_config={"max_batch_size": 2, "retry_max_attempts": 1}) as client:
+            node.posts.clear()
+            return await client.send_batch_request([("eth_getBalance", [address, "latest"]) for address in addresses])
+
+    results = run(scenario())
+    # 5 calls in batches of at most 2
+    assert node.posts == [2, 2, 1]
+    # a failed call fails its own slot only
+    assert isinstance(results[0], RpcNodeBehind)
+    assert results[1:] == [hex(int(address, 16) % 1000) for address in addresses[1:]]
+
+
+@pytest.mark.parametrize("message, error_type", [
+    ("nonce too low", NonceTooLow),
+    ("execution reverted: not allowed", RpcEVMError),
+    ("already known", EthAlreadyImported),
+])
+def test_error_mapping(node, message, error_type):
+    def reject(params):
+        raise StandInError(message)
+    node.handlers["eth_sendRawTransaction"] = reject
+
+    async def scenario():
+        async with AsyncEthRpcClient(node.url, "STANDIN", rpc_config=NO_RETRY) as client:
+            await client.send_request("eth_sendRawTransaction", ["0x00"])
+
+    with pytest.raises(error_type):
+        run(scenario())
+
+
+def test_unhandled_error_is_generic(node):
+    async def scenario():
+        async with AsyncEthRpcClient(node.url, "STANDIN", rpc_config=NO_RETRY) as client:
+            await client.send_request("eth_unknownMethod", [])
+
+    with pytest.raises(Exception, match="Not handled error on STANDIN: the method eth_unknownMethod does not exist"):
+        run(scenario())
+
+
+def test_status_error_after_retries(node):
+    async def scenario():
+        async with AsyncEthRpcClient(node.url, "STANDIN", rpc_config={"retry_max_attempts": 3, "chain_id": 1}) as client:
+            node.fail_status = 503
+            await client.send_request("eth_blockNumber", [])
+
+    with pytest.raises(RpcOutOfStatusCode) as error_info:
+        run(scenario())
+    assert error_info.value.status_code == 503
+    assert len(node.posts) == 3
+
+
+def test_failover_to_next_endpoint(node):
+    backup = StandInNode(head=1001).start()
+    try:
+        async def scenario():
+            async with AsyncEthRpcClient([node.url, backup.url], "STANDIN", rpc_config=NO_RETRY) as client:
+                node.fail_status = 500
+                return await client.eth_get_latest_block_number()
+
+        assert run(scenario()) == 1001
+    finally:
+        backup.stop()
+
+
+def test_send_raw_transaction_hash_is_local(node):
+    node.handlers["eth_sendRawTransaction"] = lambda params: "0x" + "ab" * 32
+    raw_tx = EthHexBytes("0x02f86c0180")
+
+    async def scenario():
+        async with AsyncEthRpcClient(node.url, "STANDIN", rpc_config=NO_RETRY) as client:
+            return await client.eth_send_raw_transaction(raw_tx)
+
+    assert run(scenario()) == keccak_hash(raw_tx)
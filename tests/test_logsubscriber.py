@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from chainpy.eth.managers.contracthandler import EthContractHandler
+from chainpy.eth.managers.logsubscriber import ChainLogSubscriber
+
+from conftest import PING_EMITTER, make_log, wait_until
+
+BLOCK_AGING_PERIOD = 2
+
+
+@pytest.fixture
+def handler(node, ping_abi_path) -> EthContractHandler:
+    return EthContractHandler(
+        node.url,
+        [{"name": "Ping", "address": PING_EMITTER, "abi_path": ping_abi_path}],
+        "STANDIN",
+        block_aging_period=BLOCK_AGING_PERIOD,
+        events=[{"event_name": "Ping", "contract_name": "Ping"}],
+        latest_height=node.head,
+        rpc_config={"retry_max_attempts": 1}
+    )
+
+
+@pytest.fixture
+def subscribed(node, handler):
+    """ a started subscriber and the heights of the events it has handed over """
+    heights = list()
+    subscriber = ChainLogSubscriber(
+        handler,
+        node.ws_url,
+        lambda events: heights.extend(event.log.block_number for event in events),
+        reconnect_delay_sec=0.1
+    )
+    subscriber.start()
+    wait_until(lambda: subscriber.connected)
+    yield subscriber, heights
+    subscriber.stop()
+
+
+def test_subscription_hands_over_matured_logs(node, handler, subscribed):
+    subscriber, heights = subscribed
+    assert node.subscribe_num == 2
+
+    node.push_log(make_log(1001))
+    node.push_log(make_log(1002))
+    node.push_head(1001)
+    node.push_head(1002)
+    wait_until(lambda: subscriber.buffered_log_num == 2)
+    assert heights == []
+
+    node.push_head(1003)
+    wait_until(lambda: heights == [1001])
+    node.push_head(1004)
+    wait_until(lambda: heights == [1001, 1002])
+    assert handler.latest_height == 1004 - BLOCK_AGING_PERIOD
+    # the pushed blocks are never range-polled
+    assert "eth_getLogs" not in node.calls
+
+
+def test_reconnect_range_polls_the_gap(node, handler, subscribed):
+    subscriber, heights = subscribed
+    node.logs.append(make_log(1001))
+    node.push_log(make_log(1001))
+    node.push_head(1001)
+    wait_until(lambda: subscriber.buffered_log_num == 1)
+
+    # the blocks produced while disconnected are not pushed
+    node.drop_connections()
+    wait_until(lambda: not subscriber.connected)
+    node.logs += [make_log(1002), make_log(1003)]
+    node.head = 1004
+    wait_until(lambda: node.subscribe_num == 4 and subscriber.connected)
+    wait_until(lambda: heights == [1001, 1002])
+
+    node.logs.append(make_log(1005))
+    node.push_log(make_log(1005))
+    node.push_head(1007)
+    wait_until(lambda: heights == [1001, 1002, 1003, 1005])
+    assert "eth_getLogs" in node.calls
+
+
+def test_removed_logs_are_dropped(node, handler, subscribed):
+    subscriber, heights = subscribed
+    node.push_log(make_log(1001))
+    node.push_log(make_log(1001, log_index=1))
+    node.push_head(1001)
+    # a reorg withdraws one log of the block
+    node.push_log(make_log(1001, removed=True))
+    node.push_log(make_log(1002))
+    wait_until(lambda: subscriber.buffered_log_num == 2)
+
+    node.push_head(1004)
+    wait_until(lambda: len(heights) == 2)
+    time.sleep(0.1)
+    assert heights == [1001, 1002]